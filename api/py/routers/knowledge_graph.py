@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import APIRouter, HTTPException
 
 from apps.py.documents.utils.progress_handler import DocumentProgressHandler, ProgressHandler
@@ -218,8 +220,9 @@ async def perform_llm_extraction(request: LlmExtractionRequest):
         doc_info = validate_single_document_for_llm_extraction(document_path)
         table_pages = doc_info["table_pages"]
 
-        # Use shared function with table pages (same as CLI)
-        llm_state_data = process_single_document_for_llm_extraction(document_path, table_pages)
+        # Use shared function with table pages (same as CLI), off the event loop so the
+        # server keeps serving other requests while Gemini calls are in flight
+        llm_state_data = await asyncio.to_thread(process_single_document_for_llm_extraction, document_path, table_pages)
 
         return LlmExtractionResponse(
             status="success",
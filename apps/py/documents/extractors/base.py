@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple, Union
 
 
 # If you have a project root utility, import it here. Otherwise, set a default.
@@ -25,3 +25,17 @@ class BaseExtractor:
         """Ensure output folder exists."""
         output_folder.mkdir(parents=True, exist_ok=True)
         return output_folder
+
+    def _resolve_output_folder(self, page_file: Union[Path, bytes], output_folder: Optional[Path]) -> Path:
+        """Output folder for an extraction, defaulting to the PDF's folder (required for in-memory PDFs)."""
+        if output_folder is None:
+            if isinstance(page_file, bytes):
+                raise ValueError("output_folder is required when the PDF is given as bytes")
+            output_folder = Path(page_file).parent
+        return self._ensure_output_folder(output_folder)
+
+    def _pdf_input(self, page_file: Union[Path, bytes], label_path: Path) -> Tuple[Union[str, bytes], str]:
+        """PDF argument and usage label for the Gemini helpers; in-memory PDFs are labelled with label_path."""
+        if isinstance(page_file, bytes):
+            return page_file, str(label_path)
+        return str(page_file), str(page_file)
@@ -0,0 +1,65 @@
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from apps.py.types import ExtractionResult, SinglePageTableResult
+from apps.py.utils.gemini_api import extract_text_and_tables_from_pdf_page
+
+from .table import BaseTableExtractor
+
+
+class CombinedExtractor(BaseTableExtractor):
+    """Extractor for text and tables of a PDF page with a single LLM call."""
+
+    def extract_text_and_tables(
+        self, page_file: Union[Path, bytes], page_num: int, output_folder: Optional[Path] = None, num_tables: int = 1
+    ) -> Tuple[ExtractionResult, SinglePageTableResult]:
+        """
+        Extract text and tables from a single-page PDF file, saving markdown and JSON.
+
+        Output files match TextExtractor and TableExtractor: page_{n}.md and page_{n}_tables.json.
+
+        Args:
+            page_file: Path to the single-page PDF file, or its bytes.
+            page_num: Page number (for naming output).
+            output_folder: Where to save the extracted files (required for bytes).
+            num_tables: Number of tables expected on this page (default: 1)
+
+        Returns:
+            Tuple of (text ExtractionResult, SinglePageTableResult)
+        """
+        output_folder = self._resolve_output_folder(page_file, output_folder)
+        pdf_input, source = self._pdf_input(page_file, output_folder / f"page_{page_num}.pdf")
+
+        result = extract_text_and_tables_from_pdf_page(pdf_input, num_tables, source=source)
+        if result["status"] != "success":
+            error = result.get("error", "Unknown error")
+            return (
+                ExtractionResult(status="error", error=error),
+                SinglePageTableResult(status="error", error=error, page_number=page_num),
+            )
+
+        text = result["content"]["text"]
+        tables = result["content"]["tables"]
+
+        output_md = output_folder / f"page_{page_num}.md"
+        with open(output_md, "w", encoding="utf-8") as f:
+            f.write(text)
+        text_result = ExtractionResult(status="success", output_file=self._get_relative_path(output_md))
+
+        if not tables:
+            return text_result, SinglePageTableResult(
+                status="error", error="No tables found in combined extraction response", page_number=page_num
+            )
+
+        # Same layout as TableExtractor: a list of rows for one table, {"tables": [...]} for several
+        content = tables[0] if num_tables == 1 and len(tables) == 1 else {"tables": tables}
+        relative_path = self._save_table_result(content, output_folder / f"page_{page_num}_tables.json")
+
+        table_result = SinglePageTableResult(
+            status="success",
+            output_file=relative_path,
+            tables_count=num_tables,
+            page_number=page_num,
+            table_dimensions=[{"num_rows": len(table) if isinstance(table, list) else 1} for table in tables],
+        )
+        return text_result, table_result
@@ -0,0 +1,255 @@
+import os
+import re
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from PyPDF2 import PageObject
+
+from .page_splitter import ParsedPDF
+
+
+class LatticePageFilterConfig:
+    """Configuration constants for the lattice table page prefilter."""
+
+    # Horizontal and vertical rulings a page needs before camelot's lattice flavor is worth running.
+    # Two of each is the smallest grid that can enclose a cell
+    MIN_RULINGS = int(os.getenv("LATTICE_FILTER_MIN_RULINGS", "2"))
+    # Segments shorter than this (in points) are glyph strokes or underline fragments, not table rulings
+    MIN_RULING_LENGTH = float(os.getenv("LATTICE_FILTER_MIN_RULING_LENGTH", "10"))
+    # How far (in points) a segment may slant and still count as horizontal or vertical
+    ORIENTATION_TOLERANCE = 1.0
+
+
+# Numbers are operands and words are operators. Names are matched so their letters aren't taken for
+# operators; strings, hex strings and comments are skipped whole, since their bytes can spell
+# anything. Arrays and dictionaries need no handling: their numbers are dropped at the next operator
+_TOKEN_PATTERN = re.compile(
+    rb"(?P<number>[-+]?(?:\d+\.?\d*|\.\d+))"
+    rb"|(?P<name>/[^\s/\[\]()<>{}%]*)"
+    rb"|(?P<operator>[A-Za-z'\"*]+)"
+    rb"|(?P<skip>[(<%])"
+)
+_STRING_DELIMITERS = re.compile(rb"[()\\]")
+_LINE_END = re.compile(rb"[\r\n]")
+
+_Matrix = Tuple[float, float, float, float, float, float]
+
+_IDENTITY: _Matrix = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+# Operators that close the current subpath with a straight line back to its start
+_CLOSING_OPERATORS = (b"h", b"s", b"b", b"b*")
+
+
+class LatticePageFilter:
+    """
+    Finds pages that can contain lattice (ruled) tables by reading their vector drawing operators.
+
+    Lattice detection looks for ruling lines, so a page with no horizontal and vertical strokes cannot
+    yield a lattice table. Counting line (``m``/``l``) and rectangle (``re``) operators in the content
+    stream is far cheaper than rendering the page the way camelot does.
+    """
+
+    def __init__(
+        self,
+        min_rulings: int = LatticePageFilterConfig.MIN_RULINGS,
+        min_ruling_length: float = LatticePageFilterConfig.MIN_RULING_LENGTH,
+    ):
+        """
+        Initialize the filter.
+
+        Args:
+            min_rulings: Horizontal and vertical rulings (each) a candidate page needs
+            min_ruling_length: Minimum length in points for a segment to count as a ruling
+        """
+        self.min_rulings = min_rulings
+        self.min_ruling_length = min_ruling_length
+
+    def candidate_pages(self, pdf: Union[str, Path, ParsedPDF]) -> List[int]:
+        """
+        Get the pages worth running lattice table detection on.
+
+        Args:
+            pdf: Path to the PDF, or an already parsed PDF
+
+        Returns:
+            Candidate page numbers (1-based), in order
+        """
+        parsed_pdf = pdf if isinstance(pdf, ParsedPDF) else ParsedPDF(pdf)
+        return [
+            page_number for page_number, page in enumerate(parsed_pdf.reader.pages, start=1) if self.is_candidate(page)
+        ]
+
+    def is_candidate(self, page: PageObject) -> bool:
+        """
+        Whether a page can contain a lattice table.
+
+        Pages drawing images (XObjects or inline) or form XObjects are always candidates: camelot
+        finds rulings in the rendered page, and a scanned table or a nested form hides its lines
+        from the content stream. A page that can't be read is a candidate too, so the filter never
+        drops a table.
+
+        Args:
+            page: The page to check
+
+        Returns:
+            True if camelot should look at the page
+        """
+        try:
+            if self._has_xobjects(page):
+                return True
+            contents = page.get_contents()
+            if contents is None:
+                return False
+            rulings = self._count_rulings(contents.get_data())
+            if rulings is None:
+                return True
+            horizontal, vertical = rulings
+            return horizontal >= self.min_rulings and vertical >= self.min_rulings
+        except Exception as e:
+            print(f"Warning: Could not scan page for table rulings, keeping it: {str(e)}")
+            return True
+
+    @staticmethod
+    def _has_xobjects(page: PageObject) -> bool:
+        resources = page.get("/Resources")
+        if resources is None:
+            return False
+        xobjects = resources.get_object().get("/XObject")
+        return bool(xobjects and len(xobjects.get_object()) > 0)
+
+    def _count_rulings(self, content: bytes) -> Optional[Tuple[int, int]]:
+        """
+        Count horizontal and vertical line segments drawn by a content stream.
+
+        Segments are measured on the page (in default user space, the space camelot renders), so
+        the current transformation matrix set by ``cm`` and saved and restored by ``q``/``Q`` is
+        applied to every point.
+
+        Returns:
+            (horizontal, vertical) ruling counts, or None if the stream draws an inline image
+        """
+        horizontal = vertical = 0
+        operands: List[float] = []
+        ctm = _IDENTITY
+        saved_ctms: List[_Matrix] = []
+        # Current point and start of the current subpath, both on the page
+        current = start = (0.0, 0.0)
+
+        position = 0
+        while True:
+            match = _TOKEN_PATTERN.search(content, position)
+            if match is None:
+                break
+            position = match.end()
+            kind = match.lastgroup
+            token = match.group()
+
+            if kind == "number":
+                operands.append(float(token))
+                continue
+            if kind == "name":
+                continue
+            if kind == "skip":
+                position = _skip(content, token, position)
+                continue
+
+            if token == b"m" and len(operands) >= 2:
+                current = start = _transform(ctm, operands[-2], operands[-1])
+            elif token == b"l" and len(operands) >= 2:
+                end = _transform(ctm, operands[-2], operands[-1])
+                h, v = self._classify(end[0] - current[0], end[1] - current[1])
+                horizontal += h
+                vertical += v
+                current = end
+            elif token in _CLOSING_OPERATORS:
+                h, v = self._classify(start[0] - current[0], start[1] - current[1])
+                horizontal += h
+                vertical += v
+                current = start
+            elif token == b"re" and len(operands) >= 4:
+                # A thin rectangle is a single ruling; a box has two edges in each direction
+                x, y, width, height = operands[-4:]
+                width_edge = self._classify(*_transform_vector(ctm, width, 0.0))
+                height_edge = self._classify(*_transform_vector(ctm, 0.0, height))
+                multiplier = 2 if any(width_edge) and any(height_edge) else 1
+                horizontal += (width_edge[0] + height_edge[0]) * multiplier
+                vertical += (width_edge[1] + height_edge[1]) * multiplier
+                current = start = _transform(ctm, x, y)
+            elif token in (b"c", b"v", b"y") and len(operands) >= 2:
+                current = _transform(ctm, operands[-2], operands[-1])
+            elif token == b"cm" and len(operands) >= 6:
+                ctm = _multiply(tuple(operands[-6:]), ctm)
+            elif token == b"q":
+                saved_ctms.append(ctm)
+            elif token == b"Q" and saved_ctms:
+                ctm = saved_ctms.pop()
+            elif token == b"BI":
+                # An inline image may be a scanned table
+                return None
+            operands.clear()
+
+        return horizontal, vertical
+
+    def _classify(self, dx: float, dy: float) -> Tuple[int, int]:
+        """(1, 0) for a horizontal ruling, (0, 1) for a vertical one, (0, 0) for anything else."""
+        tolerance = LatticePageFilterConfig.ORIENTATION_TOLERANCE
+        if abs(dy) <= tolerance and abs(dx) >= self.min_ruling_length:
+            return 1, 0
+        if abs(dx) <= tolerance and abs(dy) >= self.min_ruling_length:
+            return 0, 1
+        return 0, 0
+
+
+def _skip(content: bytes, opener: bytes, position: int) -> int:
+    """Position just past the string, hex string or comment that starts with opener."""
+    if opener == b"(":
+        # Literal strings nest balanced parentheses; a backslash escapes the next byte
+        depth = 1
+        while True:
+            match = _STRING_DELIMITERS.search(content, position)
+            if match is None:
+                return len(content)
+            position = match.end()
+            delimiter = match.group()
+            if delimiter == b"\\":
+                position += 1
+            elif delimiter == b"(":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return position
+    if opener == b"<":
+        if content[position : position + 1] == b"<":
+            # Dictionary start; its contents are ordinary tokens
+            return position + 1
+        end = content.find(b">", position)
+        return len(content) if end == -1 else end + 1
+    # Comment, up to the end of the line
+    match = _LINE_END.search(content, position)
+    return len(content) if match is None else match.end()
+
+
+def _multiply(first: _Matrix, second: _Matrix) -> _Matrix:
+    """Product of two PDF matrices [a b c d e f]; cm sets CTM = matrix x CTM."""
+    a1, b1, c1, d1, e1, f1 = first
+    a2, b2, c2, d2, e2, f2 = second
+    return (
+        a1 * a2 + b1 * c2,
+        a1 * b2 + b1 * d2,
+        c1 * a2 + d1 * c2,
+        c1 * b2 + d1 * d2,
+        e1 * a2 + f1 * c2 + e2,
+        e1 * b2 + f1 * d2 + f2,
+    )
+
+
+def _transform(ctm: _Matrix, x: float, y: float) -> Tuple[float, float]:
+    """Map a point through a matrix."""
+    a, b, c, d, e, f = ctm
+    return a * x + c * y + e, b * x + d * y + f
+
+
+def _transform_vector(ctm: _Matrix, dx: float, dy: float) -> Tuple[float, float]:
+    """Map a displacement through a matrix (no translation)."""
+    a, b, c, d, _, _ = ctm
+    return a * dx + c * dy, b * dx + d * dy
@@ -1,7 +1,8 @@
-import json
+import os
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from apps.py.types import (
     CombinedResults,
@@ -16,11 +17,13 @@ from apps.py.types import (
     TableResult,
 )
 from apps.py.types.models import GenericStateData
+from apps.py.utils import json_codec
 from apps.py.utils.project_root import get_loksabha_data_root
 
 from ..utils.progress_handler import DocumentProgressHandler
 from .base import BaseExtractor
-from .page_splitter import PDFPageSplitter
+from .combined import CombinedExtractor
+from .page_splitter import ParsedPDF, PDFPageSplitter
 from .result_combiner import ExtractionResultCombiner
 from .table import MultiPageTableHandler, TableExtractor
 from .table_range_detector import TableRangeDetector
@@ -37,8 +40,18 @@ class ExtractionConfig:
     # Default values
     DEFAULT_NUM_TABLES_PER_PAGE = 1
 
+    # Pages per batched table extraction request; 1 sends one request per page
+    TABLE_BATCH_SIZE = int(os.getenv("LLM_EXTRACTION_TABLE_BATCH_SIZE", "1"))
+
+    # Extract text and tables of single-table pages with one call per page
+    COMBINED_EXTRACTION = os.getenv("LLM_EXTRACTION_COMBINED", "").lower() in ("1", "true", "yes")
+
+    # Pages and ranges processed at once; 1 runs every step sequentially
+    MAX_WORKERS = int(os.getenv("LLM_EXTRACTION_MAX_WORKERS", "1"))
+
     # Error messages
     FAILED_PDF_CREATION_ERROR = "Failed to create temporary PDF for page {page_num}"
+    FAILED_BATCH_PDF_CREATION_ERROR = "Failed to create temporary PDF for pages {page_numbers}"
     UNEXPECTED_RESULT_TYPE_ERROR = "Unexpected result type from table extraction"
     PAGE_PROCESSING_ERROR = "Error processing page {page_num}: {error}"
     TEXT_EXTRACTION_ERROR = "Error extracting text from page {page_num}: {error}"
@@ -53,30 +66,43 @@ class ExtractionConfig:
     # Status messages
     PROCESSING_FAILURE_MESSAGE = "Some pages failed processing"
 
-    # File processing
-    TEMP_FILE_CLEANUP_ENABLED = True
-
 
 class PDFExtractionOrchestrator(BaseExtractor):
     """Orchestrates the extraction of text and tables from PDF pages."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        table_batch_size: int = ExtractionConfig.TABLE_BATCH_SIZE,
+        combined_extraction: bool = ExtractionConfig.COMBINED_EXTRACTION,
+        max_workers: int = ExtractionConfig.MAX_WORKERS,
+    ):
         """
         Initialize the PDF extraction orchestrator.
 
         Args:
-            data_root: Root directory for data storage. If None, uses get_loksabha_data_root()
+            table_batch_size: Number of single-table pages sent per table extraction request.
+                1 (the default unless LLM_EXTRACTION_TABLE_BATCH_SIZE is set) sends one request per page.
+            combined_extraction: Extract text and tables of single-page table pages with one call per page
+                (default unless LLM_EXTRACTION_COMBINED is set: separate calls). Takes precedence over batching.
+            max_workers: Number of pages and ranges processed at once. 1 (the default unless
+                LLM_EXTRACTION_MAX_WORKERS is set) runs table and text extraction one step at a time.
         """
         self.data_root: Path = get_loksabha_data_root()
         self.document_path: Optional[Path] = None
         self.progress_handler: Optional[DocumentProgressHandler] = None
         self.pdf_path: Optional[str] = None
+        self.parsed_pdf: Optional[ParsedPDF] = None
+        self.table_batch_size = max(table_batch_size, 1)
+        self.combined_extraction = combined_extraction
+        self.max_workers = max(max_workers, 1)
 
         # Initialize components
         self.text_extractor = TextExtractor(self.data_root)
         self.table_extractor = TableExtractor(self.data_root)
-        self.multi_page_handler = MultiPageTableHandler(self.data_root)
+        self.combined_extractor = CombinedExtractor(self.data_root)
+        # One splitter, so every step cuts pages from the same parsed PDF cache
         self.page_splitter = PDFPageSplitter()
+        self.multi_page_handler = MultiPageTableHandler(self.data_root, page_splitter=self.page_splitter)
         self.range_detector = TableRangeDetector()
         self.result_combiner = ExtractionResultCombiner()
 
@@ -114,13 +140,13 @@ class PDFExtractionOrchestrator(BaseExtractor):
         return combined_results
 
     def _extract_text_for_all_pages(
-        self, pdf_path: str, page_numbers: List[int], output_folder_path: Path
+        self, pdf: Union[str, ParsedPDF], page_numbers: List[int], output_folder_path: Path
     ) -> Dict[int, ExtractionResult]:
         """
         Extract text from all pages, including those with multi-page tables.
 
         Args:
-            pdf_path: Path to the input PDF file
+            pdf: Path to the input PDF file, or the parsed PDF
             page_numbers: List of page numbers to process
             output_folder_path: Path to save extracted content
 
@@ -130,9 +156,9 @@ class PDFExtractionOrchestrator(BaseExtractor):
         text_results: Dict[int, ExtractionResult] = {}
         for page_num in page_numbers:
             try:
-                # Create temporary PDF for this page
-                temp_pdf = self.page_splitter.split_pages(pdf_path, [page_num], output_folder_path)
-                if not temp_pdf:
+                # Cut this page out in memory
+                page_pdf = self.page_splitter.page_bytes(pdf, [page_num], output_folder_path)
+                if not page_pdf:
                     error_msg = ExtractionConfig.FAILED_PDF_CREATION_ERROR.format(page_num=page_num)
                     text_results[page_num] = ExtractionResult(
                         status="error",
@@ -141,7 +167,7 @@ class PDFExtractionOrchestrator(BaseExtractor):
                     continue
 
                 # Extract text
-                text_result = self.text_extractor.extract_text(temp_pdf, page_num, output_folder_path)
+                text_result = self.text_extractor.extract_text(page_pdf, page_num, output_folder_path)
                 text_results[page_num] = text_result
 
             except Exception as e:
@@ -150,10 +176,6 @@ class PDFExtractionOrchestrator(BaseExtractor):
                     status="error",
                     error=error_msg,
                 )
-            finally:
-                # Clean up temporary file
-                if ExtractionConfig.TEMP_FILE_CLEANUP_ENABLED and temp_pdf and Path(temp_pdf).exists():
-                    Path(temp_pdf).unlink()
 
         return text_results
 
@@ -210,13 +232,13 @@ class PDFExtractionOrchestrator(BaseExtractor):
         return self._ensure_output_folder(output_folder)
 
     def _process_single_page(
-        self, pdf_path: str, page_num: int, output_folder_path: Path, num_tables: int
+        self, pdf: Union[str, ParsedPDF], page_num: int, output_folder_path: Path, num_tables: int
     ) -> SinglePageTableResult:
         """
         Process a single page for table extraction.
 
         Args:
-            pdf_path: Path to the input PDF file
+            pdf: Path to the input PDF file, or the parsed PDF
             page_num: Page number to process
             output_folder_path: Path to save extracted content
             num_tables: Number of tables on the page
@@ -224,10 +246,9 @@ class PDFExtractionOrchestrator(BaseExtractor):
         Returns:
             SinglePageTableResult containing the table extraction results
         """
-        temp_pdf = None
         try:
-            temp_pdf = self.page_splitter.split_pages(pdf_path, [page_num], output_folder_path)
-            if not temp_pdf:
+            page_pdf = self.page_splitter.page_bytes(pdf, [page_num], output_folder_path)
+            if not page_pdf:
                 error_msg = ExtractionConfig.FAILED_PDF_CREATION_ERROR.format(page_num=page_num)
                 return SinglePageTableResult(
                     status="error",
@@ -236,7 +257,7 @@ class PDFExtractionOrchestrator(BaseExtractor):
                 )
 
             # Extract tables
-            table_result = self.table_extractor.extract_tables(temp_pdf, page_num, output_folder_path, num_tables)
+            table_result = self.table_extractor.extract_tables(page_pdf, page_num, output_folder_path, num_tables)
             if isinstance(table_result, SinglePageTableResult):
                 return table_result
 
@@ -254,10 +275,150 @@ class PDFExtractionOrchestrator(BaseExtractor):
                 error=error_msg,
                 page_number=page_num,
             )
-        finally:
-            # Clean up temporary file
-            if ExtractionConfig.TEMP_FILE_CLEANUP_ENABLED and temp_pdf and Path(temp_pdf).exists():
-                Path(temp_pdf).unlink()
+
+    def _process_single_page_combined(
+        self, pdf: Union[str, ParsedPDF], page_num: int, output_folder_path: Path, num_tables: int
+    ) -> tuple[ExtractionResult, SinglePageTableResult]:
+        """
+        Process a single page for text and table extraction with one request.
+
+        Args:
+            pdf: Path to the input PDF file, or the parsed PDF
+            page_num: Page number to process
+            output_folder_path: Path to save extracted content
+            num_tables: Number of tables on the page
+
+        Returns:
+            Tuple of (text ExtractionResult, SinglePageTableResult)
+        """
+        try:
+            page_pdf = self.page_splitter.page_bytes(pdf, [page_num], output_folder_path)
+            if not page_pdf:
+                error_msg = ExtractionConfig.FAILED_PDF_CREATION_ERROR.format(page_num=page_num)
+                return (
+                    ExtractionResult(status="error", error=error_msg),
+                    SinglePageTableResult(status="error", error=error_msg, page_number=page_num),
+                )
+
+            return self.combined_extractor.extract_text_and_tables(page_pdf, page_num, output_folder_path, num_tables)
+
+        except Exception as e:
+            error_msg = ExtractionConfig.PAGE_PROCESSING_ERROR.format(page_num=page_num, error=str(e))
+            return (
+                ExtractionResult(status="error", error=error_msg),
+                SinglePageTableResult(status="error", error=error_msg, page_number=page_num),
+            )
+
+    def _process_page_batch(
+        self,
+        pdf: Union[str, ParsedPDF],
+        page_numbers: List[int],
+        output_folder_path: Path,
+        tables_info: Dict[int, List[dict]],
+    ) -> Dict[int, SinglePageTableResult]:
+        """
+        Process several pages for table extraction with one request.
+
+        Args:
+            pdf: Path to the input PDF file, or the parsed PDF
+            page_numbers: Page numbers to process together
+            output_folder_path: Path to save extracted content
+            tables_info: Information about pages with multiple tables
+
+        Returns:
+            Dictionary mapping page numbers to their SinglePageTableResult
+        """
+        tables_per_page = {
+            page_num: (
+                len(tables_info[page_num]) if page_num in tables_info else ExtractionConfig.DEFAULT_NUM_TABLES_PER_PAGE
+            )
+            for page_num in page_numbers
+        }
+
+        try:
+            batch_pdf = self.page_splitter.page_bytes(pdf, page_numbers, output_folder_path)
+            if not batch_pdf:
+                error_msg = ExtractionConfig.FAILED_BATCH_PDF_CREATION_ERROR.format(page_numbers=page_numbers)
+                return {
+                    page_num: SinglePageTableResult(status="error", error=error_msg, page_number=page_num)
+                    for page_num in page_numbers
+                }
+
+            return self.table_extractor.extract_tables_batch(
+                batch_pdf, page_numbers, output_folder_path, tables_per_page
+            )
+
+        except Exception as e:
+            error_msg = ExtractionConfig.PAGE_PROCESSING_ERROR.format(page_num=page_numbers, error=str(e))
+            return {
+                page_num: SinglePageTableResult(status="error", error=error_msg, page_number=page_num)
+                for page_num in page_numbers
+            }
+
+    def _process_pending_pages(
+        self,
+        pending_pages: List[int],
+        output_folder_path: Path,
+        tables_info: Dict[int, List[dict]],
+        text_results: Optional[Dict[int, ExtractionResult]] = None,
+    ) -> Dict[int, TableResult]:
+        """
+        Extract single-page tables for the pending pages, batching requests when enabled.
+
+        With combined extraction, each page's text is extracted by the same request and stored
+        in text_results. Pages that fail inside a batch or a combined request are retried with
+        a plain single-page table request.
+
+        Args:
+            pending_pages: Page numbers that need single-page table extraction
+            output_folder_path: Path to save extracted content
+            tables_info: Information about pages with multiple tables
+            text_results: Collects text results from combined extraction
+
+        Returns:
+            Dictionary mapping page numbers to their SinglePageTableResult
+        """
+        single_page_results: Dict[int, TableResult] = {}
+
+        if self.combined_extraction and text_results is not None:
+            for page_num in pending_pages:
+                num_tables = (
+                    len(tables_info.get(page_num, []))
+                    if page_num in tables_info
+                    else ExtractionConfig.DEFAULT_NUM_TABLES_PER_PAGE
+                )
+                text_result, table_result = self._process_single_page_combined(
+                    self.parsed_pdf, page_num, output_folder_path, num_tables
+                )
+                single_page_results[page_num] = table_result
+                if text_result.status == "success":
+                    text_results[page_num] = text_result
+
+        elif self.table_batch_size > 1 and len(pending_pages) > 1:
+            ordered_pages = sorted(pending_pages)
+            for i in range(0, len(ordered_pages), self.table_batch_size):
+                batch = ordered_pages[i : i + self.table_batch_size]
+                if len(batch) > 1:
+                    single_page_results.update(
+                        self._process_page_batch(self.parsed_pdf, batch, output_folder_path, tables_info)
+                    )
+
+        for page_num in pending_pages:
+            existing = single_page_results.get(page_num)
+            if existing is not None and existing.status == "success":
+                continue
+
+            # If page has multiple tables, pass the count, otherwise use default
+            num_tables = (
+                len(tables_info.get(page_num, []))
+                if page_num in tables_info
+                else ExtractionConfig.DEFAULT_NUM_TABLES_PER_PAGE
+            )
+            single_page_results[page_num] = self._process_single_page(
+                self.parsed_pdf, page_num, output_folder_path, num_tables
+            )
+
+        return single_page_results
 
     def _get_local_extraction_reference(self) -> Optional[GenericStateData]:
         """Get existing local extraction data for reference (but don't copy incompatible types)."""
@@ -289,7 +450,7 @@ class PDFExtractionOrchestrator(BaseExtractor):
 
             with open(file_obj, "r") as f:
                 if read_as_json:
-                    content = json.load(f)
+                    content = json_codec.load(f)
                 else:
                     content = f.read()
 
@@ -544,7 +705,11 @@ class PDFExtractionOrchestrator(BaseExtractor):
         return self._setup_output_folder()
 
     def _process_table_extraction(
-        self, page_numbers: List[int], output_folder_path: Path, tables_info: Dict[int, List[dict]]
+        self,
+        page_numbers: List[int],
+        output_folder_path: Path,
+        tables_info: Dict[int, List[dict]],
+        text_results: Optional[Dict[int, ExtractionResult]] = None,
     ) -> tuple[Dict[PageIdentifier, TableResult], Dict[int, TableResult]]:
         """Process table extraction for both multi-page and single-page tables.
 
@@ -552,6 +717,7 @@ class PDFExtractionOrchestrator(BaseExtractor):
             page_numbers: List of page numbers to process
             output_folder_path: Path to save extracted content
             tables_info: Information about pages with multiple tables
+            text_results: Collects text results when combined extraction is enabled
 
         Returns:
             Tuple of (multi_page_results, single_page_results)
@@ -562,7 +728,7 @@ class PDFExtractionOrchestrator(BaseExtractor):
         # Process multi-page tables
         if continuous_ranges:
             multi_page_extraction_results = self.multi_page_handler.process_continuous_ranges(
-                self.pdf_path, continuous_ranges, output_folder_path
+                self.parsed_pdf, continuous_ranges, output_folder_path
             )
             multi_page_results = multi_page_extraction_results.table_results
             # Get pages that need single-page processing
@@ -576,20 +742,134 @@ class PDFExtractionOrchestrator(BaseExtractor):
         pending_pages.extend(self.range_detector.get_single_pages(page_numbers, continuous_ranges))
 
         # Process single pages
-        single_page_results: Dict[int, TableResult] = {}
-        for page_num in pending_pages:
-            # If page has multiple tables, pass the count, otherwise use default
-            num_tables = (
-                len(tables_info.get(page_num, []))
-                if page_num in tables_info
-                else ExtractionConfig.DEFAULT_NUM_TABLES_PER_PAGE
-            )
-            single_page_results[page_num] = self._process_single_page(
-                self.pdf_path, page_num, output_folder_path, num_tables
-            )
+        single_page_results = self._process_pending_pages(pending_pages, output_folder_path, tables_info, text_results)
 
         return multi_page_results, single_page_results
 
+    def _pending_page_chunks(self, pending_pages: List[int]) -> List[List[int]]:
+        """Split pending pages into independent jobs: one per page, or one per batch when batching."""
+        ordered_pages = sorted(pending_pages)
+        if self.combined_extraction or self.table_batch_size == 1:
+            return [[page_num] for page_num in ordered_pages]
+        return [
+            ordered_pages[i : i + self.table_batch_size] for i in range(0, len(ordered_pages), self.table_batch_size)
+        ]
+
+    def _process_pending_chunk(
+        self, pages: List[int], output_folder_path: Path, tables_info: Dict[int, List[dict]]
+    ) -> Tuple[Dict[int, TableResult], Dict[int, ExtractionResult]]:
+        """Worker job for a chunk of pending pages, returning table results and any combined text results."""
+        chunk_text_results: Dict[int, ExtractionResult] = {}
+        table_results = self._process_pending_pages(pages, output_folder_path, tables_info, chunk_text_results)
+        return table_results, chunk_text_results
+
+    def _submit_pending_jobs(
+        self,
+        executor: ThreadPoolExecutor,
+        jobs: Dict[Future, Tuple[str, Any]],
+        pending_pages: List[int],
+        output_folder_path: Path,
+        tables_info: Dict[int, List[dict]],
+    ) -> None:
+        for chunk in self._pending_page_chunks(pending_pages):
+            future = executor.submit(self._process_pending_chunk, chunk, output_folder_path, tables_info)
+            jobs[future] = ("pending", chunk)
+
+    def _submit_text_jobs(
+        self,
+        executor: ThreadPoolExecutor,
+        jobs: Dict[Future, Tuple[str, Any]],
+        page_numbers: List[int],
+        output_folder_path: Path,
+    ) -> None:
+        for page_num in page_numbers:
+            future = executor.submit(self._extract_text_for_all_pages, self.parsed_pdf, [page_num], output_folder_path)
+            jobs[future] = ("text", page_num)
+
+    def _process_extraction_concurrently(
+        self, page_numbers: List[int], output_folder_path: Path, tables_info: Dict[int, List[dict]]
+    ) -> tuple[Dict[PageIdentifier, TableResult], Dict[int, TableResult], Dict[int, ExtractionResult]]:
+        """Run table and text extraction for all pages with a bounded worker pool.
+
+        Every continuous range, pending page (or batch) and text page is its own job. Pages a range
+        leaves for single-page processing are queued as soon as that range finishes, so no step waits
+        for the whole previous step. Results are merged in the sequential order, so the combined
+        output does not depend on which job finished first.
+
+        Args:
+            page_numbers: List of page numbers to process
+            output_folder_path: Path to save extracted content
+            tables_info: Information about pages with multiple tables
+
+        Returns:
+            Tuple of (multi_page_results, single_page_results, text_results)
+        """
+        continuous_ranges = self.range_detector.detect_ranges(page_numbers)
+        single_pages = self.range_detector.get_single_pages(page_numbers, continuous_ranges)
+
+        range_results: Dict[int, Dict[PageIdentifier, TableResult]] = {}
+        single_page_results: Dict[int, TableResult] = {}
+        text_results: Dict[int, ExtractionResult] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pdf-extraction") as executor:
+            jobs: Dict[Future, Tuple[str, Any]] = {}
+
+            for index, page_range in enumerate(continuous_ranges):
+                future = executor.submit(
+                    self.multi_page_handler.process_continuous_ranges, self.parsed_pdf, [page_range], output_folder_path
+                )
+                jobs[future] = ("range", index)
+            self._submit_pending_jobs(executor, jobs, single_pages, output_folder_path, tables_info)
+
+            # With combined extraction, text is only requested for pages the combined calls don't cover
+            if not self.combined_extraction:
+                self._submit_text_jobs(executor, jobs, page_numbers, output_folder_path)
+
+            try:
+                while jobs:
+                    done, _ = wait(jobs, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        kind, job = jobs.pop(future)
+
+                        if kind == "range":
+                            extraction = future.result()
+                            range_results[job] = extraction.table_results
+                            pending_pages = sorted(extraction.pages_without_multi_page_tables)
+                            self._submit_pending_jobs(executor, jobs, pending_pages, output_folder_path, tables_info)
+                            if self.combined_extraction:
+                                start_page, end_page = continuous_ranges[job]
+                                table_pages = [
+                                    page_num
+                                    for page_num in range(start_page, end_page + 1)
+                                    if page_num not in extraction.pages_without_multi_page_tables
+                                ]
+                                self._submit_text_jobs(executor, jobs, table_pages, output_folder_path)
+
+                        elif kind == "pending":
+                            chunk_table_results, chunk_text_results = future.result()
+                            single_page_results.update(chunk_table_results)
+                            text_results.update(chunk_text_results)
+                            if self.combined_extraction:
+                                missing_text = [page_num for page_num in job if page_num not in chunk_text_results]
+                                self._submit_text_jobs(executor, jobs, missing_text, output_folder_path)
+
+                        else:
+                            text_results.update(future.result())
+            except BaseException:
+                for future in jobs:
+                    future.cancel()
+                raise
+
+        multi_page_results: Dict[PageIdentifier, TableResult] = {}
+        for index in range(len(continuous_ranges)):
+            multi_page_results.update(range_results[index])
+
+        return (
+            multi_page_results,
+            {page_num: single_page_results[page_num] for page_num in sorted(single_page_results)},
+            {page_num: text_results[page_num] for page_num in page_numbers if page_num in text_results},
+        )
+
     def _finalize_extraction(
         self,
         multi_page_results: Dict[PageIdentifier, TableResult],
@@ -621,6 +901,7 @@ class PDFExtractionOrchestrator(BaseExtractor):
         2. Load existing progress data
         3. Process table extraction (multi-page and single-page)
         4. Extract text content from all pages
+           (with max_workers > 1, steps 3 and 4 run together on a worker pool)
         5. Finalize by combining results and transitioning state
 
         Args:
@@ -633,8 +914,11 @@ class PDFExtractionOrchestrator(BaseExtractor):
         # Start timing the extraction process
         start_time = time.time()
 
-        # Store pdf_path for use in helper methods
+        # Store pdf_path and the document parsed once for use in helper methods.
+        # The parsed PDF cache lives for one run, so an edited file is always parsed again.
         self.pdf_path = pdf_path
+        self.page_splitter.cache.clear()
+        self.parsed_pdf = self.page_splitter.parse(pdf_path)
 
         # 1. Initialize extraction setup
         output_folder_path = self._initialize_extraction(pdf_path)
@@ -642,13 +926,28 @@ class PDFExtractionOrchestrator(BaseExtractor):
         # 2. Load existing progress data
         tables_info = self._get_pages_with_multiple_tables(self.document_path)
 
-        # 3. Process table extraction
-        multi_page_results, single_page_results = self._process_table_extraction(
-            page_numbers, output_folder_path, tables_info
-        )
+        if self.max_workers > 1:
+            # 3-4. Process table and text extraction for all pages and ranges at once
+            multi_page_results, single_page_results, text_results = self._process_extraction_concurrently(
+                page_numbers, output_folder_path, tables_info
+            )
+        else:
+            # 3. Process table extraction (combined extraction also fills in text for single-page table pages)
+            combined_text_results: Dict[int, ExtractionResult] = {}
+            multi_page_results, single_page_results = self._process_table_extraction(
+                page_numbers, output_folder_path, tables_info, combined_text_results
+            )
 
-        # 4. Extract text content
-        text_results = self._extract_text_for_all_pages(pdf_path, page_numbers, output_folder_path)
+            # 4. Extract text content for pages that don't have it yet
+            remaining_pages = [page_num for page_num in page_numbers if page_num not in combined_text_results]
+            separate_text_results = self._extract_text_for_all_pages(
+                self.parsed_pdf, remaining_pages, output_folder_path
+            )
+            text_results = {
+                page_num: combined_text_results.get(page_num) or separate_text_results[page_num]
+                for page_num in page_numbers
+                if page_num in combined_text_results or page_num in separate_text_results
+            }
 
         # Calculate total processing time
         processing_time_seconds = time.time() - start_time
@@ -656,4 +955,8 @@ class PDFExtractionOrchestrator(BaseExtractor):
         # 5. Finalize extraction with actual timing
         self._finalize_extraction(multi_page_results, single_page_results, text_results, processing_time_seconds)
 
+        # Release the parsed document
+        self.parsed_pdf = None
+        self.page_splitter.cache.clear()
+
         return str(self.document_path)
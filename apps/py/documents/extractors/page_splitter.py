@@ -1,12 +1,136 @@
+import os
+import threading
+from collections import OrderedDict
+from io import BytesIO
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple, Union
 
 from PyPDF2 import PdfReader, PdfWriter
 
 
+class PageSplitterConfig:
+    """Configuration constants for PDF page splitting."""
+
+    # Set PDF_SPLIT_DEBUG_COPIES=1 to also write in-memory splits to disk for inspection
+    SAVE_DEBUG_COPIES = os.getenv("PDF_SPLIT_DEBUG_COPIES", "").lower() in ("1", "true", "yes")
+
+    # Parsed documents kept in memory by each splitter's cache
+    PARSED_PDF_CACHE_SIZE = int(os.getenv("PDF_PARSED_CACHE_SIZE", "4"))
+
+
+class ParsedPDF:
+    """
+    A PDF read and parsed once, from which page and range PDFs are cut in memory.
+
+    PdfReader resolves objects lazily from its stream, so writes are serialised with a lock
+    to let extraction threads share one instance.
+    """
+
+    def __init__(self, pdf_path: Union[str, Path]):
+        """
+        Read and parse a PDF.
+
+        Args:
+            pdf_path: Path to the PDF file
+        """
+        self.path = Path(pdf_path)
+        with open(self.path, "rb") as f:
+            self.reader = PdfReader(BytesIO(f.read()))
+        self.num_pages = len(self.reader.pages)
+        self._lock = threading.Lock()
+
+    def write_pages(self, page_numbers: List[int]) -> bytes:
+        """
+        Build a PDF from the given pages, in order.
+
+        Args:
+            page_numbers: Page numbers to include (1-based, must be in range)
+
+        Returns:
+            The new PDF as bytes
+        """
+        with self._lock:
+            writer = PdfWriter()
+            for page_number in page_numbers:
+                writer.add_page(self.reader.pages[page_number - 1])
+            buffer = BytesIO()
+            writer.write(buffer)
+        return buffer.getvalue()
+
+
+class ParsedPDFCache:
+    """
+    LRU cache of parsed PDFs keyed by path and modification time.
+
+    A file that changes on disk gets a new key, so a stale parse is never served.
+    """
+
+    def __init__(self, max_entries: int = PageSplitterConfig.PARSED_PDF_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of parsed documents kept in memory
+        """
+        self.max_entries = max(max_entries, 1)
+        self._entries: "OrderedDict[Tuple[str, int, int], ParsedPDF]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, pdf_path: Union[str, Path]) -> ParsedPDF:
+        """
+        Get the parsed PDF for a path, parsing it on first use.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            The shared ParsedPDF for the file's current contents
+        """
+        path = Path(pdf_path).resolve()
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+
+        # Parsing under the lock makes concurrent callers wait for one parse instead of each doing their own
+        with self._lock:
+            parsed = self._entries.get(key)
+            if parsed is not None:
+                self._entries.move_to_end(key)
+                return parsed
+
+            # Drop parses of older versions of the same file
+            for stale_key in [cached for cached in self._entries if cached[0] == key[0]]:
+                del self._entries[stale_key]
+
+            parsed = ParsedPDF(path)
+            self._entries[key] = parsed
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return parsed
+
+    def clear(self) -> None:
+        """Release all parsed documents."""
+        with self._lock:
+            self._entries.clear()
+
+
 class PDFPageSplitter:
     """Handles splitting PDF files into individual pages."""
 
+    def __init__(
+        self,
+        save_debug_copies: bool = PageSplitterConfig.SAVE_DEBUG_COPIES,
+        cache: Optional[ParsedPDFCache] = None,
+    ):
+        """
+        Initialize the splitter.
+
+        Args:
+            save_debug_copies: Whether in-memory splits are also written to their debug folder
+            cache: Parsed document cache; share one splitter to share its cache
+        """
+        self.save_debug_copies = save_debug_copies
+        self.cache = cache or ParsedPDFCache()
+
     def split_pages(self, pdf_path: str, page_numbers: List[int], output_folder: Path) -> str:
         """
         Splits specific pages from a PDF and saves them individually.
@@ -23,9 +147,9 @@ class PDFPageSplitter:
         output_folder = Path(output_folder)
         output_folder.mkdir(parents=True, exist_ok=True)
 
-        # Open the PDF file
-        pdf = PdfReader(str(pdf_path))
-        total_pages = len(pdf.pages)
+        # Get the parsed PDF file
+        pdf = self.parse(pdf_path)
+        total_pages = pdf.num_pages
 
         print(f"Processing '{pdf_path.name}' ({total_pages} pages)...")
         print(f"Extracting pages: {', '.join(map(str, page_numbers))}")
@@ -35,17 +159,10 @@ class PDFPageSplitter:
 
         # Process only the specified pages
         for page_number in valid_page_numbers:
-            # Adjust for 0-based indexing
-            page_index = page_number - 1
-
-            # Create a writer for this page
-            writer = PdfWriter()
-            writer.add_page(pdf.pages[page_index])
-
             # Save the page to the output directory
             output_path = output_folder / f"page_{page_number}.pdf"
             with open(output_path, "wb") as output_file:
-                writer.write(output_file)
+                output_file.write(pdf.write_pages([page_number]))
 
             print(f"  ✓ Saved page {page_number} to {output_path.name}")
 
@@ -108,22 +225,158 @@ class PDFPageSplitter:
             # Create output filename
             output_file = output_folder / f"range_{start_page}_to_{end_page}.pdf"
 
-            # Use PyPDF2 to extract the range
-            with open(pdf_path, "rb") as file:
-                reader = PdfReader(file)
-                writer = PdfWriter()
+            # Cut the range from the parsed PDF, skipping pages past the end
+            pdf = self.parse(pdf_path)
+            data = pdf.write_pages(list(range(new_start_page, min(new_end_page, pdf.num_pages) + 1)))
+
+            # Write the output file
+            with open(output_file, "wb") as output:
+                output.write(data)
+
+            return str(output_file)
+
+        except Exception as e:
+            print(f"Error splitting range {start_page}-{end_page}: {str(e)}")
+            return None
+
+    def split_page_list(self, pdf_path: str, page_numbers: List[int], output_folder: Path) -> Optional[str]:
+        """
+        Combine specific pages of a PDF into a single PDF file, in the given order.
+
+        Args:
+            pdf_path: Path to the source PDF file
+            page_numbers: Page numbers to include (1-based)
+            output_folder: Where to save the output PDF
+
+        Returns:
+            Path to the created PDF file, or None if splitting failed
+        """
+        try:
+            output_folder = Path(output_folder)
+            output_folder.mkdir(parents=True, exist_ok=True)
+            output_file = output_folder / f"pages_{'_'.join(map(str, page_numbers))}.pdf"
 
-                # Add all pages in the range
-                for page_num in range(new_start_page - 1, new_end_page):  # Convert to 0-based index
-                    if page_num < len(reader.pages):
-                        writer.add_page(reader.pages[page_num])
+            pdf = self.parse(pdf_path)
+            valid_page_numbers = self._validate_page_numbers(page_numbers, pdf.num_pages)
+            if len(valid_page_numbers) != len(page_numbers):
+                return None
 
-                # Write the output file
-                with open(output_file, "wb") as output:
-                    writer.write(output)
+            with open(output_file, "wb") as output:
+                output.write(pdf.write_pages(valid_page_numbers))
 
             return str(output_file)
 
+        except Exception as e:
+            print(f"Error splitting pages {page_numbers}: {str(e)}")
+            return None
+
+    # ===============================
+    # IN-MEMORY SPLITTING
+    # ===============================
+
+    def parse(self, pdf_path: Union[str, Path, ParsedPDF]) -> ParsedPDF:
+        """
+        Get the parsed PDF for a path from the splitter's cache, parsing it on first use.
+
+        Args:
+            pdf_path: Path to the PDF file, or an already parsed PDF
+
+        Returns:
+            ParsedPDF for use with page_bytes, range_bytes and iter_page_bytes
+        """
+        if isinstance(pdf_path, ParsedPDF):
+            return pdf_path
+        return self.cache.get(pdf_path)
+
+    def page_bytes(
+        self, pdf: Union[str, Path, ParsedPDF], page_numbers: List[int], debug_folder: Optional[Path] = None
+    ) -> Optional[bytes]:
+        """
+        Combine specific pages of a PDF into a new PDF in memory, in the given order.
+
+        Args:
+            pdf: Path to the source PDF, or a ParsedPDF to avoid parsing it again
+            page_numbers: Page numbers to include (1-based)
+            debug_folder: Where to save a copy as page_<n>.pdf or pages_<a>_<b>.pdf when debug copies are on
+
+        Returns:
+            The PDF bytes, or None if any page is out of range or splitting failed
+        """
+        try:
+            parsed = self.parse(pdf)
+            if len(self._validate_page_numbers(page_numbers, parsed.num_pages)) != len(page_numbers):
+                return None
+
+            data = parsed.write_pages(page_numbers)
+            if len(page_numbers) == 1:
+                filename = f"page_{page_numbers[0]}.pdf"
+            else:
+                filename = f"pages_{'_'.join(map(str, page_numbers))}.pdf"
+            self._save_debug_copy(data, debug_folder, filename)
+            return data
+
+        except Exception as e:
+            print(f"Error splitting pages {page_numbers}: {str(e)}")
+            return None
+
+    def range_bytes(
+        self,
+        pdf: Union[str, Path, ParsedPDF],
+        start_page: int,
+        end_page: int,
+        debug_folder: Optional[Path] = None,
+    ) -> Optional[bytes]:
+        """
+        Cut a range of pages from a PDF into a new PDF in memory.
+
+        Pages past the end of the document are skipped, as in split_range.
+
+        Args:
+            pdf: Path to the source PDF, or a ParsedPDF to avoid parsing it again
+            start_page: Start page number (1-based)
+            end_page: End page number (1-based)
+            debug_folder: Where to save a copy as range_<start>_to_<end>.pdf when debug copies are on
+
+        Returns:
+            The PDF bytes, or None if splitting failed
+        """
+        try:
+            parsed = self.parse(pdf)
+            data = parsed.write_pages(list(range(start_page, min(end_page, parsed.num_pages) + 1)))
+            self._save_debug_copy(data, debug_folder, f"range_{start_page}_to_{end_page}.pdf")
+            return data
+
         except Exception as e:
             print(f"Error splitting range {start_page}-{end_page}: {str(e)}")
             return None
+
+    def iter_page_bytes(
+        self, pdf: Union[str, Path, ParsedPDF], page_numbers: List[int], debug_folder: Optional[Path] = None
+    ) -> Iterator[Tuple[int, bytes]]:
+        """
+        Yield single-page PDFs for the given pages, parsing the source only once.
+
+        Args:
+            pdf: Path to the source PDF, or a ParsedPDF
+            page_numbers: Page numbers to split (1-based); out-of-range pages are skipped
+            debug_folder: Where to save a copy of each page as page_<n>.pdf when debug copies are on
+
+        Yields:
+            Tuples of (page number, single-page PDF bytes)
+        """
+        parsed = self.parse(pdf)
+        for page_number in self._validate_page_numbers(page_numbers, parsed.num_pages):
+            data = self.page_bytes(parsed, [page_number], debug_folder)
+            if data is not None:
+                yield page_number, data
+
+    def _save_debug_copy(self, data: bytes, debug_folder: Optional[Path], filename: str) -> None:
+        if not self.save_debug_copies or debug_folder is None:
+            return
+        debug_folder = Path(debug_folder)
+        debug_folder.mkdir(parents=True, exist_ok=True)
+        # Concurrent jobs may write the same page, so replace the file atomically
+        temp_file = debug_folder / f".{filename}.{threading.get_ident()}.tmp"
+        with open(temp_file, "wb") as f:
+            f.write(data)
+        os.replace(temp_file, debug_folder / filename)
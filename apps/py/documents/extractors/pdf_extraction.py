@@ -1,7 +1,13 @@
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
 import shutil
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import camelot
 
@@ -9,21 +15,29 @@ from apps.py.types import (
     LocalExtractionData,
     LocalExtractionPageData,
     ProcessingMetadata,
+    ProcessingState,
     ProcessingStatus,
     TableMetadata,
 )
 
-from ...utils.pdf_extractors import get_pdf_extractor
+from ...utils.pdf_extractors import PDFExtractorConfig, get_marker_converter, get_pdf_extractor
 from ..utils.progress_handler import DocumentProgressHandler
+from .lattice_page_filter import LatticePageFilter, LatticePageFilterConfig
 
 """
 PDF Extraction Module
 
 Function Hierarchy:
 ------------------
+extract_contents_batch (spreads documents over a process pool)
+└── _extract_contents_in_worker → extract_contents
+
 extract_contents (main entry point)
+├── compute_extraction_fingerprint / _is_extraction_current (skip unchanged documents)
 ├── _extract_text_from_pdf
 ├── _extract_table_metadata_from_pdf
+│   ├── LatticePageFilter.candidate_pages
+│   └── _read_lattice_tables_parallel → _read_lattice_tables
 ├── _save_file_safely
 ├── _process_extracted_text
 ├── _build_local_extraction_data
@@ -31,24 +45,168 @@ extract_contents (main entry point)
 
 Usage Statistics:
 ----------------
-- extract_contents: Called from cli/py/extract_pdf/menu.py
+- extract_contents_batch: Called from cli/py/extract_pdf/menu.py
+- extract_contents: Called per document, in-process or in a pool worker
 - Transitions document to LOCAL_EXTRACTION state with typed data
 
 Each function's purpose and dependencies are documented in its docstring.
 """
 
 
+class PDFExtractionConfig:
+    """Configuration constants for local PDF extraction."""
+
+    # Worker processes for extract_contents_batch; 1 extracts in the calling process
+    MAX_WORKERS = int(os.getenv("PDF_EXTRACTION_MAX_WORKERS", "1"))
+    # Expected peak memory of one worker (Marker models plus one document). Workers are capped so
+    # that all of them fit in physical memory; 0 disables the cap
+    WORKER_MEMORY_MB = int(os.getenv("PDF_EXTRACTION_WORKER_MEMORY_MB", "4096"))
+    # Documents a worker handles before it is replaced, releasing memory camelot and Marker hold on to.
+    # 0 keeps workers for the whole batch
+    MAX_DOCUMENTS_PER_WORKER = int(os.getenv("PDF_EXTRACTION_MAX_DOCUMENTS_PER_WORKER", "50"))
+
+    # Processes running camelot over one document's candidate pages. Leave at 1 when documents
+    # already run on a pool (PDF_EXTRACTION_MAX_WORKERS > 1), which keeps the cores busy on its own
+    CAMELOT_MAX_WORKERS = int(os.getenv("PDF_EXTRACTION_CAMELOT_MAX_WORKERS", "1"))
+
+    # Part of every extraction fingerprint. Bump it when a change to this module alters the extracted
+    # text or table metadata, so documents extracted by the old code are extracted again
+    EXTRACTOR_VERSION = "1"
+    # Set PDF_EXTRACTION_FORCE=1 to re-extract documents whose fingerprint is unchanged
+    FORCE = os.getenv("PDF_EXTRACTION_FORCE", "").lower() in ("1", "true", "yes")
+    # Documents past LOCAL_EXTRACTION are never re-extracted, since rolling them back deletes their
+    # LLM extraction and manual review. Set PDF_EXTRACTION_DISCARD_LATER_WORK=1 to re-extract them anyway
+    DISCARD_LATER_WORK = os.getenv("PDF_EXTRACTION_DISCARD_LATER_WORK", "").lower() in ("1", "true", "yes")
+
+    HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def compute_extraction_fingerprint(pdf_path: Path, extractor_type: Optional[str] = None) -> str:
+    """
+    Fingerprint of a PDF's content and the settings that shape its LOCAL_EXTRACTION output.
+
+    Args:
+        pdf_path: Path to the PDF file
+        extractor_type: Extractor used for the text, defaults to PDF_EXTRACTOR_TYPE
+
+    Returns:
+        Hex SHA-256 digest; equal digests mean re-extracting would produce the same data
+    """
+    pdf_hash = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        while chunk := f.read(PDFExtractionConfig.HASH_CHUNK_BYTES):
+            pdf_hash.update(chunk)
+
+    extractor_type = extractor_type or PDFExtractorConfig.EXTRACTOR_TYPE
+    settings = {
+        "pdf_sha256": pdf_hash.hexdigest(),
+        "extractor_version": PDFExtractionConfig.EXTRACTOR_VERSION,
+        # The marker server runs the same converter as local Marker, so both give the same text
+        "extractor": extractor_type.removesuffix("_client"),
+        "markdown_config": PDFExtractorConfig.MARKDOWN_CONFIG,
+        "lattice_filter": [LatticePageFilterConfig.MIN_RULINGS, LatticePageFilterConfig.MIN_RULING_LENGTH],
+    }
+    # Stays on the stdlib json module rather than json_codec: these exact bytes are hashed into
+    # fingerprints already stored in progress files, so the encoding must not change with the backend
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _physical_memory_mb() -> Optional[int]:
+    """Physical memory of the machine in MB, or None where the platform doesn't report it."""
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _resolve_worker_count(max_workers: int, num_documents: int, worker_memory_mb: int) -> int:
+    """Number of pool workers: no more than requested, documents or what fits in memory."""
+    workers = max(1, min(max_workers, num_documents))
+    total_memory_mb = _physical_memory_mb()
+    if worker_memory_mb > 0 and total_memory_mb:
+        memory_bound = max(1, total_memory_mb // worker_memory_mb)
+        if memory_bound < workers:
+            print(
+                f"Limiting extraction to {memory_bound} workers: {workers} x {worker_memory_mb} MB "
+                f"exceeds {total_memory_mb} MB of memory"
+            )
+            workers = memory_bound
+    return workers
+
+
+def _read_lattice_tables(pdf_path: Path, pages: List[int]) -> List[Dict[str, Any]]:
+    """Run camelot's lattice flavor on the given pages; returns TableMetadata fields per table, in page order."""
+    tables = camelot.read_pdf(str(pdf_path), pages=",".join(str(page) for page in pages), flavor="lattice")
+    return [
+        {
+            "page": int(table.page),
+            "accuracy": table.accuracy,
+            "num_columns": len(table.df.columns),
+            "num_rows": len(table.df.index) - 1,  # Subtract header row
+        }
+        for table in tables
+    ]
+
+
+def _read_lattice_tables_parallel(
+    pdf_path: Path, pages: List[int], max_workers: int = PDFExtractionConfig.CAMELOT_MAX_WORKERS
+) -> List[Dict[str, Any]]:
+    """
+    Run camelot over pages split into contiguous chunks, one process per chunk.
+
+    camelot renders pages through libraries that aren't thread-safe, so chunks run in processes.
+    Results are concatenated in chunk order, keeping tables in page order.
+    """
+    workers = max(1, min(max_workers, len(pages)))
+    if workers == 1:
+        return _read_lattice_tables(pdf_path, pages)
+
+    chunk_size = -(-len(pages) // workers)
+    chunks = [pages[i : i + chunk_size] for i in range(0, len(pages), chunk_size)]
+    with ProcessPoolExecutor(max_workers=len(chunks), mp_context=multiprocessing.get_context("spawn")) as pool:
+        results = pool.map(_read_lattice_tables, [pdf_path] * len(chunks), chunks)
+        return [stats for chunk_stats in results for stats in chunk_stats]
+
+
+# States a document can be re-extracted from without losing anything but its previous extraction
+_REEXTRACTABLE_STATES = (ProcessingState.NOT_STARTED, ProcessingState.INITIALIZED, ProcessingState.LOCAL_EXTRACTION)
+
+
+class LaterWorkError(Exception):
+    """Raised when re-extracting a document would discard work done after its LOCAL_EXTRACTION."""
+
+
+def has_work_past_local_extraction(state: ProcessingState) -> bool:
+    """Whether a document in this state has work (LLM extraction, review, ...) that re-extraction would discard."""
+    return state not in _REEXTRACTABLE_STATES
+
+
+def _init_extraction_worker(extractor_type: Optional[str]) -> None:
+    """Warm a pool worker: load Marker's models once so every document it handles reuses them."""
+    if (extractor_type or PDFExtractorConfig.EXTRACTOR_TYPE) == "marker":
+        get_marker_converter()
+
+
+def _extract_contents_in_worker(
+    extractor_type: Optional[str], pdf_path: Path, force: bool, discard_later_work: bool
+) -> Dict[str, Any]:
+    """Extract one document in a pool worker; its progress file is written by the worker."""
+    extractor = QuestionPDFExtractor(extractor_type=extractor_type)
+    return asyncio.run(extractor.extract_contents(pdf_path, force=force, discard_later_work=discard_later_work))
+
+
 class QuestionPDFExtractor:
-    def __init__(self, extractor_type: str = "marker"):
+    def __init__(self, extractor_type: Optional[str] = None):
         """Initialize the PDF extractor.
 
         Args:
-            extractor_type: Type of extractor to use ('marker')
+            extractor_type: Type of extractor to use ('marker' or 'marker_client'), defaults to PDF_EXTRACTOR_TYPE
         """
         self.extractor_type = extractor_type
         self.pdf_path = None
         self.text_path = None
         self.progress_handler = None
+        self.source_fingerprint = None
 
     def _setup_paths(self, pdf_path: Path) -> None:
         """Setup paths for extraction outputs."""
@@ -140,43 +298,55 @@ class QuestionPDFExtractor:
             extracted_tables_path=None,  # We don't save table data
             table_metadata=[],  # Empty list for failed case
             error_message=str(error),
+            source_fingerprint=self.source_fingerprint,
         )
 
     async def _extract_text_from_pdf(self) -> str:
-        """Extract text from PDF using the specified extractor."""
+        """
+        Extract text from PDF using the specified extractor.
+
+        Raises:
+            RuntimeError: If the extractor fails, e.g. Marker errors or the marker server is not running
+        """
         try:
             extractor = get_pdf_extractor(self.extractor_type)
             return await extractor.extract_text(self.pdf_path)
         except Exception as e:
-            error_msg = f"Error extracting text from PDF: {str(e)}"
-            print(error_msg)
-            return f"[{error_msg}]"
+            raise RuntimeError(f"Error extracting text from PDF: {str(e)}") from e
+
+    async def _extract_table_metadata_from_pdf(self) -> Tuple[List[TableMetadata], Optional[str]]:
+        """
+        Extract table metadata from PDF without saving unreliable table data.
 
-    async def _extract_table_metadata_from_pdf(self) -> List[TableMetadata]:
-        """Extract table metadata from PDF without saving unreliable table data."""
+        Returns:
+            The table metadata, and the error message if table detection failed (with no tables)
+        """
         try:
-            tables = camelot.read_pdf(str(self.pdf_path), pages="all", flavor="lattice")
-            table_metadata = []
-
-            for i, table in enumerate(tables):
-                df = table.df
-                metadata = TableMetadata(
-                    table_number=i + 1,
-                    page=table.page,
-                    accuracy=table.accuracy,
-                    num_columns=len(df.columns),
-                    num_rows=len(df.index) - 1,  # Subtract header row
-                )
-                table_metadata.append(metadata)
-
-            return table_metadata
+            candidate_pages = LatticePageFilter().candidate_pages(self.pdf_path)
+            if not candidate_pages:
+                print("No pages with table rulings, skipping table detection")
+                return [], None
+            print(f"Detecting tables on {len(candidate_pages)} candidate pages: {candidate_pages}")
+
+            table_stats = await asyncio.to_thread(_read_lattice_tables_parallel, self.pdf_path, candidate_pages)
+            return [TableMetadata(table_number=i + 1, **stats) for i, stats in enumerate(table_stats)], None
 
         except Exception as e:
-            print(f"Warning: Failed to extract table metadata: {str(e)}")
-            return []
+            error_msg = f"Failed to extract table metadata: {str(e)}"
+            print(f"Warning: {error_msg}")
+            return [], error_msg
+
+    def _create_extraction_step(
+        self, table_metadata: List[TableMetadata], table_error: Optional[str] = None
+    ) -> LocalExtractionData:
+        """
+        Create extraction step data as LocalExtractionData object.
 
-    def _create_extraction_step(self, table_metadata: List[TableMetadata]) -> LocalExtractionData:
-        """Create extraction step data as LocalExtractionData object."""
+        Args:
+            table_metadata: Tables detected in the PDF
+            table_error: Why table detection failed, if it did. The step is then PARTIAL rather than
+                SUCCESS, so the document isn't treated as extracted and is retried on the next run
+        """
         # Process the extracted text file to get raw page data
         raw_pages_data = self._process_extracted_text()
 
@@ -209,39 +379,94 @@ class QuestionPDFExtractor:
 
         # Return typed LocalExtractionData object
         return LocalExtractionData(
-            status=ProcessingStatus.SUCCESS,
+            status=ProcessingStatus.PARTIAL if table_error else ProcessingStatus.SUCCESS,
             processing_metadata=processing_metadata,
             pages=typed_pages,
             extracted_text_path=str(self.text_path.name),
             extracted_tables_path=None,  # We don't save unreliable table data
             table_metadata=table_metadata,
-            error_message=None,
+            error_message=table_error,
+            source_fingerprint=self.source_fingerprint,
+        )
+
+    def _is_extraction_current(self) -> bool:
+        """Whether the document already has a successful LOCAL_EXTRACTION with the same fingerprint."""
+        local_extraction_data = self.progress_handler.get_local_extraction_data()
+        return (
+            local_extraction_data is not None
+            and local_extraction_data.status == ProcessingStatus.SUCCESS.value
+            and local_extraction_data.data.get("source_fingerprint") == self.source_fingerprint
         )
 
-    async def extract_contents(self, pdf_path: Path) -> Dict[str, Any]:
-        """Main method to extract PDF contents."""
+    def _prepare_for_reextraction(self, current_state: ProcessingState) -> None:
+        """Roll a document that is past INITIALIZED back to it, since LOCAL_EXTRACTION can only follow INITIALIZED."""
+        print(f"Rolling back from {current_state.value} to INITIALIZED to re-extract {self.pdf_path.name}")
+        self.progress_handler.rollback_to_state(ProcessingState.INITIALIZED)
+
+    async def extract_contents(
+        self, pdf_path: Path, force: bool = False, discard_later_work: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Main method to extract PDF contents.
+
+        Extraction is skipped when the document's last successful LOCAL_EXTRACTION was made from the
+        same PDF content and settings (see compute_extraction_fingerprint). A document that was
+        already extracted is rolled back only once the new extraction has succeeded, so a failed
+        re-extraction leaves its previous one in place. A failed table detection still records the
+        extracted text, as PARTIAL, which is retried on the next run like a FAILED extraction.
+
+        Args:
+            pdf_path: Path to the PDF file
+            force: Re-extract even if the fingerprint is unchanged
+            discard_later_work: Re-extract documents past LOCAL_EXTRACTION, deleting their later states
+
+        Returns:
+            The document's progress data
+
+        Raises:
+            LaterWorkError: If the document is past LOCAL_EXTRACTION and discard_later_work is not set
+        """
         self._setup_paths(pdf_path)
         self._validate_pdf_file()
 
+        self.source_fingerprint = compute_extraction_fingerprint(pdf_path, self.extractor_type)
+        if not force and self._is_extraction_current():
+            print(f"Skipping {pdf_path.name}: unchanged since its last extraction")
+            return self.progress_handler.read_progress_file().model_dump()
+
+        current_state = self.progress_handler.get_current_state()
+        if has_work_past_local_extraction(current_state) and not discard_later_work:
+            raise LaterWorkError(
+                f"{pdf_path.name} is in {current_state.value}; re-extracting it would discard that work. "
+                "Set PDF_EXTRACTION_DISCARD_LATER_WORK=1 to re-extract it anyway"
+            )
+        replaces_extraction = current_state not in (ProcessingState.NOT_STARTED, ProcessingState.INITIALIZED)
+
         try:
             # Extract and save text
             extracted_text = await self._extract_text_from_pdf()
             await self._save_file_safely(extracted_text, self.text_path)
 
             # Extract table metadata only (don't save unreliable table data)
-            table_metadata = await self._extract_table_metadata_from_pdf()
+            table_metadata, table_error = await self._extract_table_metadata_from_pdf()
 
             # Create LocalExtractionData and transition to LOCAL_EXTRACTION state
-            local_extraction_data = self._create_extraction_step(table_metadata)
+            local_extraction_data = self._create_extraction_step(table_metadata, table_error)
+            if replaces_extraction:
+                self._prepare_for_reextraction(current_state)
             self.progress_handler.transition_to_local_extraction(local_extraction_data)
 
             # Return the updated progress data for CLI compatibility
             return self.progress_handler.read_progress_file().model_dump()
 
         except Exception as e:
-            # Create LocalExtractionData for failure case and transition state
             print(f"Critical error during extraction: {str(e)}")
+            if replaces_extraction:
+                # Recording the failure would need a rollback, which would delete the previous extraction
+                print(f"Keeping the previous extraction of {pdf_path.name}")
+                raise
 
+            # Create LocalExtractionData for failure case and transition state
             try:
                 # Try to create failure data even if extraction failed
                 failure_data = self._create_failure_extraction_data(e)
@@ -251,3 +476,67 @@ class QuestionPDFExtractor:
                 print(f"Warning: Failed to update progress file: {progress_error}")
 
             raise
+
+    def extract_contents_batch(
+        self,
+        pdf_paths: List[Path],
+        max_workers: Optional[int] = None,
+        worker_memory_mb: Optional[int] = None,
+        force: bool = False,
+        discard_later_work: bool = False,
+    ) -> Iterator[Tuple[Path, Optional[Dict[str, Any]], Optional[Exception]]]:
+        """
+        Extract several PDFs, spreading them across a pool of worker processes.
+
+        Each worker keeps a warm Marker converter and runs extract_contents for one document at a
+        time, so every document still gets its own LOCAL_EXTRACTION transition as soon as it is done.
+
+        Args:
+            pdf_paths: PDFs to extract
+            max_workers: Worker processes, defaults to PDF_EXTRACTION_MAX_WORKERS. 1 extracts in this process
+            worker_memory_mb: Expected peak memory per worker, defaults to PDF_EXTRACTION_WORKER_MEMORY_MB
+            force: Re-extract documents whose fingerprint is unchanged
+            discard_later_work: Re-extract documents past LOCAL_EXTRACTION, deleting their later states
+
+        Yields:
+            (pdf_path, progress data, None) for each extracted document, or (pdf_path, None, error) for a
+            failed one, in completion order
+        """
+        max_workers = max_workers or PDFExtractionConfig.MAX_WORKERS
+        if worker_memory_mb is None:
+            worker_memory_mb = PDFExtractionConfig.WORKER_MEMORY_MB
+        workers = _resolve_worker_count(max_workers, len(pdf_paths), worker_memory_mb)
+
+        if workers <= 1:
+            for pdf_path in pdf_paths:
+                try:
+                    progress = asyncio.run(
+                        self.extract_contents(pdf_path, force=force, discard_later_work=discard_later_work)
+                    )
+                    yield pdf_path, progress, None
+                except Exception as e:
+                    yield pdf_path, None, e
+            return
+
+        print(f"Extracting {len(pdf_paths)} documents with {workers} worker processes")
+        max_tasks = PDFExtractionConfig.MAX_DOCUMENTS_PER_WORKER or None
+        # Spawned workers don't inherit the parent's torch/camelot state, which isn't fork-safe
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_extraction_worker,
+            initargs=(self.extractor_type,),
+            max_tasks_per_child=max_tasks,
+        ) as pool:
+            futures = {
+                pool.submit(
+                    _extract_contents_in_worker, self.extractor_type, pdf_path, force, discard_later_work
+                ): pdf_path
+                for pdf_path in pdf_paths
+            }
+            for future in as_completed(futures):
+                pdf_path = futures[future]
+                try:
+                    yield pdf_path, future.result(), None
+                except Exception as e:
+                    yield pdf_path, None, e
@@ -1,5 +1,3 @@
-import json
-import os
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
@@ -13,15 +11,17 @@ from apps.py.types import (
     TableDetectionResult,
     TableSummary,
 )
+from apps.py.utils import json_codec
 from apps.py.utils.gemini_api import (
     detect_multi_page_tables,
     extract_multi_page_table,
     extract_multiple_tables_from_pdf_page,
     extract_tables_from_pdf_page,
+    extract_tables_from_pdf_pages,
 )
 
 from .base import BaseExtractor
-from .page_splitter import PDFPageSplitter
+from .page_splitter import ParsedPDF, PDFPageSplitter
 
 
 class BaseTableExtractor(BaseExtractor):
@@ -39,7 +39,7 @@ class BaseTableExtractor(BaseExtractor):
             Relative path to the saved file
         """
         with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(content, f, indent=2)
+            json_codec.dump(content, f, pretty=True)
         try:
             rel_path = output_file.relative_to(self.data_root)
             return str(rel_path)
@@ -63,28 +63,28 @@ class TableExtractor(BaseTableExtractor):
     """Extractor for tables from PDF pages."""
 
     def extract_tables(
-        self, page_file: Path, page_num: int, output_folder: Optional[Path] = None, num_tables: int = 1
+        self, page_file: Union[Path, bytes], page_num: int, output_folder: Optional[Path] = None, num_tables: int = 1
     ) -> ExtractionResult:
         """
         Extract tables from a single-page PDF file and save as JSON.
         Args:
-            page_file: Path to the single-page PDF file.
+            page_file: Path to the single-page PDF file, or its bytes.
             page_num: Page number (for naming output).
-            output_folder: Where to save the extracted tables file.
+            output_folder: Where to save the extracted tables file (required for bytes).
             num_tables: Number of tables expected on this page (default: 1)
         Returns:
             ExtractionResult with status and output details
         """
-        output_folder = output_folder or page_file.parent
-        self._ensure_output_folder(output_folder)
+        output_folder = self._resolve_output_folder(page_file, output_folder)
+        pdf_input, source = self._pdf_input(page_file, output_folder / f"page_{page_num}.pdf")
 
         # Choose extraction strategy based on number of tables
         if num_tables > 1:
             # Use multi-table extraction for pages with multiple tables
-            table_result = extract_multiple_tables_from_pdf_page(str(page_file), num_tables)
+            table_result = extract_multiple_tables_from_pdf_page(pdf_input, num_tables, source=source)
         else:
             # Use single table extraction for pages with one table
-            table_result = extract_tables_from_pdf_page(str(page_file))
+            table_result = extract_tables_from_pdf_page(pdf_input, source=source)
 
         if table_result["status"] == "success":
             output_json = output_folder / f"page_{page_num}_tables.json"
@@ -119,6 +119,65 @@ class TableExtractor(BaseTableExtractor):
                 page_number=page_num,
             )
 
+    def extract_tables_batch(
+        self,
+        batch_file: Union[Path, bytes],
+        page_numbers: List[int],
+        output_folder: Path,
+        tables_per_page: Dict[int, int],
+    ) -> Dict[int, SinglePageTableResult]:
+        """
+        Extract tables from several pages with one request and save one JSON file per page.
+
+        Files use the same layout as extract_tables: a list of rows for pages with one table,
+        or {"tables": [...]} for pages with several.
+
+        Args:
+            batch_file: Path to a PDF containing exactly the given pages, in order, or its bytes
+            page_numbers: Original page numbers of the pages in batch_file
+            output_folder: Where to save the extracted tables files
+            tables_per_page: Expected number of tables for each page
+
+        Returns:
+            Dictionary mapping page numbers to their SinglePageTableResult
+        """
+        self._ensure_output_folder(output_folder)
+        label_path = output_folder / f"pages_{'_'.join(map(str, page_numbers))}.pdf"
+        pdf_input, source = self._pdf_input(batch_file, label_path)
+        batch_result = extract_tables_from_pdf_pages(pdf_input, page_numbers, tables_per_page, source=source)
+
+        if batch_result["status"] != "success":
+            error = batch_result.get("error", "Unknown error")
+            return {
+                page_num: SinglePageTableResult(status="error", error=error, page_number=page_num)
+                for page_num in page_numbers
+            }
+
+        results: Dict[int, SinglePageTableResult] = {}
+        for page_num in page_numbers:
+            tables = batch_result["content"].get(page_num)
+            if not tables:
+                results[page_num] = SinglePageTableResult(
+                    status="error",
+                    error="Page missing from batched table extraction response",
+                    page_number=page_num,
+                )
+                continue
+
+            num_tables = tables_per_page.get(page_num, 1)
+            content = tables[0] if num_tables == 1 and len(tables) == 1 else {"tables": tables}
+            relative_path = self._save_table_result(content, output_folder / f"page_{page_num}_tables.json")
+
+            results[page_num] = SinglePageTableResult(
+                status="success",
+                output_file=relative_path,
+                tables_count=num_tables,
+                page_number=page_num,
+                table_dimensions=[{"num_rows": len(table) if isinstance(table, list) else 1} for table in tables],
+            )
+
+        return results
+
 
 class MultiPageTableHandler(BaseTableExtractor):
     """Handler for extracting tables that span across multiple pages.
@@ -141,16 +200,17 @@ class MultiPageTableHandler(BaseTableExtractor):
        - Add processing time tracking
     """
 
-    def __init__(self, data_root: Optional[Path] = None):
+    def __init__(self, data_root: Optional[Path] = None, page_splitter: Optional[PDFPageSplitter] = None):
         """
         Initialize the multi-page table handler.
 
         Args:
             data_root: Root directory for data storage. If None, uses get_loksabha_data_root()
+            page_splitter: Splitter to share, along with its parsed PDF cache. If None, uses its own
         """
         super().__init__(data_root)
         self.table_extractor = TableExtractor(data_root)
-        self.page_splitter = PDFPageSplitter()
+        self.page_splitter = page_splitter or PDFPageSplitter()
 
     def _adjust_page_numbers(self, pages: List[int], start_page: int) -> List[int]:
         """
@@ -166,13 +226,18 @@ class MultiPageTableHandler(BaseTableExtractor):
         return [page + (start_page - 1) for page in pages]
 
     def process_continuous_ranges(
-        self, pdf_path: str, continuous_ranges: List[Tuple[int, int]], output_folder: Optional[Path] = None
+        self,
+        pdf_path: Union[str, ParsedPDF],
+        continuous_ranges: List[Tuple[int, int]],
+        output_folder: Optional[Path] = None,
     ) -> MultiPageTableExtractionResults:
         """
         Process all continuous ranges for multi-page tables.
 
+        Range PDFs are cut in memory from a single parse of the document.
+
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or the already parsed PDF
             continuous_ranges: List of continuous page ranges as (start, end) tuples
             output_folder: Where to save the extracted table files
 
@@ -189,38 +254,35 @@ class MultiPageTableHandler(BaseTableExtractor):
         multi_page_tables = 0
         single_page_tables = 0
 
+        parsed_pdf = self.page_splitter.parse(pdf_path)
+
         for start_page, end_page in continuous_ranges:
             print(f"\nProcessing potential multi-page table on pages {start_page}-{end_page}")
 
             # Create a single PDF containing just this range
-            range_pdf = self.page_splitter.split_range(pdf_path, start_page, end_page, output_folder)
+            range_pdf = self.page_splitter.range_bytes(parsed_pdf, start_page, end_page, output_folder)
             if not range_pdf:
                 error_msg = f"Failed to create temporary PDF for range {start_page}-{end_page}"
                 print(f"Error: {error_msg}")
                 raise RuntimeError(error_msg)
 
-            try:
-                # Process the entire range as one unit
-                range_results = self._process_single_range(range_pdf, start_page, end_page, output_folder)
-                results.update(range_results)
-
-                # Update summary statistics
-                for result in range_results.values():
-                    if isinstance(result, (SinglePageTableResult, MultiPageTableResult)):
-                        if result.tables_count:
-                            total_tables += result.tables_count
-                        if result.status == "success":
-                            successful_tables += result.tables_count or 0
-                        else:
-                            failed_tables += result.tables_count or 0
-                        if isinstance(result, MultiPageTableResult):
-                            multi_page_tables += result.tables_count or 0
-                        elif isinstance(result, SinglePageTableResult):
-                            single_page_tables += result.tables_count or 0
-            finally:
-                # Clean up temporary file
-                if range_pdf and Path(range_pdf).exists():
-                    Path(range_pdf).unlink()
+            # Process the entire range as one unit
+            range_results = self._process_single_range(parsed_pdf, range_pdf, start_page, end_page, output_folder)
+            results.update(range_results)
+
+            # Update summary statistics
+            for result in range_results.values():
+                if isinstance(result, (SinglePageTableResult, MultiPageTableResult)):
+                    if result.tables_count:
+                        total_tables += result.tables_count
+                    if result.status == "success":
+                        successful_tables += result.tables_count or 0
+                    else:
+                        failed_tables += result.tables_count or 0
+                    if isinstance(result, MultiPageTableResult):
+                        multi_page_tables += result.tables_count or 0
+                    elif isinstance(result, SinglePageTableResult):
+                        single_page_tables += result.tables_count or 0
 
         # Create TableSummary for MultiPageTableExtractionResults
         table_summary = TableSummary(
@@ -236,13 +298,19 @@ class MultiPageTableHandler(BaseTableExtractor):
         )
 
     def _process_single_range(
-        self, pdf_path: str, start_page: int, end_page: int, output_folder: Optional[Path]
+        self,
+        parsed_pdf: ParsedPDF,
+        range_pdf: bytes,
+        start_page: int,
+        end_page: int,
+        output_folder: Optional[Path],
     ) -> Dict[Union[int, Tuple[int, int]], Union[SinglePageTableResult, MultiPageTableResult]]:
         """
         Process a single continuous range of pages.
 
         Args:
-            pdf_path: Path to the PDF file containing the range
+            parsed_pdf: The parsed source document
+            range_pdf: PDF bytes containing just the range
             start_page: Start page number
             end_page: End page number
             output_folder: Where to save the extracted table files
@@ -253,7 +321,7 @@ class MultiPageTableHandler(BaseTableExtractor):
         # First detect if this range contains any multi-page tables
         table_detection = self.with_page_range_adjustment(
             detect_multi_page_tables,
-            {"pdf_path": pdf_path},
+            {"pdf_path": range_pdf, "source": self._range_label(output_folder, start_page, end_page)},
             start_page,
             end_page,
             "multi_page_tables[*].pages",  # Direct path to pages in MultiPageTableInfo
@@ -275,18 +343,18 @@ class MultiPageTableHandler(BaseTableExtractor):
                 if not table_pages:  # Skip if no pages in this table
                     continue
 
-                # split the pdf again for the detected multi-page table page range
-                range_pdf = self.page_splitter.split_range(
-                    pdf_path, min(table_pages), max(table_pages), output_folder, range_base=start_page
+                # cut the detected multi-page table page range from the parsed document
+                table_pdf = self.page_splitter.range_bytes(
+                    parsed_pdf, min(table_pages), max(table_pages), output_folder
                 )
-                if not range_pdf:
+                if not table_pdf:
                     error_msg = f"Failed to create temporary PDF for range {min(table_pages)}-{max(table_pages)}"
                     print(f"Error: {error_msg}")
                     raise RuntimeError(error_msg)
 
                 # Extract and save this multi-page table
                 table_result = self._extract_and_save_multi_page_table(
-                    range_pdf,
+                    table_pdf,
                     output_folder,
                     table_info,
                 )
@@ -306,6 +374,12 @@ class MultiPageTableHandler(BaseTableExtractor):
 
         return results
 
+    def _range_label(self, output_folder: Optional[Path], start_page: int, end_page: int) -> Optional[str]:
+        """Usage label for an in-memory range PDF, named like the file split_range would have written."""
+        if output_folder is None:
+            return None
+        return str(output_folder / f"range_{start_page}_to_{end_page}.pdf")
+
     def _mark_range_for_single_page(
         self, start_page: int, end_page: int, detection_result: TableDetectionResult
     ) -> Dict[Union[int, Tuple[int, int]], Union[SinglePageTableResult, MultiPageTableResult]]:
@@ -331,7 +405,7 @@ class MultiPageTableHandler(BaseTableExtractor):
 
     def _extract_and_save_multi_page_table(
         self,
-        pdf_path: str,
+        pdf_data: bytes,
         output_folder: Optional[Path],
         table_info: MultiPageTableInfo,
     ) -> Dict[Union[int, Tuple[int, int]], Union[SinglePageTableResult, MultiPageTableResult]]:
@@ -339,7 +413,7 @@ class MultiPageTableHandler(BaseTableExtractor):
         Extract and save a multi-page table from a range of pages.
 
         Args:
-            pdf_path: Path to the PDF file
+            pdf_data: PDF bytes containing just the table's pages
             output_folder: Where to save the extracted table files
             table_info: Information about the multi-page table
 
@@ -352,85 +426,82 @@ class MultiPageTableHandler(BaseTableExtractor):
         page_range = (start_page, end_page)
         output_filename = f"multi_page_table_{start_page}_{end_page}.json"
 
-        try:
-            # For the range PDF, pages are numbered 1 to (end_page - start_page + 1)
-            # So we need to adjust the page numbers in the extraction result
-            extraction_result = extract_multi_page_table(pdf_path)
-
-            if extraction_result["status"] == "success":
-                # Create output file
-                output_file = output_folder / output_filename
-                relative_path = self._save_table_result(extraction_result["content"], output_file)
-
-                # Get table dimensions from content
-                content = extraction_result["content"]
-                try:
-                    # Handle both single table and multiple tables cases
-                    if isinstance(content, list):
-                        # Content is a list of dictionaries (rows)
-                        table_dimensions = [{"num_rows": len(content)}]
-                        tables_count = 1
-                    elif "tables" in content:
-                        # Multiple tables case
-                        tables = content.get("tables", [])
-                        table_dimensions = [{"num_rows": len(table)} for table in tables]
-                        tables_count = len(tables)
-                    else:
-                        # Single table case
-                        table_dimensions = [{"num_rows": 1}]  # Single row
-                        tables_count = 1
-                except Exception as e:
-                    print(f"Warning: Could not get table dimensions: {e}")
-                    table_dimensions = [{"num_rows": 0}]
-                    tables_count = 1
-
-                # Store successful extraction result
-                multi_page_result = MultiPageTableResult(
-                    status="success",
-                    is_multi_page_table=True,
-                    confidence=table_info.confidence,
-                    detection_reasoning=table_info.reasoning,
-                    output_file=relative_path,
-                    tables_count=tables_count,
-                    pages=table_info.pages,  # Will be adjusted later
-                    page_range=page_range,
-                    table_dimensions=table_dimensions,
-                )
-                return {page_range: multi_page_result}
-
-            # If extraction failed, raise an error
-            error_msg = f"Failed to extract multi-page table from pages {start_page}-{end_page}: {extraction_result.get('error', 'Unknown error')}"
-            print(f"Error: {error_msg}")
+        # For the range PDF, pages are numbered 1 to (end_page - start_page + 1)
+        # So we need to adjust the page numbers in the extraction result
+        extraction_result = extract_multi_page_table(
+            pdf_data, source=self._range_label(output_folder, start_page, end_page)
+        )
 
-            # Create output file with error info
+        if extraction_result["status"] == "success":
+            # Create output file
             output_file = output_folder / output_filename
-            error_content = {
-                "status": "error",
-                "error": error_msg,
-                "raw_response": extraction_result.get("raw_response", ""),
-            }
-            relative_path = self._save_table_result(error_content, output_file)
+            relative_path = self._save_table_result(extraction_result["content"], output_file)
 
-            # Return error result
-            return {
-                page_range: MultiPageTableResult(
-                    status="error",
-                    error=error_msg,
-                    raw_response=extraction_result.get("raw_response", ""),
-                    is_multi_page_table=True,
-                    confidence=table_info.confidence,
-                    detection_reasoning=table_info.reasoning,
-                    output_file=relative_path,
-                    tables_count=0,
-                    pages=table_info.pages,  # Will be adjusted later
-                    page_range=page_range,
-                    table_dimensions=[],
-                )
-            }
-        finally:
-            # Clean up the temporary range PDF
-            if os.path.exists(pdf_path):
-                os.remove(pdf_path)
+            # Get table dimensions from content
+            content = extraction_result["content"]
+            try:
+                # Handle both single table and multiple tables cases
+                if isinstance(content, list):
+                    # Content is a list of dictionaries (rows)
+                    table_dimensions = [{"num_rows": len(content)}]
+                    tables_count = 1
+                elif "tables" in content:
+                    # Multiple tables case
+                    tables = content.get("tables", [])
+                    table_dimensions = [{"num_rows": len(table)} for table in tables]
+                    tables_count = len(tables)
+                else:
+                    # Single table case
+                    table_dimensions = [{"num_rows": 1}]  # Single row
+                    tables_count = 1
+            except Exception as e:
+                print(f"Warning: Could not get table dimensions: {e}")
+                table_dimensions = [{"num_rows": 0}]
+                tables_count = 1
+
+            # Store successful extraction result
+            multi_page_result = MultiPageTableResult(
+                status="success",
+                is_multi_page_table=True,
+                confidence=table_info.confidence,
+                detection_reasoning=table_info.reasoning,
+                output_file=relative_path,
+                tables_count=tables_count,
+                pages=table_info.pages,  # Will be adjusted later
+                page_range=page_range,
+                table_dimensions=table_dimensions,
+            )
+            return {page_range: multi_page_result}
+
+        # If extraction failed, raise an error
+        error_msg = f"Failed to extract multi-page table from pages {start_page}-{end_page}: {extraction_result.get('error', 'Unknown error')}"
+        print(f"Error: {error_msg}")
+
+        # Create output file with error info
+        output_file = output_folder / output_filename
+        error_content = {
+            "status": "error",
+            "error": error_msg,
+            "raw_response": extraction_result.get("raw_response", ""),
+        }
+        relative_path = self._save_table_result(error_content, output_file)
+
+        # Return error result
+        return {
+            page_range: MultiPageTableResult(
+                status="error",
+                error=error_msg,
+                raw_response=extraction_result.get("raw_response", ""),
+                is_multi_page_table=True,
+                confidence=table_info.confidence,
+                detection_reasoning=table_info.reasoning,
+                output_file=relative_path,
+                tables_count=0,
+                pages=table_info.pages,  # Will be adjusted later
+                page_range=page_range,
+                table_dimensions=[],
+            )
+        }
 
     def _adjust_pages_in_result(self, result: Any, jsonpath: str, start_page: int, end_page: int) -> Any:
         """
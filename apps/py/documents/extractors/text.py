@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from apps.py.utils.gemini_api import extract_text_from_pdf_page
 
@@ -9,19 +9,19 @@ from .base import BaseExtractor
 class TextExtractor(BaseExtractor):
     """Extractor for text from PDF pages."""
 
-    def extract_text(self, page_file: Path, page_num: int, output_folder: Optional[Path] = None) -> dict:
+    def extract_text(self, page_file: Union[Path, bytes], page_num: int, output_folder: Optional[Path] = None) -> dict:
         """
         Extract text from a single-page PDF file and save as markdown.
         Args:
-            page_file: Path to the single-page PDF file.
+            page_file: Path to the single-page PDF file, or its bytes.
             page_num: Page number (for naming output).
-            output_folder: Where to save the extracted text file.
+            output_folder: Where to save the extracted text file (required for bytes).
         Returns:
             dict: { 'status': 'success'|'error', 'output_file': str, 'error': str|None }
         """
-        output_folder = output_folder or page_file.parent
-        self._ensure_output_folder(output_folder)
-        text_result = extract_text_from_pdf_page(str(page_file))
+        output_folder = self._resolve_output_folder(page_file, output_folder)
+        pdf_input, source = self._pdf_input(page_file, output_folder / f"page_{page_num}.pdf")
+        text_result = extract_text_from_pdf_page(pdf_input, source=source)
         if text_result["status"] == "success":
             output_md = output_folder / f"page_{page_num}.md"
             with open(output_md, "w", encoding="utf-8") as f:
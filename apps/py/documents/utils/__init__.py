@@ -10,9 +10,18 @@ from .document_progress_analysis import (
     is_document_processed_successfully,
 )
 from .progress_handler import DocumentProgressHandler
+from .progress_index import SessionProgressIndex, iter_document_index_entries, scan_ministry
+from .progress_summary import DocumentProgressSummary, summarize_progress
+from .progress_view import ProgressView
 
 __all__ = [
     "DocumentProgressHandler",
+    "SessionProgressIndex",
+    "ProgressView",
+    "DocumentProgressSummary",
+    "summarize_progress",
+    "iter_document_index_entries",
+    "scan_ministry",
     "get_document_table_info",
     "is_document_processed_successfully",
     "analyze_documents_status",
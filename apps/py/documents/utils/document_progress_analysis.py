@@ -7,11 +7,13 @@ All functions are pure and reusable across different contexts.
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from apps.py.types import STATE_ORDER, ProcessingState, ProcessingStatus
 
 from .progress_handler import DocumentProgressHandler
+from .progress_index import SessionProgressIndex, iter_document_index_entries
+from .progress_summary import summarize_progress
 
 
 # Lazy import to avoid circular import issues
@@ -47,60 +49,21 @@ def get_document_table_info(progress_handler: DocumentProgressHandler) -> Dict[s
     result = {"has_tables": False, "table_count": "-", "table_info_available": False}
 
     try:
-        # Check if LOCAL_EXTRACTION state exists and was successful
-        local_extraction_data = progress_handler.get_state_data(ProcessingState.LOCAL_EXTRACTION)
-        if not local_extraction_data:
-            return result
-
-        # Check LOCAL_EXTRACTION status
-        local_extraction_status = None
-        if hasattr(local_extraction_data, "status"):
-            local_extraction_status = (
-                local_extraction_data.status.value
-                if hasattr(local_extraction_data.status, "value")
-                else str(local_extraction_data.status)
-            )
-        elif isinstance(local_extraction_data, dict) and "status" in local_extraction_data:
-            local_extraction_status = local_extraction_data["status"]
-
-        # Only trust table info if LOCAL_EXTRACTION was successful
-        if local_extraction_status != "SUCCESS":
-            return result
-
-        # Extract table information
-        result["table_info_available"] = True
-
-        # Extract the actual data from the nested structure
-        extraction_data = None
-        if hasattr(local_extraction_data, "data"):
-            # Typed object with data attribute
-            extraction_data = local_extraction_data.data
-        elif isinstance(local_extraction_data, dict) and "data" in local_extraction_data:
-            # Dictionary format with nested "data" key
-            extraction_data = local_extraction_data["data"]
-        elif isinstance(local_extraction_data, dict):
-            # Dictionary format where the dict itself is the data
-            extraction_data = local_extraction_data
-        else:
-            return result
-
-        # Now extract table information from the actual data
-        if isinstance(extraction_data, dict):
-            result["has_tables"] = extraction_data.get("has_tables", False)
-            result["table_count"] = str(extraction_data.get("total_tables", 0)) if result["has_tables"] else "0"
-        elif hasattr(extraction_data, "has_tables"):
-            result["has_tables"] = extraction_data.has_tables
-            if hasattr(extraction_data, "total_tables"):
-                result["table_count"] = str(extraction_data.total_tables) if extraction_data.has_tables else "0"
-            else:
-                result["table_count"] = "0"
-
-        return result
-
+        summary = summarize_progress(progress_handler.read_progress_view().raw)
     except Exception:
         # Return default values on any error
         return result
 
+    # Only trust table info if LOCAL_EXTRACTION was successful
+    if not summary.table_info_available:
+        return result
+
+    return {
+        "has_tables": summary.has_tables,
+        "table_count": str(summary.total_tables) if summary.has_tables else "0",
+        "table_info_available": True,
+    }
+
 
 def is_document_processed_successfully(
     progress_handler: DocumentProgressHandler, min_state: ProcessingState = ProcessingState.LOCAL_EXTRACTION
@@ -189,102 +152,77 @@ def get_state_data(progress_handler: DocumentProgressHandler, current_state: Pro
         return None
 
 
-def analyze_documents_status(document_paths: List[Path]) -> Dict:
-    """Analyze status of all documents and return counters.
+_STATUS_VALUES = {status.value for status in ProcessingStatus}
 
-    Args:
-        document_paths: List of Path objects representing document directories
 
-    Returns:
-        dict: Nested dictionary with structure {state: {status: count}}
-    """
-    # Initialize counters for all states
+def _new_status_counters() -> Dict:
+    """Zeroed {state: {status: count}} counters, including the UNPROCESSED pseudo-state."""
     status_counters = {}
-    for state in ProcessingState:
+    for state in list(ProcessingState) + ["UNPROCESSED"]:
         status_counters[state] = {
             ProcessingStatus.SUCCESS: 0,
             ProcessingStatus.FAILED: 0,
             ProcessingStatus.PARTIAL: 0,
         }
+    return status_counters
 
-    # Add UNPROCESSED as a special case
-    status_counters["UNPROCESSED"] = {
-        ProcessingStatus.SUCCESS: 0,
-        ProcessingStatus.FAILED: 0,
-        ProcessingStatus.PARTIAL: 0,
-    }
 
-    processed_count = 0
+def _count_documents_status(named_entries: Iterable[Tuple[str, Optional[Dict]]]) -> Dict:
+    """Count session progress index entries by current state and status.
+
+    Args:
+        named_entries: (document name, index entry) pairs; the entry is None for documents that are not indexed
+
+    Returns:
+        dict: Nested dictionary with structure {state: {status: count}}
+    """
+    status_counters = _new_status_counters()
     error_count = 0
 
-    for doc_path in document_paths:
-        try:
-            processed_count += 1
+    for name, entry in named_entries:
+        if entry is not None and entry["index_error"]:
+            error_count += 1
+            print(f"  Warning: Error processing {name}: {entry['index_error']}")
+            status_counters["UNPROCESSED"][ProcessingStatus.FAILED] += 1
+            continue
 
-            # Check if progress file exists
-            progress_file = doc_path / "question.progress.json"
-            if not progress_file.exists():
-                # Document has never been processed
-                status_counters["UNPROCESSED"][ProcessingStatus.SUCCESS] += 1
-                continue
+        # Never processed, not started, or no valid status - treat as unprocessed
+        current_state = entry["current_state"] if entry is not None else None
+        status = entry["status"] if entry is not None else None
+        if current_state in (None, ProcessingState.NOT_STARTED.value) or status not in _STATUS_VALUES:
+            status_counters["UNPROCESSED"][ProcessingStatus.SUCCESS] += 1
+            continue
 
-            # Create progress handler and get current state
-            progress_handler = DocumentProgressHandler(doc_path)
-            current_state = progress_handler.get_current_state()
+        status_counters[ProcessingState(current_state)][ProcessingStatus(status)] += 1
 
-            if current_state is None:
-                # Progress file exists but no valid state - treat as unprocessed
-                status_counters["UNPROCESSED"][ProcessingStatus.SUCCESS] += 1
-                continue
+    if error_count > 0:
+        print(f"  Warning: {error_count} documents had processing errors")
 
-            # Get state-specific data to extract status
-            state_data = get_state_data(progress_handler, current_state)
+    return status_counters
 
-            if state_data is None:
-                # Could not get state data - treat as unprocessed
-                status_counters["UNPROCESSED"][ProcessingStatus.SUCCESS] += 1
-                continue
 
-            # Extract status from state data - handle both typed objects and dictionaries
-            if hasattr(state_data, "status"):
-                # Typed object with status attribute
-                status_value = state_data.status
-                if isinstance(status_value, ProcessingStatus):
-                    status = status_value
-                else:
-                    # Status is a string, convert to enum
-                    try:
-                        status = ProcessingStatus(str(status_value))
-                    except ValueError:
-                        # Invalid status value - treat as unprocessed
-                        status_counters["UNPROCESSED"][ProcessingStatus.SUCCESS] += 1
-                        continue
-            elif isinstance(state_data, dict) and "status" in state_data:
-                # Dictionary with status key - convert to ProcessingStatus enum
-                status_str = state_data["status"]
-                try:
-                    status = ProcessingStatus(status_str)
-                except ValueError:
-                    # Invalid status value - treat as unprocessed
-                    status_counters["UNPROCESSED"][ProcessingStatus.SUCCESS] += 1
-                    continue
-            else:
-                # No status information available - treat as unprocessed
-                status_counters["UNPROCESSED"][ProcessingStatus.SUCCESS] += 1
-                continue
+def _ministry_document_entries(ministry: Path) -> Iterator[Dict]:
+    """Stream session progress index entries of a ministry's documents (directories holding a PDF)."""
+    for entry in SessionProgressIndex.for_ministry(ministry).iter_ministry_documents(ministry):
+        if entry["pdf_name"]:
+            yield entry
 
-            status_counters[current_state][status] += 1
 
-        except Exception as e:
-            error_count += 1
-            # Log error but continue processing
-            print(f"  Warning: Error processing {doc_path.name}: {str(e)}")
-            status_counters["UNPROCESSED"][ProcessingStatus.FAILED] += 1
+def analyze_documents_status(document_paths: Iterable[Path]) -> Dict:
+    """Analyze status of all documents and return counters.
 
-    if error_count > 0:
-        print(f"  Warning: {error_count} documents had processing errors")
+    Statuses come from the session progress index, so only documents whose progress
+    changed since the last report are read from disk.
 
-    return status_counters
+    Args:
+        document_paths: Document directories; any iterable, including the iter_document_paths stream
+
+    Returns:
+        dict: Nested dictionary with structure {state: {status: count}}
+    """
+    return _count_documents_status(
+        (doc_path.name, entry) for doc_path, entry in iter_document_index_entries(document_paths)
+    )
 
 
 def analyze_ministry_breakdown(ministries: List[Path]) -> Dict:
@@ -296,37 +234,12 @@ def analyze_ministry_breakdown(ministries: List[Path]) -> Dict:
     Returns:
         dict: Nested dictionary with structure {ministry_name: {state: {status: count}}}
     """
-    find_document_paths = _get_find_document_paths()
     ministry_status_data = {}
 
     for ministry in ministries:
-        ministry_name = ministry.name
-        ministry_status_data[ministry_name] = {}
-
-        # Initialize counters for all states
-        for state in ProcessingState:
-            ministry_status_data[ministry_name][state] = {
-                ProcessingStatus.SUCCESS: 0,
-                ProcessingStatus.FAILED: 0,
-                ProcessingStatus.PARTIAL: 0,
-            }
-
-        # Add UNPROCESSED as a special case
-        ministry_status_data[ministry_name]["UNPROCESSED"] = {
-            ProcessingStatus.SUCCESS: 0,
-            ProcessingStatus.FAILED: 0,
-            ProcessingStatus.PARTIAL: 0,
-        }
-
-        # Find documents for this ministry
-        ministry_docs = find_document_paths(ministry)
-
-        # Analyze each document in this ministry
-        ministry_counters = analyze_documents_status(ministry_docs)
-
-        # Copy the results to our ministry-specific structure
-        for state_key, status_counts in ministry_counters.items():
-            ministry_status_data[ministry_name][state_key] = status_counts.copy()
+        ministry_status_data[ministry.name] = _count_documents_status(
+            (entry["path"].name, entry) for entry in _ministry_document_entries(ministry)
+        )
 
     return ministry_status_data
 
@@ -340,100 +253,47 @@ def analyze_document_details(ministry: Path) -> List[Dict]:
     Returns:
         list: List of dictionaries with detailed document information
     """
-    find_document_paths = _get_find_document_paths()
     document_details = []
 
-    # Find all documents in this ministry
-    ministry_docs = find_document_paths(ministry)
-
-    for doc_path in ministry_docs:
-        try:
-            # Get basic document info
-            pdf_files = list(doc_path.glob("*.pdf"))
-            pdf_name = pdf_files[0].name if pdf_files else "Unknown PDF"
-
-            # Initialize document info
-            doc_info = {
-                "name": pdf_name,
-                "path": doc_path,
-                "state": "UNPROCESSED",
-                "status": "-",
-                "tables": "-",
-                "last_updated": "-",
-                "error_details": "-",
-                "has_tables": False,
-                "question_number": "-",
-            }
-
-            # Check if progress file exists
-            progress_file = doc_path / "question.progress.json"
-            if not progress_file.exists():
-                # Document has never been processed
-                document_details.append(doc_info)
-                continue
-
-            # Get last modified time of progress file
-            doc_info["last_updated"] = progress_file.stat().st_mtime
+    for entry in _ministry_document_entries(ministry):
+        if entry["index_error"]:
+            # Handle individual document errors gracefully
+            document_details.append(
+                {
+                    "name": entry["pdf_name"],
+                    "path": entry["path"],
+                    "state": "ERROR",
+                    "status": "FAILED",
+                    "tables": "-",
+                    "last_updated": "-",
+                    "error_details": f"Analysis error: {entry['index_error']}",
+                    "has_tables": False,
+                    "question_number": "-",
+                }
+            )
+            continue
+
+        doc_info = {
+            "name": entry["pdf_name"],
+            "path": entry["path"],
+            "state": entry["current_state"] or "UNPROCESSED",
+            "status": entry["status"] or "-",
+            "tables": "-",
+            "last_updated": entry["last_updated"] or "-",
+            "error_details": "-",
+            "has_tables": entry["has_tables"],
+            "question_number": entry["question_number"] or "-",
+        }
 
-            # Create progress handler and get current state
-            progress_handler = DocumentProgressHandler(doc_path)
-            current_state = progress_handler.get_current_state()
+        # Table information is only reliable after a successful LOCAL_EXTRACTION
+        if entry["table_info_available"]:
+            doc_info["tables"] = str(entry["total_tables"]) if entry["has_tables"] else "0"
 
-            if current_state is None:
-                # Progress file exists but no valid state
-                document_details.append(doc_info)
-                continue
+        # Extract error details for failed documents
+        if doc_info["status"] in ["FAILED", "PARTIAL"] and entry["error_message"]:
+            doc_info["error_details"] = entry["error_message"]
 
-            # Update state information
-            doc_info["state"] = current_state.value if hasattr(current_state, "value") else str(current_state)
-
-            # Get state-specific data
-            state_data = get_state_data(progress_handler, current_state)
-
-            if state_data is not None:
-                # Extract status
-                if hasattr(state_data, "status"):
-                    doc_info["status"] = (
-                        state_data.status.value if hasattr(state_data.status, "value") else str(state_data.status)
-                    )
-                elif isinstance(state_data, dict) and "status" in state_data:
-                    doc_info["status"] = state_data["status"]
-
-                # Extract error details for failed documents
-                if doc_info["status"] in ["FAILED", "PARTIAL"]:
-                    if hasattr(state_data, "error_message") and state_data.error_message:
-                        doc_info["error_details"] = state_data.error_message
-                    elif isinstance(state_data, dict) and "error_message" in state_data and state_data["error_message"]:
-                        doc_info["error_details"] = state_data["error_message"]
-
-                # Extract table information using the utility function
-                table_info = get_document_table_info(progress_handler)
-                doc_info["has_tables"] = table_info["has_tables"]
-                doc_info["tables"] = table_info["table_count"]
-
-                # Extract question number for INITIALIZED state
-                if current_state == ProcessingState.INITIALIZED:
-                    if hasattr(state_data, "question_number"):
-                        doc_info["question_number"] = str(state_data.question_number)
-                    elif isinstance(state_data, dict) and "question_number" in state_data:
-                        doc_info["question_number"] = str(state_data["question_number"])
-
-            document_details.append(doc_info)
-
-        except Exception as e:
-            # Handle individual document errors gracefully
-            error_doc_info = {
-                "name": pdf_name if "pdf_name" in locals() else doc_path.name,
-                "path": doc_path,
-                "state": "ERROR",
-                "status": "FAILED",
-                "tables": "-",
-                "last_updated": "-",
-                "error_details": f"Analysis error: {str(e)}",
-                "has_tables": False,
-                "question_number": "-",
-            }
-            document_details.append(error_doc_info)
+        document_details.append(doc_info)
 
     return document_details
 
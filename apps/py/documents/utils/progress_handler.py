@@ -1,3 +1,4 @@
+import functools
 import logging
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
@@ -18,24 +19,44 @@ from apps.py.types import (
 )
 
 from ...utils.state_manager import ProgressStateManager
-from ...utils.timestamps import get_current_timestamp, get_current_timestamp_iso
+from ...utils.timestamps import get_current_timestamp
+from .progress_view import ProgressView
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
 
+def _holding_progress_lock(method):
+    """Run a handler method with the progress file locked, so its state checks and writes happen as one step."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._state_manager.locked():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class DocumentProgressHandler:
     """
     Document-focused progress handler that uses ProgressStateManager
     and provides document-specific typed operations.
     """
 
-    def __init__(self, document_path: Path):
-        """Initialize the document progress handler."""
+    def __init__(self, document_path: Path, storage: Optional[str] = None):
+        """
+        Initialize the document progress handler.
+
+        Args:
+            document_path: Document directory holding question.progress.json
+            storage: Progress storage backend ("json" or "journal"), defaults to PROGRESS_STORAGE
+        """
         self.document_path = Path(document_path)
         progress_file = self.document_path / "question.progress.json"
         # File starts directly with INITIALIZED state
-        self._state_manager = ProgressStateManager(file_path=progress_file, initial_state=ProcessingState.NOT_STARTED)
+        self._state_manager = ProgressStateManager(
+            file_path=progress_file, initial_state=ProcessingState.NOT_STARTED, storage=storage
+        )
 
     # ===============================
     # DOCUMENT-SPECIFIC TYPED METHODS
@@ -63,6 +84,10 @@ class DocumentProgressHandler:
                 f"Error: {str(e)}"
             ) from e
 
+    def read_progress_view(self) -> ProgressView:
+        """Read progress file as a lazy read-only view; nothing is validated unless the view is asked to."""
+        return ProgressView(self._state_manager.read_progress_file(copy=False))
+
     def get_current_state(self) -> ProcessingState:
         """Get current state with document-specific typing."""
         state_str = self._state_manager.get_current_state()
@@ -173,17 +198,20 @@ class DocumentProgressHandler:
         """Transition to state with document-specific validation (generic fallback)."""
         self._validate_and_transition(target_state, state_data)
 
+    @_holding_progress_lock
     def rollback_to_state(self, target_state: ProcessingState) -> None:
         """Rollback to previous state."""
         # Use import from centralized types module
         from ...types import STATE_ORDER
 
         self._state_manager.rollback_to_state(target_state, STATE_ORDER)
+        self._update_progress_index()
 
     # ===============================
     # PRIVATE HELPER METHODS
     # ===============================
 
+    @_holding_progress_lock
     def _validate_and_transition(
         self, target_state: ProcessingState, state_data: Union[PageProcessingData, ChunkingData]
     ) -> None:
@@ -197,6 +225,20 @@ class DocumentProgressHandler:
         # Convert and delegate
         generic_state_data = self._convert_to_generic_state_data(target_state, state_data)
         self._state_manager.transition_to_state(target_state, generic_state_data)
+        self._update_progress_index()
+
+    def _update_progress_index(self) -> None:
+        """Refresh this document's row in the session progress index; the progress file stays the source of truth."""
+        # Lazy import to avoid circular import issues
+        from .progress_index import SessionProgressIndex
+
+        try:
+            SessionProgressIndex.for_document(self.document_path).update_document(self.document_path, self)
+        except Exception as e:
+            logger.warning(
+                "Could not update session progress index",
+                extra={"progress_file": str(self._state_manager.progress_file), "error": str(e)},
+            )
 
     def _convert_to_generic_state_data(
         self, target_state: ProcessingState, state_data: Union[PageProcessingData, ChunkingData]
@@ -209,6 +251,7 @@ class DocumentProgressHandler:
             state=target_state.value,  # Use the actual target state
         )
 
+    @_holding_progress_lock
     def patch_manual_review_page(self, page_number: int, page_data: ManualReviewPageData) -> None:
         """
         Update a single page in the current MANUAL_REVIEW state.
@@ -245,7 +288,9 @@ class DocumentProgressHandler:
 
         # Update the state data
         self._state_manager.update_state_data(ProcessingState.MANUAL_REVIEW, partial_data)
+        self._update_progress_index()
 
+    @_holding_progress_lock
     def patch_manual_review_status(
         self, status: ProcessingStatus, processing_metadata: Optional[Dict[str, Any]] = None
     ) -> None:
@@ -283,13 +328,13 @@ class DocumentProgressHandler:
             },
         )
 
-        # Update the state data
-        self._state_manager.update_state_data(ProcessingState.MANUAL_REVIEW, partial_data)
-
-        # Also update the status field at the GenericStateData level
-        # We need to handle this specially since status is not in the data field
-        self._patch_state_status(ProcessingState.MANUAL_REVIEW, status)
+        # Update the state data, and the status field at the GenericStateData level (outside the data field)
+        self._state_manager.update_state_data(
+            ProcessingState.MANUAL_REVIEW, partial_data, entry_fields={"status": status.value}
+        )
+        self._update_progress_index()
 
+    @_holding_progress_lock
     def patch_manual_review_bulk_pages(self, pages_data: Dict[int, ManualReviewPageData]) -> None:
         """
         Update multiple pages in the current MANUAL_REVIEW state in a single operation.
@@ -319,28 +364,7 @@ class DocumentProgressHandler:
 
         # Update the state data
         self._state_manager.update_state_data(ProcessingState.MANUAL_REVIEW, partial_data)
-
-    def _patch_state_status(self, state: ProcessingState, status: ProcessingStatus) -> None:
-        """
-        Update the status field of a state entry (outside of the data field).
-
-        This is a helper method since status is stored at the GenericStateData level,
-        not within the data field.
-        """
-        # Read current progress
-        progress = self._state_manager.read_progress_file()
-
-        # Find the latest entry for this state
-        for state_entry in reversed(progress["states"]):
-            if isinstance(state_entry, dict) and state_entry.get("state") == state.value:
-                state_entry["status"] = status.value
-                state_entry["timestamp"] = get_current_timestamp_iso()
-                break
-
-        progress["updated_at"] = get_current_timestamp()
-
-        # Write back to file
-        self._state_manager._write_validated_progress(progress)
+        self._update_progress_index()
 
 
 # Legacy alias for backward compatibility
@@ -0,0 +1,493 @@
+"""
+Per-session SQLite index of document progress.
+
+Reports and document finders need a few fields from every document in a session: current state,
+status, table counts, errors. Reading them from each question.progress.json means parsing every
+file on every report. The index keeps one row per document directory in
+<session>/progress_index.sqlite3:
+
+- DocumentProgressHandler updates a document's row after each transition and patch.
+- sync_ministry / sync_documents compare each document's progress file signature (mtime, size)
+  with the indexed one and re-read only documents that changed, so documents written by other
+  tools, new downloads and deleted directories are picked up with a stat-only walk.
+- rebuild re-reads every document in the session from disk.
+
+Directories are walked with one os.scandir pass each, progress files that need reading are parsed
+on a thread pool, and rows stream to the caller, so a cold index over tens of thousands of
+documents is bounded by the disk rather than by a one-file-at-a-time loop.
+"""
+
+import logging
+import os
+import sqlite3
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, TypeVar
+
+from ...utils import json_codec
+from .progress_handler import DocumentProgressHandler
+from .progress_summary import summarize_progress
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressIndexConfig:
+    """Configuration constants for the session progress index."""
+
+    DB_FILENAME = "progress_index.sqlite3"
+    PROGRESS_FILENAME = "question.progress.json"
+    JOURNAL_FILENAME = "question.progress.json.journal"
+    MINISTRIES_DIRNAME = "ministries"
+
+    # Bump when the schema or the way rows are derived changes; the index is rebuilt on first use
+    SCHEMA_VERSION = 1
+    # Seconds to wait for another process's write to the index
+    BUSY_TIMEOUT_SECONDS = 30
+
+    # Threads parsing progress files while syncing; parsing is mostly waiting on reads
+    SCAN_WORKERS = int(os.getenv("PROGRESS_SCAN_WORKERS", str(min(8, os.cpu_count() or 1))))
+    # Rows written per transaction while syncing, and directories looked up per query
+    BATCH_SIZE = 500
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_dir TEXT PRIMARY KEY,
+    ministry TEXT NOT NULL,
+    pdf_name TEXT,
+    signature TEXT NOT NULL,
+    has_progress INTEGER NOT NULL,
+    current_state TEXT,
+    status TEXT,
+    error_message TEXT,
+    table_info_available INTEGER NOT NULL DEFAULT 0,
+    has_tables INTEGER NOT NULL DEFAULT 0,
+    total_tables INTEGER NOT NULL DEFAULT 0,
+    table_pages TEXT NOT NULL DEFAULT '[]',
+    local_extraction_status TEXT,
+    source_fingerprint TEXT,
+    ready_for_llm_extraction INTEGER NOT NULL DEFAULT 0,
+    question_number TEXT,
+    document_path TEXT,
+    last_updated REAL,
+    index_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_documents_ministry ON documents (ministry);
+CREATE INDEX IF NOT EXISTS idx_documents_state ON documents (current_state, status);
+"""
+
+_COLUMNS = (
+    "doc_dir",
+    "ministry",
+    "pdf_name",
+    "signature",
+    "has_progress",
+    "current_state",
+    "status",
+    "error_message",
+    "table_info_available",
+    "has_tables",
+    "total_tables",
+    "table_pages",
+    "local_extraction_status",
+    "source_fingerprint",
+    "ready_for_llm_extraction",
+    "question_number",
+    "document_path",
+    "last_updated",
+    "index_error",
+)
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class DocumentDirScan(NamedTuple):
+    """What a stat-only look at a document directory found."""
+
+    path: Path
+    pdf_name: Optional[str]
+    has_progress: bool
+    signature: str
+    last_updated: Optional[float]
+
+
+def scan_document_dir(doc_dir: Path) -> DocumentDirScan:
+    """
+    Look at a document directory without parsing anything.
+
+    Args:
+        doc_dir: Document directory
+
+    Returns:
+        DocumentDirScan with the first PDF (in directory order, as glob("*.pdf") finds it), whether a
+        progress file exists, a signature that changes whenever the progress files do, and when they
+        last changed
+    """
+    pdf_name = None
+    with os.scandir(doc_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".pdf") and not entry.name.startswith(".") and entry.is_file():
+                pdf_name = entry.name
+                break
+
+    progress_signature = _file_signature(os.path.join(doc_dir, ProgressIndexConfig.PROGRESS_FILENAME))
+    journal_signature = _file_signature(os.path.join(doc_dir, ProgressIndexConfig.JOURNAL_FILENAME))
+    signature = json_codec.dumps([pdf_name, progress_signature, journal_signature])
+    last_updated = None
+    if progress_signature is not None:
+        last_updated = max(progress_signature[0], journal_signature[0] if journal_signature else 0) / 1e9
+    return DocumentDirScan(Path(doc_dir), pdf_name, progress_signature is not None, signature, last_updated)
+
+
+def scan_ministry(ministry_path: Path) -> Iterator[DocumentDirScan]:
+    """
+    Yield the document directories of a ministry (those holding a PDF or a progress file), in directory order.
+
+    Args:
+        ministry_path: Ministry directory
+
+    Yields:
+        DocumentDirScan for each document directory
+    """
+    try:
+        with os.scandir(ministry_path) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                scan = scan_document_dir(entry.path)
+                if scan.pdf_name is not None or scan.has_progress:
+                    yield scan
+    except FileNotFoundError:
+        return
+
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _parallel_map(function: Callable[[_T], _R], items: Iterable[_T], max_workers: int) -> Iterator[_R]:
+    """Apply function to items on a thread pool, yielding results in input order with a bounded number in flight."""
+    if max_workers <= 1:
+        yield from map(function, items)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(function, item))
+            if len(pending) >= max_workers * 4:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _batched(items: Iterable[_T], size: int) -> Iterator[List[_T]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class SessionProgressIndex:
+    """SQLite index of the progress of every document in one sansad session."""
+
+    def __init__(self, session_path: Path):
+        """
+        Open (and create if needed) the index of a session.
+
+        Args:
+            session_path: Session directory, the parent of the "ministries" directory
+        """
+        self.session_path = Path(session_path)
+        self.db_path = self.session_path / ProgressIndexConfig.DB_FILENAME
+        self._session_prefix = os.path.join(os.path.abspath(self.session_path), "")
+        self._ensure_schema()
+
+    @classmethod
+    def for_ministry(cls, ministry_path: Path) -> "SessionProgressIndex":
+        """Index of the session a ministry directory belongs to."""
+        return cls(_session_path_of(Path(ministry_path)))
+
+    @classmethod
+    def for_document(cls, doc_dir: Path) -> "SessionProgressIndex":
+        """Index of the session a document directory belongs to."""
+        return cls.for_ministry(Path(doc_dir).parent)
+
+    # ===============================
+    # STORAGE
+    # ===============================
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=ProgressIndexConfig.BUSY_TIMEOUT_SECONDS)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _ensure_schema(self) -> None:
+        with closing(self._connect()) as conn, conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != ProgressIndexConfig.SCHEMA_VERSION:
+                # Rows derived by older code can't be trusted; they are rebuilt as documents are synced
+                conn.execute("DROP TABLE IF EXISTS documents")
+                conn.execute(f"PRAGMA user_version = {ProgressIndexConfig.SCHEMA_VERSION}")
+            # WAL lets reports read while extraction workers write
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(_SCHEMA)
+
+    def _key(self, doc_dir: Path) -> str:
+        # String slicing: Path.relative_to dominates a sync over thousands of directories.
+        # Absolute paths, so a handler given an absolute path and a report given a relative one agree
+        doc_dir = os.path.abspath(doc_dir)
+        if doc_dir.startswith(self._session_prefix):
+            doc_dir = doc_dir[len(self._session_prefix) :]
+        return doc_dir.replace(os.sep, "/")
+
+    def _upsert(self, conn: sqlite3.Connection, rows: Iterable[Dict[str, Any]]) -> None:
+        """Write rows as they arrive, one transaction per batch."""
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        for batch in _batched(rows, ProgressIndexConfig.BATCH_SIZE):
+            with conn:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO documents ({', '.join(_COLUMNS)}) VALUES ({placeholders})",
+                    [tuple(row[column] for column in _COLUMNS) for row in batch],
+                )
+
+    def _to_entry(self, row: sqlite3.Row) -> Dict[str, Any]:
+        entry = dict(row)
+        entry["path"] = self.session_path / entry["doc_dir"]
+        entry["has_progress"] = bool(entry["has_progress"])
+        entry["table_info_available"] = bool(entry["table_info_available"])
+        entry["has_tables"] = bool(entry["has_tables"])
+        entry["ready_for_llm_extraction"] = bool(entry["ready_for_llm_extraction"])
+        entry["table_pages"] = json_codec.loads(entry["table_pages"])
+        return entry
+
+    # ===============================
+    # DERIVING ROWS FROM DISK
+    # ===============================
+
+    def _summarize(self, scan: DocumentDirScan, handler: Optional[DocumentProgressHandler] = None) -> Dict[str, Any]:
+        """Build a document's index row, reading its progress file if it has one."""
+        doc_dir = scan.path
+        row = {column: None for column in _COLUMNS}
+        row.update(
+            doc_dir=self._key(doc_dir),
+            ministry=doc_dir.parent.name,
+            pdf_name=scan.pdf_name,
+            signature=scan.signature,
+            has_progress=int(scan.has_progress),
+            table_info_available=0,
+            has_tables=0,
+            total_tables=0,
+            table_pages="[]",
+            ready_for_llm_extraction=0,
+        )
+        if not scan.has_progress:
+            return row
+
+        try:
+            handler = handler or DocumentProgressHandler(doc_dir)
+            summary = summarize_progress(handler.read_progress_view().raw, last_updated=scan.last_updated)
+            row.update(summary._asdict())
+            row["table_info_available"] = int(summary.table_info_available)
+            row["has_tables"] = int(summary.has_tables)
+            row["table_pages"] = json_codec.dumps(summary.table_pages)
+            row["ready_for_llm_extraction"] = int(summary.ready_for_llm_extraction)
+        except Exception as e:
+            logger.warning("Could not index document progress", extra={"doc_dir": str(doc_dir), "error": str(e)})
+            row["index_error"] = str(e)
+
+        return row
+
+    # ===============================
+    # KEEPING THE INDEX CURRENT
+    # ===============================
+
+    def update_document(self, doc_dir: Path, handler: Optional[DocumentProgressHandler] = None) -> None:
+        """
+        Re-read one document and store its row.
+
+        Args:
+            doc_dir: Document directory
+            handler: The document's progress handler, if the caller already has one
+        """
+        row = self._summarize(scan_document_dir(Path(doc_dir)), handler)
+        with closing(self._connect()) as conn:
+            self._upsert(conn, [row])
+
+    def _summarize_changed(self, scans: Iterable[DocumentDirScan], indexed: Dict[str, str]) -> Iterator[Dict[str, Any]]:
+        """Rows for the scanned documents whose signature differs from the indexed one, parsed in parallel."""
+        changed = (scan for scan in scans if indexed.get(self._key(scan.path)) != scan.signature)
+        return _parallel_map(self._summarize, changed, ProgressIndexConfig.SCAN_WORKERS)
+
+    def sync_documents(self, doc_dirs: Iterable[Path]) -> None:
+        """
+        Bring the rows of the given document directories up to date, re-reading only changed ones.
+
+        Args:
+            doc_dirs: Document directories in this session
+        """
+        doc_dirs = [Path(doc_dir) for doc_dir in doc_dirs]
+        with closing(self._connect()) as conn:
+            indexed = {}
+            # Stay under SQLite's bound-parameter limit
+            for chunk in _batched([self._key(doc_dir) for doc_dir in doc_dirs], ProgressIndexConfig.BATCH_SIZE):
+                query = f"SELECT doc_dir, signature FROM documents WHERE doc_dir IN ({', '.join('?' for _ in chunk)})"
+                indexed.update(conn.execute(query, chunk).fetchall())
+
+            removed = []
+
+            def scans() -> Iterator[DocumentDirScan]:
+                for doc_dir in doc_dirs:
+                    if doc_dir.is_dir():
+                        yield scan_document_dir(doc_dir)
+                    else:
+                        removed.append((self._key(doc_dir),))
+
+            self._upsert(conn, self._summarize_changed(scans(), indexed))
+            with conn:
+                conn.executemany("DELETE FROM documents WHERE doc_dir = ?", removed)
+
+    def sync_ministry(self, ministry_path: Path) -> None:
+        """
+        Bring the rows of a ministry up to date: new, changed and deleted document directories.
+
+        Args:
+            ministry_path: Ministry directory in this session
+        """
+        ministry_path = Path(ministry_path)
+        with closing(self._connect()) as conn:
+            indexed = dict(
+                conn.execute("SELECT doc_dir, signature FROM documents WHERE ministry = ?", (ministry_path.name,))
+            )
+
+            seen = set()
+
+            def scans() -> Iterator[DocumentDirScan]:
+                for scan in scan_ministry(ministry_path):
+                    seen.add(self._key(scan.path))
+                    yield scan
+
+            self._upsert(conn, self._summarize_changed(scans(), indexed))
+            with conn:
+                conn.executemany(
+                    "DELETE FROM documents WHERE doc_dir = ?", [(key,) for key in indexed if key not in seen]
+                )
+
+    def rebuild(self) -> int:
+        """
+        Re-read every document of the session from disk.
+
+        Returns:
+            Number of documents indexed
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM documents")
+
+        ministries_dir = self.session_path / ProgressIndexConfig.MINISTRIES_DIRNAME
+        if ministries_dir.is_dir():
+            for ministry_path in sorted(path for path in ministries_dir.iterdir() if path.is_dir()):
+                self.sync_ministry(ministry_path)
+
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    # ===============================
+    # QUERIES
+    # ===============================
+
+    def iter_ministry_documents(self, ministry_path: Path, sync: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the indexed documents of a ministry, ordered by directory.
+
+        Args:
+            ministry_path: Ministry directory in this session
+            sync: Whether to pick up changes on disk first
+
+        Yields:
+            One dict per document with the index columns, plus "path" (the document directory)
+        """
+        if sync:
+            self.sync_ministry(ministry_path)
+        with closing(self._connect()) as conn:
+            query = "SELECT * FROM documents WHERE ministry = ? ORDER BY doc_dir"
+            for row in conn.execute(query, (Path(ministry_path).name,)):
+                yield self._to_entry(row)
+
+    def ministry_documents(self, ministry_path: Path, sync: bool = True) -> List[Dict[str, Any]]:
+        """
+        Indexed documents of a ministry, ordered by directory.
+
+        Args:
+            ministry_path: Ministry directory in this session
+            sync: Whether to pick up changes on disk first
+
+        Returns:
+            list: One dict per document (see iter_ministry_documents)
+        """
+        return list(self.iter_ministry_documents(ministry_path, sync))
+
+    def documents(self, doc_dirs: Iterable[Path], sync: bool = True) -> List[Optional[Dict[str, Any]]]:
+        """
+        Indexed rows of the given document directories, in the same order.
+
+        Args:
+            doc_dirs: Document directories in this session
+            sync: Whether to pick up changes on disk first
+
+        Returns:
+            list: One dict per directory (see iter_ministry_documents), or None for directories that no longer exist
+        """
+        doc_dirs = [Path(doc_dir) for doc_dir in doc_dirs]
+        if sync:
+            self.sync_documents(doc_dirs)
+        keys = [self._key(doc_dir) for doc_dir in doc_dirs]
+        entries = {}
+        with closing(self._connect()) as conn:
+            for chunk in _batched(keys, ProgressIndexConfig.BATCH_SIZE):
+                query = f"SELECT * FROM documents WHERE doc_dir IN ({', '.join('?' for _ in chunk)})"
+                for row in conn.execute(query, chunk):
+                    entries[row["doc_dir"]] = self._to_entry(row)
+        return [entries.get(key) for key in keys]
+
+
+def _session_path_of(ministry_path: Path) -> Path:
+    parent = ministry_path.parent
+    return parent.parent if parent.name == ProgressIndexConfig.MINISTRIES_DIRNAME else parent
+
+
+def iter_document_index_entries(doc_dirs: Iterable[Path]) -> Iterator[Tuple[Path, Optional[Dict[str, Any]]]]:
+    """
+    Stream up-to-date index rows for document directories that may span several sessions.
+
+    The directories are consumed in batches, so doc_dirs can be a generator such as
+    iter_document_paths and rows are produced while the walk is still running.
+
+    Args:
+        doc_dirs: Document directories
+
+    Yields:
+        (document directory, index row) in input order; the row is None for directories that no longer exist
+    """
+    indexes: Dict[Path, SessionProgressIndex] = {}
+    for batch in _batched((Path(doc_dir) for doc_dir in doc_dirs), ProgressIndexConfig.BATCH_SIZE):
+        by_session: Dict[Path, List[int]] = {}
+        for position, doc_dir in enumerate(batch):
+            by_session.setdefault(_session_path_of(doc_dir.parent), []).append(position)
+
+        entries: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+        for session_path, positions in by_session.items():
+            if session_path not in indexes:
+                indexes[session_path] = SessionProgressIndex(session_path)
+            rows = indexes[session_path].documents([batch[position] for position in positions])
+            for position, row in zip(positions, rows):
+                entries[position] = row
+
+        yield from zip(batch, entries)
@@ -0,0 +1,107 @@
+"""
+Single-pass summaries of raw progress files.
+
+Reports need the same handful of fields from every document. Going through DocumentProgressHandler
+validates the whole file with Pydantic and then searches the states array once per accessor;
+summarize_progress walks the raw dict once and validates nothing.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from apps.py.types import ProcessingState, ProcessingStatus, StateTransitionValidator
+
+_SUMMARY_STATES = (ProcessingState.INITIALIZED.value, ProcessingState.LOCAL_EXTRACTION.value)
+
+
+class DocumentProgressSummary(NamedTuple):
+    """What the reports need to know about one document's progress."""
+
+    current_state: str
+    status: Optional[str]
+    error_message: Optional[str]
+    table_info_available: bool
+    has_tables: bool
+    total_tables: int
+    table_pages: List[int]
+    local_extraction_status: Optional[str]
+    source_fingerprint: Optional[str]
+    ready_for_llm_extraction: bool
+    question_number: Optional[str]
+    document_path: Optional[str]
+    last_updated: Optional[float]
+
+
+def summarize_progress(progress: Dict[str, Any], last_updated: Optional[float] = None) -> DocumentProgressSummary:
+    """
+    Summarize a raw progress dict in one pass over its states.
+
+    Args:
+        progress: Progress file contents as read from disk (not validated)
+        last_updated: Modification time of the progress file, if known
+
+    Returns:
+        DocumentProgressSummary of the document
+
+    Raises:
+        ValueError: If the progress dict has no current state or a malformed states array
+    """
+    current_state = progress.get("current_state")
+    states = progress.get("states")
+    if not current_state or not isinstance(states, list):
+        raise ValueError("Progress file has no current_state or states array")
+
+    # Latest entry of the current state and of the states the summary reads, newest first
+    wanted = {current_state, *_SUMMARY_STATES}
+    latest: Dict[str, Dict[str, Any]] = {}
+    for entry in reversed(states):
+        if not isinstance(entry, dict) or "state" not in entry:
+            raise ValueError(f"Malformed state entry: {entry!r}")
+        state = entry["state"]
+        if state in wanted and state not in latest:
+            latest[state] = entry
+            if len(latest) == len(wanted):
+                break
+
+    current = latest.get(current_state, {})
+    current_data = current.get("data") or {}
+    error_message = current_data.get("error_message") or "; ".join(current.get("errors") or []) or None
+
+    initialized = latest.get(ProcessingState.INITIALIZED.value, {})
+    initialized_data = initialized.get("data") or {}
+    question_number = initialized_data.get("question_number")
+
+    local = latest.get(ProcessingState.LOCAL_EXTRACTION.value, {})
+    local_status = local.get("status")
+    local_data = local.get("data") or {}
+
+    # Table information is only reliable after a successful LOCAL_EXTRACTION
+    table_info_available = local_status == ProcessingStatus.SUCCESS.value
+    has_tables = table_info_available and bool(local_data.get("has_tables", False))
+    table_pages = []
+    if table_info_available:
+        table_pages = sorted(
+            int(page) for page, page_data in (local_data.get("pages") or {}).items() if page_data.get("has_tables")
+        )
+
+    # Same rules as validate_document_readiness
+    ready_for_llm_extraction = (
+        StateTransitionValidator.validate_transition(ProcessingState(current_state), ProcessingState.LLM_EXTRACTION)
+        and initialized.get("status") == ProcessingStatus.SUCCESS.value
+        and table_info_available
+    )
+
+    return DocumentProgressSummary(
+        current_state=current_state,
+        status=current.get("status"),
+        error_message=error_message,
+        table_info_available=table_info_available,
+        has_tables=has_tables,
+        total_tables=local_data.get("total_tables", 0) if has_tables else 0,
+        table_pages=table_pages,
+        local_extraction_status=local_status,
+        source_fingerprint=local_data.get("source_fingerprint"),
+        ready_for_llm_extraction=ready_for_llm_extraction,
+        question_number=str(question_number) if question_number is not None else None,
+        document_path=initialized_data.get("questions_file_path_local"),
+        last_updated=last_updated,
+    )
@@ -0,0 +1,110 @@
+"""
+Read-only view of a progress file.
+
+ProgressFileStructure validates every entry of the states history, and its consistency checks walk
+that history again, on every read. Most readers only want the current state or the latest entry of
+one state. ProgressView wraps the raw progress dict, indexes the latest entry per state the first time
+one is asked for, and validates a single entry only when it is requested as a model. Full validation
+runs on writes (DocumentProgressHandler validates before every transition) or through validate().
+"""
+
+from functools import cached_property
+from typing import Any, Dict, List, Optional
+
+from apps.py.types import (
+    ProcessingState,
+    ProgressFileStructure,
+    QuestionProcessingProgressStateData,
+    StateTransitionValidator,
+)
+
+
+class ProgressView:
+    """Lazy, validation-free view of a document's progress data."""
+
+    def __init__(self, raw_progress: Dict[str, Any]):
+        """
+        Wrap raw progress data.
+
+        Args:
+            raw_progress: Progress file contents as read from disk. The view may share it with the
+                progress read cache, so neither the view nor its callers may modify it
+        """
+        self.raw = raw_progress
+
+    @cached_property
+    def current_state(self) -> ProcessingState:
+        """The document's current state."""
+        current_state = self.raw.get("current_state")
+        try:
+            return ProcessingState(current_state)
+        except ValueError:
+            raise ValueError(f"Invalid current_state: {current_state}") from None
+
+    @property
+    def states(self) -> List[Dict[str, Any]]:
+        """The raw states history, oldest first."""
+        return self.raw.get("states", [])
+
+    @cached_property
+    def _latest_by_state(self) -> Dict[str, Dict[str, Any]]:
+        """Latest entry per state, built in one pass over the history."""
+        latest = {}
+        for entry in self.states:
+            if isinstance(entry, dict) and "state" in entry:
+                latest[entry["state"]] = entry
+        return latest
+
+    def latest_entry(self, state: ProcessingState) -> Optional[Dict[str, Any]]:
+        """
+        Get the raw latest entry of a state.
+
+        Args:
+            state: State to look up
+
+        Returns:
+            The entry, or None if the document never reached the state
+        """
+        return self._latest_by_state.get(state.value)
+
+    def get_state_data(self, state: ProcessingState) -> Optional[QuestionProcessingProgressStateData]:
+        """
+        Get the latest entry of a state, validating only that entry.
+
+        Args:
+            state: State to look up
+
+        Returns:
+            The validated entry, or None if the document never reached the state
+        """
+        entry = self.latest_entry(state)
+        return QuestionProcessingProgressStateData(**entry) if entry is not None else None
+
+    def get_status(self, state: ProcessingState) -> Optional[str]:
+        """Status of the latest entry of a state, or None if the document never reached it."""
+        entry = self.latest_entry(state)
+        return entry.get("status") if entry is not None else None
+
+    def can_transition_to(self, target_state: ProcessingState) -> bool:
+        """Check if transition to target state is valid (same rules as ProgressFileStructure.can_transition_to)."""
+        return StateTransitionValidator.validate_transition(
+            current_state=self.current_state, target_state=target_state, current_state_data=None
+        )
+
+    def get_transition_details(self, target_state: ProcessingState) -> Dict[str, Any]:
+        """Get detailed transition validation information."""
+        return StateTransitionValidator.get_validation_details(
+            current_state=self.current_state, target_state=target_state, current_state_data=None
+        )
+
+    def validate(self) -> ProgressFileStructure:
+        """
+        Run full validation of the progress data.
+
+        Returns:
+            The validated ProgressFileStructure
+
+        Raises:
+            ValidationError: If the progress data doesn't match the progress file structure
+        """
+        return ProgressFileStructure(**self.raw)
@@ -2,6 +2,7 @@
 API Management module for handling multiple API keys, usage tracking and rate limiting.
 """
 
-from .key_manager import KeyManager
+from .key_manager import KeyManager, KeySelection
+from .rate_limiter import RateLimiter, get_rate_limiter
 
-__all__ = ["KeyManager"]
+__all__ = ["KeyManager", "KeySelection", "RateLimiter", "get_rate_limiter"]
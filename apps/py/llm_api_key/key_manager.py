@@ -1,25 +1,54 @@
 """
-Key Manager module for managing multiple API keys in a round-robin fashion.
+Key Manager module for managing multiple API keys with least-loaded, quota-aware selection.
 """
 
-import json
 import os
-from datetime import date
+import threading
+import time
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 from dotenv import load_dotenv
 
+from ..utils import json_codec
 from ..utils.project_root import find_project_root
 from ..utils.timestamps import get_current_timestamp
+from .shared_state import SharedKeyState, SharedStateConfig, get_shared_state
 
 # Add at module level (top of file)
 _instance = None
 
 
+class KeyManagerConfig:
+    """Configuration constants for key scheduling."""
+
+    # Per-key quota used to compute headroom
+    DEFAULT_REQUESTS_PER_MINUTE = 10
+    DEFAULT_REQUESTS_PER_DAY = 1000
+
+    # How long a key is skipped after the provider throttled it (429)
+    RATE_LIMIT_COOLDOWN_SECONDS = 60
+
+    MINUTE_WINDOW_SECONDS = 60
+    USAGE_HISTORY_SECONDS = 600
+
+
+class KeySelection(NamedTuple):
+    """Key picked by the scheduler, and how long to wait before using it."""
+
+    key_name: str
+    key_value: str
+    wait_seconds: float
+
+
 class KeyManager:
     """
-    Manages multiple API keys with round-robin selection and usage tracking.
+    Manages multiple API keys with least-loaded selection and usage tracking.
+
+    Each request goes to the enabled key with the most minute and daily headroom. Keys
+    throttled by the provider are cooled down, and when every key is saturated the
+    selection reports how long the caller should wait.
     """
 
     @classmethod
@@ -30,22 +59,40 @@ class KeyManager:
             _instance = cls(service_name)
         return _instance
 
-    def __init__(self, service_name: str = "gemini", load_from_env: bool = True):
+    def __init__(
+        self,
+        service_name: str = "gemini",
+        load_from_env: bool = True,
+        shared: Optional[bool] = None,
+        requests_per_minute: int = KeyManagerConfig.DEFAULT_REQUESTS_PER_MINUTE,
+        requests_per_day: int = KeyManagerConfig.DEFAULT_REQUESTS_PER_DAY,
+    ):
         """
         Initialize the Key Manager.
 
         Args:
             service_name: Name of the service (e.g., "gemini")
             load_from_env: Whether to load keys from environment variables
+            shared: Share key rotation with other processes through reports/api_usage.
+                Defaults to the LLM_API_SHARED_STATE environment variable.
+            requests_per_minute: Per-key minute quota used for scheduling
+            requests_per_day: Per-key daily quota used for scheduling
         """
         self.service_name = service_name
         self.keys: Dict[str, Dict[str, Any]] = {}
         self.current_index = -1  # Start at -1 so first increment gives index 0
+        self.requests_per_minute = requests_per_minute
+        self.requests_per_day = requests_per_day
+        self._lock = threading.Lock()
         self.reports_dir = Path(find_project_root()) / "reports" / "api_usage"
 
         # Create reports directory if it doesn't exist
         self.reports_dir.mkdir(parents=True, exist_ok=True)
 
+        if shared is None:
+            shared = SharedStateConfig.ENABLED
+        self.shared_state: Optional[SharedKeyState] = get_shared_state(service_name) if shared else None
+
         if load_from_env:
             self._load_keys_from_env()
 
@@ -91,54 +138,180 @@ class KeyManager:
             "value": key_value,
             "usage": {
                 "daily_count": 0,
+                # Day the daily count belongs to; the count starts over when the day changes
+                "daily_count_day": None,
                 "last_used": None,
                 "minute_counts": [],
             },
             "enabled": True,
+            "cooldown_until": None,
         }
 
     def get_next_key(self) -> Tuple[str, str]:
         """
-        Get the next available API key in round-robin fashion.
+        Get the least-loaded available API key.
+
+        Callers that can wait should use select_key instead, which also reports how long to
+        wait when every key is saturated.
 
         Returns:
             Tuple of (key_name, key_value)
 
+        Raises:
+            ValueError: If no enabled keys are available
+        """
+        selection = self.select_key()
+        return selection.key_name, selection.key_value
+
+    def select_key(self) -> KeySelection:
+        """
+        Pick the enabled key with the most headroom and record its use.
+
+        Keys in cooldown or out of minute/daily quota are skipped. Ties go to the next key in
+        rotation order. If every key is saturated, the key that frees up first is returned
+        with the estimated wait until it does.
+
+        Returns:
+            KeySelection with the key and the seconds to wait before using it
+
         Raises:
             ValueError: If no enabled keys are available
         """
         if not self.keys:
             raise ValueError(f"No API keys available for {self.service_name}")
 
-        # Convert to list for indexing
-        key_items = list(self.keys.items())
-
-        # Try each key in sequence, starting from the next one
-        attempts = 0
-        while attempts < len(key_items):
-            # Move to next key position immediately
-            self.current_index = (self.current_index + 1) % len(key_items)
-            key_name, key_data = key_items[self.current_index]
+        with self._lock:
+            key_items = [(name, data) for name, data in self.keys.items() if data["enabled"]]
+            if not key_items:
+                raise ValueError("No enabled API keys available")
+
+            # Start from the next key in rotation so equally loaded keys are used in turn
+            if self.shared_state is not None:
+                start = self.shared_state.next_rotation_index(len(key_items))
+            else:
+                start = (self.current_index + 1) % len(key_items)
+            ordered = [key_items[(start + offset) % len(key_items)] for offset in range(len(key_items))]
+
+            loads = self._get_key_loads([name for name, _ in ordered])
+
+            best_name: Optional[str] = None
+            best_headroom: Tuple[float, float] = (0.0, 0.0)
+            for key_name, _ in ordered:
+                load = loads[key_name]
+                if load["wait_seconds"] > 0:
+                    continue
+                headroom = (load["minute_headroom"], load["daily_headroom"])
+                if best_name is None or headroom > best_headroom:
+                    best_name, best_headroom = key_name, headroom
+
+            wait_seconds = 0.0
+            if best_name is None:
+                # Every key is saturated, take the one that frees up first
+                best_name = min(ordered, key=lambda item: loads[item[0]]["wait_seconds"])[0]
+                wait_seconds = loads[best_name]["wait_seconds"]
+
+            self.current_index = next(i for i, (name, _) in enumerate(key_items) if name == best_name)
+            key_data = self.keys[best_name]
+            self._record_key_use(key_data)
+            return KeySelection(best_name, key_data["value"], wait_seconds)
+
+    def _get_key_loads(self, key_names: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Compute headroom and earliest availability for each key.
 
-            if key_data["enabled"]:
-                # Update usage data
-                now = get_current_timestamp()
-                key_data["usage"]["last_used"] = now
-                key_data["usage"]["daily_count"] += 1
+        Returns:
+            Mapping of key name to minute_headroom, daily_headroom and wait_seconds
+        """
+        now = get_current_timestamp()
+        now_ts = time.time()
+        cooldowns = self.shared_state.get_cooldowns() if self.shared_state is not None else {}
+        daily_counts = self.shared_state.get_daily_counts() if self.shared_state is not None else {}
+
+        loads = {}
+        for key_name in key_names:
+            key_data = self.keys[key_name]
+            usage = key_data["usage"]
+
+            if self.shared_state is not None:
+                # Token buckets are shared by all processes; a negative balance means queued requests
+                minute_headroom = self.shared_state.available_tokens(key_name, self.requests_per_minute)
+                daily_count = daily_counts.get(key_name, 0)
+                minute_wait = max(-minute_headroom + 1, 0.0) * (
+                    KeyManagerConfig.MINUTE_WINDOW_SECONDS / self.requests_per_minute
+                )
+            else:
+                recent = sorted(
+                    t
+                    for t in usage["minute_counts"]
+                    if (now - t).total_seconds() < KeyManagerConfig.MINUTE_WINDOW_SECONDS
+                )
+                minute_headroom = float(self.requests_per_minute - len(recent))
+                daily_count = self._daily_count(usage)
+                minute_wait = 0.0
+                if minute_headroom < 1:
+                    # Wait until enough requests leave the one-minute window
+                    release = recent[len(recent) - self.requests_per_minute]
+                    minute_wait = KeyManagerConfig.MINUTE_WINDOW_SECONDS - (now - release).total_seconds()
+
+            cooldown_until = max(key_data["cooldown_until"] or 0.0, cooldowns.get(key_name, 0.0))
+            cooldown_wait = max(cooldown_until - now_ts, 0.0)
+
+            daily_headroom = float(self.requests_per_day - daily_count)
+            daily_wait = 0.0
+            if daily_headroom <= 0:
+                tomorrow = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+                daily_wait = (tomorrow - now).total_seconds()
+
+            loads[key_name] = {
+                "minute_headroom": minute_headroom,
+                "daily_headroom": daily_headroom,
+                "wait_seconds": max(cooldown_wait, minute_wait if minute_headroom < 1 else 0.0, daily_wait),
+            }
+        return loads
+
+    @staticmethod
+    def _daily_count(usage: Dict[str, Any]) -> int:
+        """Requests recorded for a key today, starting the count over once the day has changed."""
+        today = get_current_timestamp().date()
+        if usage["daily_count_day"] != today:
+            usage["daily_count"] = 0
+            usage["daily_count_day"] = today
+        return usage["daily_count"]
+
+    def _record_key_use(self, key_data: Dict[str, Any]) -> None:
+        """Update usage data for a selected key."""
+        now = get_current_timestamp()
+        key_data["usage"]["last_used"] = now
+        key_data["usage"]["daily_count"] = self._daily_count(key_data["usage"]) + 1
 
-                # Track per-minute usage
-                key_data["usage"]["minute_counts"].append(now)
+        # Track per-minute usage
+        key_data["usage"]["minute_counts"].append(now)
 
-                # Clean old minute counts (keep only last 10 minutes)
-                key_data["usage"]["minute_counts"] = [
-                    t for t in key_data["usage"]["minute_counts"] if (now - t).total_seconds() < 600
-                ]
+        # Clean old minute counts (keep only last 10 minutes)
+        key_data["usage"]["minute_counts"] = [
+            t
+            for t in key_data["usage"]["minute_counts"]
+            if (now - t).total_seconds() < KeyManagerConfig.USAGE_HISTORY_SECONDS
+        ]
 
-                return key_name, key_data["value"]
+    def report_rate_limited(self, key_name: str, retry_after: Optional[float] = None) -> None:
+        """
+        Cool down a key after the provider throttled it.
 
-            attempts += 1
+        Args:
+            key_name: Name of the throttled key
+            retry_after: Seconds suggested by the provider, if known
+        """
+        if key_name not in self.keys:
+            return
 
-        raise ValueError("No enabled API keys available")
+        cooldown = retry_after if retry_after and retry_after > 0 else KeyManagerConfig.RATE_LIMIT_COOLDOWN_SECONDS
+        cooldown_until = time.time() + cooldown
+        with self._lock:
+            self.keys[key_name]["cooldown_until"] = cooldown_until
+        if self.shared_state is not None:
+            self.shared_state.set_cooldown(key_name, cooldown_until)
+        print(f"[API Key Manager] Key {key_name} rate limited, cooling down for {cooldown:.0f}s")
 
     def disable_key(self, key_name: str) -> None:
         """
@@ -170,7 +343,7 @@ class KeyManager:
         stats = {}
         for key_name, key_data in self.keys.items():
             stats[key_name] = {
-                "daily_count": key_data["usage"]["daily_count"],
+                "daily_count": self._daily_count(key_data["usage"]),
                 "last_used": key_data["usage"]["last_used"].isoformat() if key_data["usage"]["last_used"] else None,
                 "enabled": key_data["enabled"],
                 "requests_last_minute": len(
@@ -193,15 +366,15 @@ class KeyManager:
         for key_name, key_data in self.keys.items():
             # Don't include the actual key value in the report
             report_data["keys"][key_name] = {
-                "daily_count": key_data["usage"]["daily_count"],
+                "daily_count": self._daily_count(key_data["usage"]),
                 "last_used": key_data["usage"]["last_used"].isoformat() if key_data["usage"]["last_used"] else None,
                 "enabled": key_data["enabled"],
             }
 
-        with open(report_file, "w") as f:
-            json.dump(report_data, f, indent=2)
+        with open(report_file, "w", encoding="utf-8") as f:
+            json_codec.dump(report_data, f, pretty=True)
 
-    def should_rate_limit(self, key_name: str, max_per_minute: int = 10) -> bool:
+    def should_rate_limit(self, key_name: str, max_per_minute: Optional[int] = None) -> bool:
         """
         Check if a key should be rate limited.
 
@@ -215,6 +388,9 @@ class KeyManager:
         if key_name not in self.keys:
             return False
 
+        if max_per_minute is None:
+            max_per_minute = self.requests_per_minute
+
         # Count requests in the last minute
         now = get_current_timestamp()
         minute_counts = self.keys[key_name]["usage"]["minute_counts"]
@@ -5,11 +5,13 @@ Rate limiter for API calls to prevent hitting rate limits.
 import asyncio
 import functools
 import random
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import Awaitable, Callable, List, TypeVar
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TypeVar
 
 from ..utils.timestamps import get_current_timestamp
+from .shared_state import SharedKeyState, SharedStateConfig, get_shared_state
 
 T = TypeVar("T")
 
@@ -35,13 +37,24 @@ class RateLimiterConfig:
 
 class RateLimiter:
     """
-    Rate limiter for API calls to prevent hitting rate limits.
+    Token bucket rate limiter for API calls to prevent hitting rate limits.
+
+    The bucket holds up to `requests_per_minute` tokens and refills continuously, so checks
+    are O(1). Requests reserve a token up front; when the bucket is empty the reservation
+    puts it into debt and the caller waits for the refill, which serves waiters in the
+    order they arrived. Instances are thread-safe; use `get_rate_limiter` to share one
+    limiter per service and API key across the process.
+
+    With a `shared_state`, the bucket lives in a SQLite database instead of memory, so
+    several processes using the same key draw from the same budget.
     """
 
     def __init__(
         self,
         requests_per_minute: int = RateLimiterConfig.DEFAULT_REQUESTS_PER_MINUTE,
         requests_per_day: int = RateLimiterConfig.DEFAULT_REQUESTS_PER_DAY,
+        shared_state: Optional[SharedKeyState] = None,
+        bucket_name: Optional[str] = None,
     ):
         """
         Initialize the rate limiter.
@@ -49,32 +62,69 @@ class RateLimiter:
         Args:
             requests_per_minute: Maximum requests per minute
             requests_per_day: Maximum requests per day
+            shared_state: Cross-process state to keep the bucket in, if any
+            bucket_name: Name of the bucket in the shared state (usually the key name)
         """
+        if shared_state is not None and not bucket_name:
+            raise ValueError("bucket_name is required when using shared_state")
+        if requests_per_minute < 1:
+            raise ValueError("requests_per_minute must be at least 1")
+
         self.requests_per_minute = requests_per_minute
         self.requests_per_day = requests_per_day
-        self.request_timestamps: List[datetime] = []
+        self.refill_rate = requests_per_minute / RateLimiterConfig.MINUTE_WINDOW_SECONDS  # tokens per second
+        self.tokens = float(requests_per_minute)
+        self.last_refill = time.monotonic()
         self.daily_count = 0
-        self.daily_reset_time = get_current_timestamp().replace(
+        self.daily_reset_time = self._next_daily_reset()
+        self._lock = threading.Lock()
+        self.shared_state = shared_state
+        self.bucket_name = bucket_name
+
+    @staticmethod
+    def _next_daily_reset() -> datetime:
+        return get_current_timestamp().replace(
             hour=RateLimiterConfig.DAILY_RESET_HOUR,
             minute=RateLimiterConfig.DAILY_RESET_MINUTE,
             second=0,
             microsecond=0,
         ) + timedelta(days=1)
 
-    def _cleanup_old_timestamps(self) -> None:
-        """Remove timestamps older than 1 minute."""
-        now = datetime.now()
-        self.request_timestamps = [ts for ts in self.request_timestamps if (now - ts) < timedelta(minutes=1)]
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill. Caller must hold the lock."""
+        now = time.monotonic()
+        self.tokens = min(float(self.requests_per_minute), self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
 
         # Reset daily count if we've passed the reset time
-        if now >= self.daily_reset_time:
+        if get_current_timestamp() >= self.daily_reset_time:
             self.daily_count = 0
-            self.daily_reset_time = now.replace(
-                hour=RateLimiterConfig.DAILY_RESET_HOUR,
-                minute=RateLimiterConfig.DAILY_RESET_MINUTE,
-                second=0,
-                microsecond=0,
-            ) + timedelta(days=1)
+            self.daily_reset_time = self._next_daily_reset()
+
+    def _reserve(self) -> Tuple[float, bool]:
+        """
+        Reserve a slot for one request.
+
+        Returns:
+            Tuple of (seconds to wait, reserved). When reserved is False the daily budget is used
+            up and nothing was reserved: the caller must wait until the daily reset and try again
+        """
+        if self.shared_state is not None:
+            return self.shared_state.reserve(self.bucket_name, self.requests_per_minute, self.requests_per_day)
+
+        with self._lock:
+            self._refill()
+
+            if self.daily_count >= self.requests_per_day:
+                # Nothing is counted yet; the caller reserves again once the new day starts
+                wait_seconds = (self.daily_reset_time - get_current_timestamp()).total_seconds()
+                return max(wait_seconds, RateLimiterConfig.MIN_WAIT_SECONDS), False
+
+            self.daily_count += 1
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0, True
+            return -self.tokens / self.refill_rate, True
 
     def should_limit(self) -> bool:
         """
@@ -83,23 +133,25 @@ class RateLimiter:
         Returns:
             True if request should be limited, False otherwise
         """
-        self._cleanup_old_timestamps()
-
-        # Check minute limit
-        if len(self.request_timestamps) >= self.requests_per_minute:
-            return True
+        if self.shared_state is not None:
+            daily_count = self.shared_state.get_daily_counts().get(self.bucket_name, 0)
+            tokens = self.shared_state.available_tokens(self.bucket_name, self.requests_per_minute)
+            return tokens < 1 or daily_count >= self.requests_per_day
 
-        # Check daily limit
-        if self.daily_count >= self.requests_per_day:
-            return True
-
-        return False
+        with self._lock:
+            self._refill()
+            return self.tokens < 1 or self.daily_count >= self.requests_per_day
 
     def record_request(self) -> None:
         """Record a new request."""
-        self._cleanup_old_timestamps()
-        self.request_timestamps.append(datetime.now())
-        self.daily_count += 1
+        if self.shared_state is not None:
+            self.shared_state.reserve(self.bucket_name, self.requests_per_minute, self.requests_per_day)
+            return
+
+        with self._lock:
+            self._refill()
+            self.tokens -= 1
+            self.daily_count += 1
 
     def wait_if_needed(self, jitter: bool = True) -> float:
         """
@@ -111,31 +163,43 @@ class RateLimiter:
         Returns:
             Time waited in seconds
         """
-        self._cleanup_old_timestamps()
-
-        if not self.should_limit():
-            self.record_request()
-            return 0.0
-
-        # Calculate wait time
-        if self.daily_count >= self.requests_per_day:
-            # Need to wait until tomorrow
-            wait_seconds = (self.daily_reset_time - datetime.now()).total_seconds()
-            wait_seconds = max(wait_seconds, RateLimiterConfig.MIN_WAIT_SECONDS)
-        else:
-            # Need to wait until oldest request falls out of the window
-            oldest = min(self.request_timestamps)
-            wait_seconds = RateLimiterConfig.MINUTE_WINDOW_SECONDS - (datetime.now() - oldest).total_seconds()
-            wait_seconds = max(wait_seconds, RateLimiterConfig.MIN_WAIT_SECONDS)
-
-        # Add jitter if requested (±10%)
-        if jitter:
-            wait_seconds *= 1 + random.uniform(-RateLimiterConfig.JITTER_RANGE, RateLimiterConfig.JITTER_RANGE)
-
-        # Wait and then record
-        time.sleep(wait_seconds)
-        self.record_request()
-        return wait_seconds
+        waited = 0.0
+        while True:
+            wait_seconds, reserved = self._reserve()
+            if wait_seconds > 0:
+                # Add jitter if requested (only ever later, so the reserved slot is respected)
+                if jitter:
+                    wait_seconds *= 1 + random.uniform(0, RateLimiterConfig.JITTER_RANGE)
+                time.sleep(wait_seconds)
+                waited += wait_seconds
+            if reserved:
+                return waited
+
+    async def acquire_async(self) -> float:
+        """
+        Wait for a request slot without blocking the event loop.
+
+        The slot is reserved before waiting, so waiters are served in the order they called
+        this method and each one sleeps exactly as long as its slot needs. Once the daily budget
+        is used up nothing can be reserved: waiters sleep until the daily reset and then reserve
+        again, so they draw from the new day's budget and per-minute bucket like everyone else.
+
+        Returns:
+            Time waited in seconds
+        """
+        waited = 0.0
+        while True:
+            if self.shared_state is not None:
+                # The shared bucket is a SQLite transaction; keep it off the event loop
+                wait_seconds, reserved = await asyncio.to_thread(self._reserve)
+            else:
+                wait_seconds, reserved = self._reserve()
+
+            if wait_seconds > 0:
+                await asyncio.sleep(wait_seconds)
+                waited += wait_seconds
+            if reserved:
+                return waited
 
     def limit_sync(self, func: Callable[..., T]) -> Callable[..., T]:
         """
@@ -168,9 +232,51 @@ class RateLimiter:
 
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            wait_time = self.wait_if_needed()
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
+            await self.acquire_async()
             return await func(*args, **kwargs)
 
         return wrapper
+
+
+# Process-wide registry of limiters keyed by (service, key name)
+_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    service_name: str,
+    key_name: str,
+    requests_per_minute: Optional[int] = None,
+    requests_per_day: Optional[int] = None,
+    shared: Optional[bool] = None,
+) -> RateLimiter:
+    """
+    Get the shared rate limiter for a service and API key.
+
+    Limits only apply when the limiter is first created; later calls return the existing limiter.
+
+    Args:
+        service_name: Name of the service (e.g., "gemini")
+        key_name: Name of the API key as reported by KeyManager
+        requests_per_minute: Maximum requests per minute for this key
+        requests_per_day: Maximum requests per day for this key
+        shared: Keep the bucket in the cross-process shared state. Defaults to LLM_API_SHARED_STATE.
+
+    Returns:
+        RateLimiter shared by every caller in this process
+    """
+    if shared is None:
+        shared = SharedStateConfig.ENABLED
+
+    registry_key = (service_name, key_name)
+    with _limiters_lock:
+        limiter = _limiters.get(registry_key)
+        if limiter is None:
+            limiter = RateLimiter(
+                requests_per_minute=requests_per_minute or RateLimiterConfig.DEFAULT_REQUESTS_PER_MINUTE,
+                requests_per_day=requests_per_day or RateLimiterConfig.DEFAULT_REQUESTS_PER_DAY,
+                shared_state=get_shared_state(service_name) if shared else None,
+                bucket_name=key_name,
+            )
+            _limiters[registry_key] = limiter
+        return limiter
@@ -0,0 +1,272 @@
+"""
+Cross-process state for key rotation and rate limiting.
+
+When several processes (CLI, API server, Temporal worker) use the same API keys, each one
+keeping its own counters lets them overshoot the per-key quota together. This module keeps
+that state in a SQLite database under reports/api_usage so every process draws from the
+same token buckets and the same key rotation.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ..utils.project_root import find_project_root
+from ..utils.timestamps import get_current_timestamp
+
+
+class SharedStateConfig:
+    """Configuration constants for the shared state backend."""
+
+    # Set LLM_API_SHARED_STATE=1 to share key and rate limit state between processes
+    ENABLED = os.getenv("LLM_API_SHARED_STATE", "").lower() in ("1", "true", "yes")
+
+    DB_FILENAME = "{service_name}_shared_state.sqlite3"
+
+    # How long a process waits for another process's write lock
+    BUSY_TIMEOUT_SECONDS = 30
+
+    MINUTE_WINDOW_SECONDS = 60
+    MIN_WAIT_SECONDS = 1
+
+
+class SharedKeyState:
+    """
+    SQLite-backed key rotation and token buckets shared by all processes on the machine.
+
+    Every read-modify-write runs in its own `BEGIN IMMEDIATE` transaction, so concurrent
+    processes and threads see a consistent view. Connections are kept per thread.
+    """
+
+    def __init__(self, service_name: str, db_path: Optional[Path] = None):
+        """
+        Initialize the shared state.
+
+        Args:
+            service_name: Name of the service (e.g., "gemini")
+            db_path: Database location. Defaults to reports/api_usage/<service>_shared_state.sqlite3
+        """
+        self.service_name = service_name
+        if db_path is None:
+            reports_dir = Path(find_project_root()) / "reports" / "api_usage"
+            reports_dir.mkdir(parents=True, exist_ok=True)
+            db_path = reports_dir / SharedStateConfig.DB_FILENAME.format(service_name=service_name)
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+
+        with self._transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS key_rotation (
+                    service TEXT PRIMARY KEY,
+                    next_index INTEGER NOT NULL
+                )
+                """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS rate_buckets (
+                    service TEXT NOT NULL,
+                    key_name TEXT NOT NULL,
+                    tokens REAL NOT NULL,
+                    last_refill REAL NOT NULL,
+                    day TEXT NOT NULL,
+                    daily_count INTEGER NOT NULL,
+                    PRIMARY KEY (service, key_name)
+                )
+                """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS key_cooldowns (
+                    service TEXT NOT NULL,
+                    key_name TEXT NOT NULL,
+                    cooldown_until REAL NOT NULL,
+                    PRIMARY KEY (service, key_name)
+                )
+                """)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=SharedStateConfig.BUSY_TIMEOUT_SECONDS, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _transaction(self) -> "_ImmediateTransaction":
+        return _ImmediateTransaction(self._connection())
+
+    # ===============================
+    # KEY ROTATION
+    # ===============================
+
+    def next_rotation_index(self, num_keys: int) -> int:
+        """
+        Advance the shared round-robin position.
+
+        Args:
+            num_keys: Number of keys being rotated
+
+        Returns:
+            Index of the key to use next, in [0, num_keys)
+        """
+        with self._transaction() as conn:
+            row = conn.execute("SELECT next_index FROM key_rotation WHERE service = ?", (self.service_name,)).fetchone()
+            index = row[0] % num_keys if row else 0
+            conn.execute(
+                "INSERT OR REPLACE INTO key_rotation (service, next_index) VALUES (?, ?)",
+                (self.service_name, (index + 1) % num_keys),
+            )
+        return index
+
+    def set_cooldown(self, key_name: str, cooldown_until: float) -> None:
+        """
+        Keep a key out of rotation for every process until the given time.
+
+        Args:
+            key_name: Name of the API key
+            cooldown_until: Unix timestamp when the key may be used again
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO key_cooldowns (service, key_name, cooldown_until) VALUES (?, ?, ?)",
+                (self.service_name, key_name, cooldown_until),
+            )
+
+    def get_cooldowns(self) -> Dict[str, float]:
+        """Active cooldowns per key as Unix timestamps."""
+        rows = (
+            self._connection()
+            .execute(
+                "SELECT key_name, cooldown_until FROM key_cooldowns WHERE service = ? AND cooldown_until > ?",
+                (self.service_name, time.time()),
+            )
+            .fetchall()
+        )
+        return {key_name: until for key_name, until in rows}
+
+    # ===============================
+    # TOKEN BUCKETS
+    # ===============================
+
+    def reserve(self, key_name: str, requests_per_minute: int, requests_per_day: int) -> Tuple[float, bool]:
+        """
+        Reserve one request from the shared token bucket for a key.
+
+        Args:
+            key_name: Name of the API key
+            requests_per_minute: Bucket capacity and refill per minute
+            requests_per_day: Daily request budget
+
+        Returns:
+            Tuple of (seconds to wait, reserved). When reserved is False the daily budget is used
+            up and nothing was reserved: the caller must wait until the daily reset and try again
+        """
+        refill_rate = requests_per_minute / SharedStateConfig.MINUTE_WINDOW_SECONDS
+        with self._transaction() as conn:
+            tokens, daily_count, now, today = self._load_bucket(conn, key_name, requests_per_minute)
+
+            if daily_count >= requests_per_day:
+                self._store_bucket(conn, key_name, tokens, now, today, daily_count)
+                return self._seconds_until_tomorrow(), False
+
+            tokens -= 1
+            self._store_bucket(conn, key_name, tokens, now, today, daily_count + 1)
+
+        if tokens >= 0:
+            return 0.0, True
+        return -tokens / refill_rate, True
+
+    def available_tokens(self, key_name: str, requests_per_minute: int) -> float:
+        """
+        Current token count of a key's bucket without reserving anything.
+
+        Args:
+            key_name: Name of the API key
+            requests_per_minute: Bucket capacity and refill per minute
+
+        Returns:
+            Tokens currently available (negative when callers are already queued)
+        """
+        with self._transaction() as conn:
+            tokens, _, _, _ = self._load_bucket(conn, key_name, requests_per_minute)
+        return tokens
+
+    def get_daily_counts(self) -> Dict[str, int]:
+        """Requests reserved today per key, across all processes."""
+        today = get_current_timestamp().date().isoformat()
+        rows = (
+            self._connection()
+            .execute(
+                "SELECT key_name, daily_count FROM rate_buckets WHERE service = ? AND day = ?",
+                (self.service_name, today),
+            )
+            .fetchall()
+        )
+        return {key_name: count for key_name, count in rows}
+
+    def _load_bucket(self, conn: sqlite3.Connection, key_name: str, requests_per_minute: int):
+        """Load and refill a bucket. Must run inside a transaction."""
+        now = time.time()
+        today = get_current_timestamp().date().isoformat()
+        row = conn.execute(
+            "SELECT tokens, last_refill, day, daily_count FROM rate_buckets WHERE service = ? AND key_name = ?",
+            (self.service_name, key_name),
+        ).fetchone()
+
+        if row is None:
+            return float(requests_per_minute), 0, now, today
+
+        tokens, last_refill, day, daily_count = row
+        refill_rate = requests_per_minute / SharedStateConfig.MINUTE_WINDOW_SECONDS
+        tokens = min(float(requests_per_minute), tokens + max(now - last_refill, 0.0) * refill_rate)
+        if day != today:
+            daily_count = 0
+        return tokens, daily_count, now, today
+
+    def _store_bucket(
+        self, conn: sqlite3.Connection, key_name: str, tokens: float, now: float, today: str, daily_count: int
+    ) -> None:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO rate_buckets (service, key_name, tokens, last_refill, day, daily_count)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (self.service_name, key_name, tokens, now, today, daily_count),
+        )
+
+    @staticmethod
+    def _seconds_until_tomorrow() -> float:
+        now = get_current_timestamp()
+        tomorrow = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        return max((tomorrow - now).total_seconds(), SharedStateConfig.MIN_WAIT_SECONDS)
+
+
+class _ImmediateTransaction:
+    """Context manager running a block inside BEGIN IMMEDIATE ... COMMIT/ROLLBACK."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.conn.execute("COMMIT")
+        else:
+            self.conn.execute("ROLLBACK")
+
+
+# Module-level instances, one per service
+_shared_states: Dict[str, SharedKeyState] = {}
+_shared_states_lock = threading.Lock()
+
+
+def get_shared_state(service_name: str) -> SharedKeyState:
+    """Get the process-wide handle on the shared state for a service."""
+    with _shared_states_lock:
+        if service_name not in _shared_states:
+            _shared_states[service_name] = SharedKeyState(service_name)
+        return _shared_states[service_name]
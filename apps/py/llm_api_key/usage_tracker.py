@@ -1,94 +1,252 @@
 """
 Track API usage and generate reports.
+
+Calls are recorded in memory and flushed in batches to an append-only JSON Lines event log
+(`<service>_<date>.events.jsonl`). Each flush folds the new events into a compact daily
+summary (`<service>_<date>.json`), so recording a call never rewrites the whole report.
 """
 
-import json
-from datetime import date
+import atexit
+import fcntl
+import os
+import threading
+from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+from ..utils import json_codec
 from ..utils.project_root import find_project_root
-from ..utils.timestamps import get_current_timestamp_iso
+from ..utils.timestamps import get_current_timestamp
+
+
+class UsageTrackerConfig:
+    """Configuration constants for usage tracking."""
+
+    # Flush buffered events after this many calls or this many seconds, whichever comes first
+    FLUSH_BATCH_SIZE = 50
+    FLUSH_INTERVAL_SECONDS = 5.0
+
+    # Numeric event metrics summed per key and per call type in the daily summary
+    SUMMED_METRICS = ("prompt_tokens", "response_tokens", "total_tokens", "latency_ms", "payload_bytes", "retries")
+
+    EVENTS_SUFFIX = ".events.jsonl"
+    LOCK_SUFFIX = ".lock"
+
+
+# Long-lived trackers, one per service
+_instances: Dict[str, "UsageTracker"] = {}
+_instances_lock = threading.Lock()
 
 
 class UsageTracker:
     """Track API usage and generate reports."""
 
+    @classmethod
+    def get_instance(cls, service_name: str) -> "UsageTracker":
+        """Get the process-wide tracker for a service."""
+        with _instances_lock:
+            if service_name not in _instances:
+                _instances[service_name] = cls(service_name)
+            return _instances[service_name]
+
     def __init__(self, service_name: str):
         """
         Initialize the usage tracker.
 
+        Prefer `UsageTracker.get_instance` so every call site in the process shares one buffer.
+
         Args:
             service_name: Name of the service being tracked
         """
         self.service_name = service_name
         self.reports_dir = Path(find_project_root()) / "reports" / "api_usage"
         self.reports_dir.mkdir(parents=True, exist_ok=True)
-        self.current_date = date.today().isoformat()
 
-        # Initialize today's usage
-        self.today_usage: Dict[str, Dict[str, Any]] = {}
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
 
-        # Try to load existing usage data for today
-        self._load_current_usage()
+        atexit.register(self.flush)
 
-    def _load_current_usage(self) -> None:
-        """Load usage data for today if it exists."""
-        report_file = self.reports_dir / f"{self.service_name}_{self.current_date}.json"
+    @property
+    def current_date(self) -> str:
+        return get_current_timestamp().date().isoformat()
 
-        if report_file.exists():
-            try:
-                with open(report_file, "r") as f:
-                    data = json.load(f)
-                    if "keys" in data:
-                        self.today_usage = data["keys"]
-            except (json.JSONDecodeError, IOError):
-                # If file exists but is invalid, start fresh
-                self.today_usage = {}
-
-    def record_usage(self, key_name: str, success: bool = True, cost: Optional[float] = None) -> None:
+    def _summary_file(self, day: str) -> Path:
+        return self.reports_dir / f"{self.service_name}_{day}.json"
+
+    def _events_file(self, day: str) -> Path:
+        return self.reports_dir / f"{self.service_name}_{day}{UsageTrackerConfig.EVENTS_SUFFIX}"
+
+    # ===============================
+    # RECORDING
+    # ===============================
+
+    def record_usage(
+        self,
+        key_name: str,
+        success: bool = True,
+        cost: Optional[float] = None,
+        metrics: Optional[Dict[str, Any]] = None,
+    ) -> None:
         """
         Record API usage for a specific key.
 
+        The event is buffered in memory and written by the next batched flush.
+
         Args:
             key_name: Name of the key used
             success: Whether the API call was successful
             cost: Optional cost information (e.g., token count)
+            metrics: Optional per-call details such as call_type, prompt_tokens, response_tokens,
+                total_tokens, latency_ms, payload_bytes, retries and source
         """
-        if key_name not in self.today_usage:
-            self.today_usage[key_name] = {
-                "total_calls": 0,
-                "successful_calls": 0,
-                "failed_calls": 0,
-                "total_cost": 0.0,
-                "timestamps": [],
-            }
-
-        # Update counts
-        self.today_usage[key_name]["total_calls"] += 1
-        if success:
-            self.today_usage[key_name]["successful_calls"] += 1
-        else:
-            self.today_usage[key_name]["failed_calls"] += 1
-
-        # Update cost if provided
+        event = {"timestamp": get_current_timestamp().isoformat(), "key": key_name, "success": success}
         if cost is not None:
-            self.today_usage[key_name]["total_cost"] += cost
+            event["cost"] = cost
+        if metrics:
+            event.update({name: value for name, value in metrics.items() if value is not None})
+
+        with self._lock:
+            self._buffer.append(event)
+            buffered = len(self._buffer)
+            if self._flusher is None:
+                self._start_flusher()
+
+        if buffered >= UsageTrackerConfig.FLUSH_BATCH_SIZE:
+            self._wakeup.set()
 
-        # Record timestamp
-        self.today_usage[key_name]["timestamps"].append(get_current_timestamp_iso())
+    def _start_flusher(self) -> None:
+        """Start the background thread that flushes periodically. Caller must hold the lock."""
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name=f"usage-tracker-{self.service_name}", daemon=True
+        )
+        self._flusher.start()
 
-        # Save updated data
-        self._save_current_usage()
+    def _flush_periodically(self) -> None:
+        while True:
+            self._wakeup.wait(UsageTrackerConfig.FLUSH_INTERVAL_SECONDS)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[Usage Tracker] Failed to flush usage events: {e}")
+
+    # ===============================
+    # FLUSHING AND COMPACTION
+    # ===============================
+
+    def flush(self) -> None:
+        """Append buffered events to the event logs and compact the daily summaries."""
+        with self._flush_lock:
+            with self._lock:
+                events, self._buffer = self._buffer, []
 
-    def _save_current_usage(self) -> None:
-        """Save current usage data to the report file."""
-        report_file = self.reports_dir / f"{self.service_name}_{self.current_date}.json"
+            events_by_day: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+            for event in events:
+                events_by_day[event["timestamp"][:10]].append(event)
 
-        report_data = {"service": self.service_name, "date": self.current_date, "keys": self.today_usage}
+            for day, day_events in events_by_day.items():
+                lines = "".join(json_codec.dumps(event) + "\n" for event in day_events)
+                with open(self._events_file(day), "a", encoding="utf-8") as f:
+                    f.write(lines)
+
+            for day in events_by_day:
+                self._compact(day)
+
+    def _compact(self, day: str) -> Dict[str, Any]:
+        """
+        Fold events appended since the last compaction into the daily summary.
 
-        with open(report_file, "w") as f:
-            json.dump(report_data, f, indent=2)
+        Only the new tail of the event log is read. A file lock keeps processes that share
+        the reports directory from compacting the same day at once.
+
+        Returns:
+            The updated summary
+        """
+        summary_file = self._summary_file(day)
+        events_file = self._events_file(day)
+        lock_file = summary_file.with_name(summary_file.name + UsageTrackerConfig.LOCK_SUFFIX)
+
+        with open(lock_file, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                summary = self._load_summary(summary_file, day)
+                offset = summary.get("events_offset", 0)
+
+                if events_file.exists():
+                    with open(events_file, "r", encoding="utf-8") as f:
+                        f.seek(offset)
+                        for line in f:
+                            # A partially written last line is picked up by the next compaction
+                            if not line.endswith("\n"):
+                                break
+                            offset += len(line.encode("utf-8"))
+                            try:
+                                event = json_codec.loads(line)
+                            except json_codec.JSONDecodeError:
+                                continue
+                            self._apply_event(summary["keys"], event)
+
+                summary["events_offset"] = offset
+                temp_file = summary_file.with_name(f"{summary_file.name}.{os.getpid()}.tmp")
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    json_codec.dump(summary, f, pretty=True)
+                os.replace(temp_file, summary_file)
+                return summary
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _load_summary(self, summary_file: Path, day: str) -> Dict[str, Any]:
+        summary = {"service": self.service_name, "date": day, "keys": {}, "events_offset": 0}
+        if summary_file.exists():
+            try:
+                with open(summary_file, "r", encoding="utf-8") as f:
+                    data = json_codec.load(f)
+                if "keys" in data:
+                    summary["keys"] = data["keys"]
+                    summary["events_offset"] = data.get("events_offset", 0)
+            except (json_codec.JSONDecodeError, IOError):
+                # If file exists but is invalid, rebuild from the event log
+                pass
+        return summary
+
+    @staticmethod
+    def _apply_event(keys: Dict[str, Dict[str, Any]], event: Dict[str, Any]) -> None:
+        key_usage = keys.setdefault(event["key"], UsageTracker._empty_usage())
+        # Summaries written before the event log kept every timestamp inline
+        key_usage.pop("timestamps", None)
+
+        UsageTracker._add_event(key_usage, event)
+        key_usage["last_used"] = event["timestamp"]
+
+        call_type = event.get("call_type")
+        if call_type:
+            by_call_type = key_usage.setdefault("by_call_type", {})
+            UsageTracker._add_event(by_call_type.setdefault(call_type, UsageTracker._empty_usage()), event)
+
+    @staticmethod
+    def _empty_usage() -> Dict[str, Any]:
+        return {"total_calls": 0, "successful_calls": 0, "failed_calls": 0, "total_cost": 0.0}
+
+    @staticmethod
+    def _add_event(usage: Dict[str, Any], event: Dict[str, Any]) -> None:
+        usage["total_calls"] += 1
+        if event.get("success", True):
+            usage["successful_calls"] += 1
+        else:
+            usage["failed_calls"] += 1
+        if event.get("cost") is not None:
+            usage["total_cost"] += event["cost"]
+        for metric in UsageTrackerConfig.SUMMED_METRICS:
+            if event.get(metric) is not None:
+                usage[metric] = usage.get(metric, 0) + event[metric]
+
+    # ===============================
+    # REPORTS
+    # ===============================
 
     def get_usage_report(self, key_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -100,9 +258,35 @@ class UsageTracker:
         Returns:
             Dictionary with usage statistics
         """
+        self.flush()
+        today_usage = self._compact(self.current_date)["keys"]
         if key_name:
-            return self.today_usage.get(key_name, {})
-        return self.today_usage
+            return today_usage.get(key_name, {})
+        return today_usage
+
+    def get_call_events(self, day: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get every recorded call for a day, e.g. to find the most expensive pages.
+
+        Args:
+            day: ISO date, defaults to today
+
+        Returns:
+            List of usage events in the order they were recorded
+        """
+        self.flush()
+        events_file = self._events_file(day or self.current_date)
+        if not events_file.exists():
+            return []
+
+        events = []
+        with open(events_file, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    events.append(json_codec.loads(line))
+                except json_codec.JSONDecodeError:
+                    continue
+        return events
 
     def get_historical_report(self, days: int = 7) -> Dict[str, Any]:
         """
@@ -114,20 +298,21 @@ class UsageTracker:
         Returns:
             Dictionary with usage statistics by day
         """
+        self.flush()
         historical_data = {}
 
-        # Find all report files and sort by date
+        # Find all summary files and sort by date
         report_files = list(self.reports_dir.glob(f"{self.service_name}_*.json"))
         report_files.sort(reverse=True)
 
         # Load data from the most recent 'days' files
         for file in report_files[:days]:
             try:
-                with open(file, "r") as f:
-                    data = json.load(f)
+                with open(file, "r", encoding="utf-8") as f:
+                    data = json_codec.load(f)
                     if "date" in data:
                         historical_data[data["date"]] = data.get("keys", {})
-            except (json.JSONDecodeError, IOError):
+            except (json_codec.JSONDecodeError, IOError):
                 continue
 
         return historical_data
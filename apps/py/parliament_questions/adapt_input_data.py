@@ -1,4 +1,3 @@
-import json
 from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
@@ -6,6 +5,7 @@ from pydantic import BaseModel, Field
 from apps.py.types import ParliamentQuestion
 
 from ..pipeline.context import PipelineContext
+from ..utils import json_codec
 from ..utils.project_root import get_loksabha_data_root
 
 
@@ -62,7 +62,7 @@ async def adapt_source_questions_list_to_parliament_questions(
 
     try:
         # Load and parse source data
-        qna_data = json.loads(qna_file.read_text())
+        qna_data = json_codec.read_json(qna_file)
         source_questions_list = [SourceParliamentQuestion(**question) for question in qna_data[0]["listOfQuestions"]]
 
         context.log_step("processing_start", total_questions=len(source_questions_list))
@@ -1,10 +1,11 @@
-import json
 import logging
 from pathlib import Path
 
 from apps.py.documents.extractors.orchestrator import PDFExtractionOrchestrator
 from apps.py.documents.utils.progress_handler import DocumentProgressHandler, ProgressHandler
+from apps.py.documents.utils.progress_index import SessionProgressIndex, scan_ministry
 from apps.py.types import ProcessingState, ProcessingStatus
+from apps.py.utils import json_codec
 from apps.py.utils.project_root import get_loksabha_data_root
 
 logger = logging.getLogger(__name__)
@@ -47,7 +48,7 @@ def validate_document_readiness(question_dir):
         handler = DocumentProgressHandler(question_dir)
 
         # Check if document can transition to LLM_EXTRACTION
-        progress = handler.read_progress_file()
+        progress = handler.read_progress_view()
         if not progress.can_transition_to(ProcessingState.LLM_EXTRACTION):
             return None, None, None
 
@@ -238,7 +239,8 @@ def validate_single_document_for_llm_extraction(document_path):
 def find_documents_ready_for_llm_extraction(ministries):
     """
     Find documents that are ready for LLM_EXTRACTION transition.
-    Uses DocumentProgressHandler for proper state management and validation.
+    Answered from the session progress index, which applies the same readiness rules as
+    validate_document_readiness when it indexes each document.
 
     Args:
         ministries: List of ministry paths
@@ -246,60 +248,25 @@ def find_documents_ready_for_llm_extraction(ministries):
     Returns:
         List of dictionaries with document paths and table page information
     """
-    data_root = get_loksabha_data_root()
-
-    def process_question_directory(question_dir, ministry_name):
-        """
-        Process a single question directory and return document info if ready for LLM extraction.
-
-        Returns:
-            dict or None: Document information if valid and ready for LLM extraction, None otherwise
-        """
-        # Validate document readiness using progress handler
-        handler, initialized_state_data, local_extraction_state_data = validate_document_readiness(question_dir)
-        if not handler or not initialized_state_data or not local_extraction_state_data:
-            return None
-
-        # Extract table information from typed data
-        table_pages, potential_ranges = extract_table_information(local_extraction_state_data)
-        if not table_pages:
-            return None
-
-        # Get document path from typed data
-        doc_path = get_document_path_from_state(initialized_state_data)
-        if not doc_path:
-            return None
-
-        # Create document entry - extract data handling both formats
-        if isinstance(local_extraction_state_data, dict):
-            if "data" in local_extraction_state_data:
-                # Dictionary format with nested "data" key
-                extraction_data = local_extraction_state_data["data"]
-            else:
-                # Dictionary format where the dict itself is the data
-                extraction_data = local_extraction_state_data
-        elif hasattr(local_extraction_state_data, "data"):
-            extraction_data = local_extraction_state_data.data
-        else:
-            extraction_data = {}
-
-        has_tables = extraction_data.get("has_tables", False)
-        total_tables = extraction_data.get("total_tables", 0)
-
-        return create_document_entry(doc_path, ministry_name, table_pages, total_tables, potential_ranges, has_tables)
-
-    # Main processing logic
     documents_ready_for_llm_extraction = []
 
     for ministry in ministries:
         try:
-            # Find all question directories in the ministry
-            question_dirs = [d for d in ministry.iterdir() if d.is_dir()]
-
-            for question_dir in question_dirs:
-                document_info = process_question_directory(question_dir, ministry.name)
-                if document_info:
-                    documents_ready_for_llm_extraction.append(document_info)
+            for entry in SessionProgressIndex.for_ministry(ministry).ministry_documents(ministry):
+                if not entry["ready_for_llm_extraction"] or not entry["has_tables"] or not entry["table_pages"]:
+                    continue
+
+                doc_path = get_document_path_from_state({"questions_file_path_local": entry["document_path"]})
+                if not doc_path:
+                    continue
+
+                table_pages = entry["table_pages"]
+                potential_ranges = find_potential_continuous_table_pages([{"page": page} for page in table_pages])
+                documents_ready_for_llm_extraction.append(
+                    create_document_entry(
+                        doc_path, ministry.name, table_pages, entry["total_tables"], potential_ranges, True
+                    )
+                )
 
         except Exception as e:
             print(f"Error processing ministry {ministry.name}: {str(e)}")
@@ -349,6 +316,37 @@ def calculate_table_statistics(documents_with_tables):
     }
 
 
+def iter_document_paths(ministry_path):
+    """
+    Stream document paths within the ministry directory.
+
+    Reads each directory with a single os.scandir pass instead of iterdir plus a glob per folder.
+
+    Args:
+        ministry_path: Path to the ministry directory
+
+    Yields:
+        Paths to directories containing PDF files, in directory order
+    """
+    for scan in scan_ministry(ministry_path):
+        if scan.pdf_name:
+            yield scan.path
+
+
+def iter_all_document_paths(ministries):
+    """
+    Stream document paths across all selected ministries.
+
+    Args:
+        ministries: List of ministry paths
+
+    Yields:
+        Paths to directories containing PDF files
+    """
+    for ministry in ministries:
+        yield from iter_document_paths(ministry)
+
+
 def find_document_paths(ministry_path):
     """
     Find all document paths within the ministry directory.
@@ -360,97 +358,99 @@ def find_document_paths(ministry_path):
         List of paths to directories containing PDF files
     """
     try:
-        # Each subfolder in the ministry directory may contain a PDF file
-        document_dirs = [d for d in ministry_path.iterdir() if d.is_dir()]
-
-        if not document_dirs:
-            return []
-
-        # Find directories containing PDF files
-        pdf_dirs = []
-        for doc_dir in document_dirs:
-            pdf_files = list(doc_dir.glob("*.pdf"))
-            if pdf_files:
-                pdf_dirs.append(doc_dir)
-
-        return pdf_dirs
+        return list(iter_document_paths(ministry_path))
     except Exception as e:
         print(f"Error finding document paths: {str(e)}")
         return []
 
 
-def find_documents_needing_extraction(ministry_path):
+def find_documents_needing_extraction(ministry_path, force=False, discard_later_work=False):
     """
     Find document paths that need LOCAL_EXTRACTION processing.
-    Filters out documents that have already been successfully extracted.
+    Filters out documents that have already been successfully extracted from an unchanged PDF.
+
+    Documents past LOCAL_EXTRACTION are left out and reported, since re-extracting them deletes
+    their LLM extraction and manual review, unless discard_later_work is set.
 
     Args:
         ministry_path: Path to the ministry directory
+        force: Include every document, even those extracted from an unchanged PDF
+        discard_later_work: Include documents past LOCAL_EXTRACTION
 
     Returns:
         List of paths to directories containing PDF files that need extraction
     """
     try:
-        # First get all document directories with PDFs
-        all_document_dirs = find_document_paths(ministry_path)
-        
-        if not all_document_dirs:
-            return []
-
-        documents_needing_extraction = []
-        
-        for doc_dir in all_document_dirs:
-            if _document_needs_extraction(doc_dir):
-                documents_needing_extraction.append(doc_dir)
-        
-        return documents_needing_extraction
-        
+        from apps.py.documents.extractors.pdf_extraction import has_work_past_local_extraction
+
+        entries = SessionProgressIndex.for_ministry(ministry_path).ministry_documents(ministry_path)
+
+        document_paths = []
+        kept_documents = []
+        for entry in entries:
+            if not entry["pdf_name"] or not (force or _document_needs_extraction(entry)):
+                continue
+            if (
+                not discard_later_work
+                and entry["has_progress"]
+                and not entry["index_error"]
+                and has_work_past_local_extraction(ProcessingState(entry["current_state"]))
+            ):
+                kept_documents.append(entry)
+                continue
+            document_paths.append(entry["path"])
+
+        if kept_documents:
+            print(
+                f"Skipping {len(kept_documents)} documents past LOCAL_EXTRACTION to keep their later work "
+                "(set PDF_EXTRACTION_DISCARD_LATER_WORK=1 to re-extract them):"
+            )
+            for entry in kept_documents:
+                reason = "stale fingerprint" if _document_needs_extraction(entry) else "forced"
+                print(f"  {entry['path'].name} ({entry['current_state']}, {reason})")
+
+        return document_paths
+
     except Exception as e:
         print(f"Error finding documents needing extraction: {str(e)}")
         return []
 
 
-def _document_needs_extraction(document_dir):
+def _document_needs_extraction(entry):
     """
     Check if a document needs LOCAL_EXTRACTION processing.
-    
+
+    A successful extraction is current only while its stored fingerprint matches the PDF on disk;
+    extractions recorded before fingerprints were stored are kept as they are.
+
     Args:
-        document_dir: Path to the document directory
-        
+        entry: The document's session progress index entry
+
     Returns:
         bool: True if document needs extraction, False if already processed successfully
     """
-    try:
-        from apps.py.documents.utils.progress_handler import DocumentProgressHandler
-        
-        # Check if progress file exists
-        progress_file = document_dir / "question.progress.json"
-        if not progress_file.exists():
-            # No progress file means document hasn't been processed yet
-            return True
-        
-        # Use DocumentProgressHandler to check status
-        handler = DocumentProgressHandler(document_dir)
-        
-        # Get current state
-        current_state = handler.get_current_state()
-        
-        # If state is LOCAL_EXTRACTION, check if it was successful
-        if current_state == ProcessingState.LOCAL_EXTRACTION:
-            local_extraction_data = handler.get_local_extraction_data()
-            status = get_status_from_state_data(local_extraction_data)
-            
-            # If LOCAL_EXTRACTION was successful, skip this document
-            if status == ProcessingStatus.SUCCESS.value:
-                return False
-        
-        # For all other cases (no state, different state, or failed LOCAL_EXTRACTION), include document
+    # A progress file that can't be read is included for safety, so it doesn't prevent processing
+    if not entry["has_progress"] or entry["index_error"]:
         return True
-        
+
+    if entry["current_state"] in (ProcessingState.NOT_STARTED.value, ProcessingState.INITIALIZED.value):
+        return True
+
+    # At or past LOCAL_EXTRACTION, check whether the extraction succeeded
+    if entry["local_extraction_status"] != ProcessingStatus.SUCCESS.value:
+        return True
+
+    # Re-extract only if the PDF or extraction settings changed since
+    stored_fingerprint = entry["source_fingerprint"]
+    if stored_fingerprint is None:
+        return False
+
+    try:
+        from apps.py.documents.extractors.pdf_extraction import compute_extraction_fingerprint
+
+        return compute_extraction_fingerprint(entry["path"] / entry["pdf_name"]) != stored_fingerprint
     except Exception as e:
-        # If there's any error reading the progress file, include the document for safety
-        # This ensures corrupted progress files don't prevent processing
-        print(f"Warning: Error checking extraction status for {document_dir.name}: {str(e)}")
+        print(f"Warning: Error checking extraction status for {entry['path'].name}: {str(e)}")
         return True
 
 
@@ -497,7 +497,7 @@ def save_ministry_extraction_results(results, session_path, ministry_name, filen
 
         # Save the results
         with open(results_file, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2)
+            json_codec.dump(results, f, pretty=True)
 
         print(f"Results saved to: {results_file}")
         return str(results_file)
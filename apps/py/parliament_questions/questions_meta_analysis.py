@@ -2,6 +2,7 @@ import logging
 from typing import Any, Dict
 
 from apps.py.types import ParliamentQuestion
+from apps.py.utils.pdf_extractors import get_pdf_extractor
 
 from ..pipeline.context import PipelineContext
 
@@ -71,16 +72,13 @@ async def analyze_question_metadata(question: ParliamentQuestion) -> Dict[str, A
     Returns:
         Dict containing analysis results
     """
-    from marker.converters.pdf import PdfConverter
-    from marker.models import create_model_dict
-
     try:
-        # Initialize Marker converter with debug mode to get detailed metadata
-        converter = PdfConverter(artifact_dict=create_model_dict(), config={"debug": True})
+        # Marker's debug converter is loaded once per process, or kept warm by the marker server
+        # when PDF_EXTRACTOR_TYPE=marker_client
+        extractor = get_pdf_extractor()
 
         # Convert and analyze PDF
-        rendered = converter(str(question["questions_file_path_local"]))
-        metadata = rendered.metadata
+        metadata = await extractor.extract_metadata(question["questions_file_path_local"])
 
         # Extract relevant metadata
         page_stats = metadata.get("page_stats", [])
@@ -1,7 +1,7 @@
-import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ..utils import json_codec
 from ..utils.project_root import get_loksabha_data_root
 from .context import PipelineContext
 from .exceptions import PipelineError, PipelineStepError
@@ -26,7 +26,7 @@ def initialize_directories(progress_dir: Path, progress_file: Path, context: Opt
         if not progress_file.exists():
             if context:
                 context.log_pipeline("create_progress_file")
-            progress_file.write_text(json.dumps([]))
+            progress_file.write_text(json_codec.dumps([]))
     except Exception as e:
         if context:
             context.log_pipeline("init_failed", error=str(e))
@@ -69,7 +69,7 @@ async def orchestrate_pipeline(
             last_step = previous_iteration.steps[-1]
 
             absolute_log_file = project_root / last_step.log_file
-            last_step_data = json.loads(absolute_log_file.read_text())
+            last_step_data = json_codec.read_json(absolute_log_file)
             return last_step_data["data"]
 
     current_iteration = await create_new_iteration(progress_file)
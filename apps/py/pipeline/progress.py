@@ -1,7 +1,7 @@
-import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from apps.py.utils import json_codec
 from apps.py.utils.project_root import get_loksabha_data_root
 from apps.py.utils.timestamps import get_current_timestamp
 
@@ -15,7 +15,7 @@ def initialize_progress(progress_dir: Path, progress_file: Path) -> None:
         progress_dir.mkdir(parents=True, exist_ok=True)
 
         if not progress_file.exists():
-            progress_file.write_text(json.dumps([]))
+            progress_file.write_text(json_codec.dumps([]))
     except OSError as e:
         raise ProgressError(f"Failed to initialize progress: {e}") from e
 
@@ -33,7 +33,7 @@ async def create_new_iteration(progress_file: Path) -> ProgressIteration:
         FileOperationError: If file operations fail
     """
     try:
-        progress_status = json.loads(progress_file.read_text())
+        progress_status = json_codec.read_json(progress_file)
         return ProgressIteration(iteration=len(progress_status) + 1, timestamp=get_current_timestamp(), steps=[])
     except Exception as e:
         raise FileOperationError(str(e), str(progress_file), "read", {"error_type": "json_decode"}) from e
@@ -52,7 +52,7 @@ async def get_last_iteration(progress_file: Path) -> Optional[ProgressIteration]
         FileOperationError: If file operations fail
     """
     try:
-        progress_status = json.loads(progress_file.read_text())
+        progress_status = json_codec.read_json(progress_file)
         if not progress_status:
             return None
         return ProgressIteration.model_validate(progress_status[-1])
@@ -74,7 +74,7 @@ async def log_progress(
             progress_data = ProgressData(**progress_data)
 
         # Read current progress status
-        progress_status = json.loads(progress_file.read_text())
+        progress_status = json_codec.read_json(progress_file)
 
         # Create log file path
         log_file = progress_dir / f"{iteration.iteration}.{progress_data.key}.log.json"
@@ -97,11 +97,11 @@ async def log_progress(
         )
 
         if existing_index != -1:
-            progress_status[existing_index] = json.loads(iteration.model_dump_json())
+            progress_status[existing_index] = iteration.model_dump(mode="json")
         else:
-            progress_status.append(json.loads(iteration.model_dump_json()))
+            progress_status.append(iteration.model_dump(mode="json"))
 
-        progress_file.write_text(json.dumps(progress_status, indent=2))
+        json_codec.write_json(progress_file, progress_status, pretty=True)
 
     except Exception as e:
         raise ProgressError(f"Failed to log progress: {e}", {"original_error": str(e)}) from e
@@ -359,6 +359,9 @@ class LocalExtractionData(BaseModel):
     extracted_tables_path: Optional[str] = None
     table_metadata: List[TableMetadata] = Field(default_factory=list)
     error_message: Optional[str] = None
+    source_fingerprint: Optional[str] = Field(
+        default=None, description="Hash of the PDF and extraction settings this data was produced from"
+    )
 
     # Document-level table summary (aggregated from page-level data)
     has_tables: bool = Field(default=False, description="True if any page in the document has tables")
@@ -1,57 +1,20 @@
-import json
-from typing import Any, Dict
+import asyncio
+from typing import Any, Dict, List, Optional, Union
 
-import google.generativeai as genai
 from dotenv import load_dotenv
 
-from apps.py.llm_api_key import KeyManager
-from apps.py.llm_api_key.rate_limiter import RateLimiter
-from apps.py.llm_api_key.usage_tracker import UsageTracker
 from apps.py.types import MultiPageTableDetectionResult
+from apps.py.utils import json_codec
+from apps.py.utils.gemini_client import GeminiCallType, get_gemini_client
 
 # Load environment variables
 load_dotenv()
 
-# Module-level instance
-_key_manager = None
+# ===============================
+# PROMPTS
+# ===============================
 
-
-def init_gemini() -> Any:
-    """Initialize Gemini API with API key from key manager."""
-    global _key_manager
-
-    # Create key manager if it doesn't exist
-    if _key_manager is None:
-        _key_manager = KeyManager(service_name="gemini")
-
-    key_name, api_key = _key_manager.get_next_key()
-
-    genai.configure(api_key=api_key)
-    return genai.GenerativeModel("gemini-2.0-flash"), key_name
-
-
-def extract_text_from_pdf_page(pdf_page_path: str) -> Dict:
-    """
-    Extract text content from a PDF page using Gemini Vision API with key rotation.
-
-    Args:
-        pdf_page_path: Path to the PDF page file
-
-    Returns:
-        Dictionary with extracted text content in markdown format
-    """
-    model, key_name = init_gemini()
-    tracker = UsageTracker(service_name="gemini")
-
-    print(f"[Gemini API] Using key {key_name} for text extraction")
-
-    try:
-        # Read the PDF file directly
-        with open(pdf_page_path, "rb") as f:
-            pdf_data = f.read()
-
-        # Prepare the prompt for text extraction
-        prompt = """
+TEXT_EXTRACTION_PROMPT = """
             Analyze the provided document page comprehensively. Extract *all* content, including text paragraphs and tables, and format the entire output as Markdown. Maintain the original order and structure of the content as closely as possible.
 
             For regular text content:
@@ -71,61 +34,7 @@ def extract_text_from_pdf_page(pdf_page_path: str) -> Dict:
             Output *only* the final, complete Markdown content. Do not include any commentary before or after the Markdown output itself.
         """
 
-        # Call Gemini API with PDF directly
-        response = model.generate_content([prompt, {"mime_type": "application/pdf", "data": pdf_data}])
-
-        # Record successful usage
-        tracker.record_usage(key_name, success=True)
-
-        # Process response - handle potential markdown fence blocks
-        extracted_text = response.text.strip()
-
-        # Try to clean up the response if it contains fence blocks
-        if "```markdown" in extracted_text:
-            markdown_content = extracted_text.split("```markdown")[1].split("```")[0].strip()
-            extracted_text = markdown_content
-        elif "```" in extracted_text:
-            # Try with just code fence without language specifier
-            markdown_content = extracted_text.split("```")[1].split("```")[0].strip()
-            extracted_text = markdown_content
-
-        return {"status": "success", "content": extracted_text, "format": "markdown"}
-    except Exception as e:
-        # Record failed usage
-        tracker.record_usage(key_name, success=False)
-
-        print(f"Error extracting text from PDF page: {str(e)}")
-        return {"status": "error", "error": str(e)}
-
-
-def extract_tables_from_pdf_page(pdf_page_path: str) -> Dict:
-    """
-    Extract tables from a PDF page using Gemini Vision API with key rotation.
-
-    Args:
-        pdf_page_path: Path to the PDF page file
-
-    Returns:
-        Dictionary with extracted table data in JSON format
-    """
-    model, key_name = init_gemini()
-    tracker = UsageTracker(service_name="gemini")
-    limiter = RateLimiter(requests_per_minute=10)
-
-    # Apply rate limiting
-    wait_time = limiter.wait_if_needed()
-    if wait_time > 0:
-        print(f"[Rate Limiter] Waiting {wait_time:.1f}s before API call")
-
-    print(f"[Gemini API] Using key {key_name} for table extraction")
-
-    try:
-        # Read the PDF file directly
-        with open(pdf_page_path, "rb") as f:
-            pdf_data = f.read()
-
-        # Prepare the prompt for table extraction with headers as keys
-        prompt = """
+TABLE_EXTRACTION_PROMPT = """
             First, analyze the structure of the main table in the provided document. Identify:
             1.  The column headers and their hierarchy (single or multi-level).
             2.  The data rows.
@@ -140,81 +49,15 @@ def extract_tables_from_pdf_page(pdf_page_path: str) -> Dict:
             Use exact header text for keys. Output only the final JSON array.
         """
 
-        # Call Gemini API
-        response = model.generate_content([prompt, {"mime_type": "application/pdf", "data": pdf_data}])
-
-        # Record successful usage
-        tracker.record_usage(key_name, success=True)
-
-        # Process response - handle potential JSON parsing issues carefully
-        try:
-            extracted_text = response.text.strip()
-
-            # Try to parse JSON from the response
-            try:
-                parsed_json = json.loads(extracted_text)
-                return {"status": "success", "content": parsed_json, "format": "json"}
-            except json.JSONDecodeError as e:
-                # Try to clean up the response if it contains fence blocks
-                if "```json" in extracted_text:
-                    json_content = extracted_text.split("```json")[1].split("```")[0].strip()
-                    parsed_json = json.loads(json_content)
-                    return {"status": "success", "content": parsed_json, "format": "json"}
-                elif "```" in extracted_text:
-                    # Try with just code fence without language specifier
-                    json_content = extracted_text.split("```")[1].split("```")[0].strip()
-                    parsed_json = json.loads(json_content)
-                    return {"status": "success", "content": parsed_json, "format": "json"}
-                else:
-                    raise ValueError(f"Failed to parse JSON: {e}") from e
-        except Exception as json_error:
-            # Still count as a successful API call since the API responded
-            return {"status": "error", "error": f"JSON parsing error: {str(json_error)}", "raw_response": response.text}
-
-    except Exception as e:
-        # Record failed usage
-        tracker.record_usage(key_name, success=False)
-
-        print(f"Error extracting tables from PDF page: {str(e)}")
-        return {"status": "error", "error": str(e)}
-
-
-def detect_multi_page_tables(pdf_path: str) -> MultiPageTableDetectionResult:
-    """
-    Detect if a PDF contains multi-page tables using Gemini Vision API.
-
-    Args:
-        pdf_path: Path to the PDF file (already split to contain only relevant pages)
-
-    Returns:
-        MultiPageTableDetectionResult containing detection results
-    """
-    model, key_name = init_gemini()
-    tracker = UsageTracker(service_name="gemini")
-    limiter = RateLimiter(requests_per_minute=10)
-
-    # Apply rate limiting
-    wait_time = limiter.wait_if_needed()
-    if wait_time > 0:
-        print(f"[Rate Limiter] Waiting {wait_time:.1f}s before API call")
-
-    print(f"[Gemini API] Using key {key_name} for multi-page table detection")
-
-    try:
-        # Read the PDF data
-        with open(pdf_path, "rb") as f:
-            pdf_data = f.read()
-
-        # Prepare the prompt for multi-page table detection
-        prompt = """
+MULTI_PAGE_TABLE_DETECTION_PROMPT = """
             Analyze the provided PDF pages to identify all continuous tables that span across multiple pages.
-            
+
             Consider these factors for each table:
             1. Table structure continuity (headers, columns, formatting)
             2. Content continuity (data flows naturally across pages)
             3. Visual indicators of table continuation (e.g., "continued from previous page")
             4. Serial number continuity (e.g., row numbers continuing across pages)
-            
+
             Respond with a JSON object containing:
             {
                 "multi_page_tables": [
@@ -226,74 +69,308 @@ def detect_multi_page_tables(pdf_path: str) -> MultiPageTableDetectionResult:
                     // ... more tables if found
                 ]
             }
-            
+
             Rules:
             1. Each table in the list should be a distinct continuous table
             2. A page can only be part of one table
             3. If no multi-page tables are found, return an empty list
             4. Order tables by their starting page number
-            
+
+            Output only the JSON object, no additional text.
+        """
+
+MULTI_PAGE_TABLE_EXTRACTION_PROMPT = """
+            First, analyze the structure of the continuous table that spans across these pages. Identify:
+            1. The column headers and their hierarchy (single or multi-level).
+            2. The data rows and how they continue across page breaks.
+            3. Any merged cells and the rows/columns they span, including those that span multiple pages.
+            4. Any repeating headers or indicators of continuity between pages.
+
+            Based on this analysis, generate a JSON array representing the complete table data:
+            - Each object in the array should represent one data row
+            - Use the column headers as keys. For hierarchical headers, create nested JSON objects mirroring the structure found in the table
+            - Map data values to the most specific corresponding header key within the structure
+            - For merged cells, associate the value correctly with all applicable rows/columns in the resulting JSON
+            - Maintain the correct order of rows across pages
+            - Preserve any serial numbers or identifiers
+            - Handle any repeating headers appropriately
+
+            Use exact header text for keys. Output only the final JSON array.
+        """
+
+MULTIPLE_TABLES_DETECTION_PROMPT = """
+            Analyze this single page document to determine if it contains multiple distinct tables.
+
+            Consider these criteria for what constitutes separate tables:
+            1. Tables with different column structures or headers
+            2. Tables separated by significant text content or whitespace
+            3. Tables with different purposes or data types
+            4. Tables that are clearly visually distinct from each other
+
+            Do NOT count as separate tables:
+            1. A single table that continues across different sections of the page
+            2. A table with sub-headers or grouped rows (still one table)
+            3. A table with summary rows at the bottom (still one table)
+
+            Respond with a JSON object:
+            {
+                "has_multiple_tables": boolean,
+                "table_count": integer (total number of distinct tables found),
+                "reasoning": "brief explanation of your analysis"
+            }
+
             Output only the JSON object, no additional text.
         """
 
-        # Call Gemini API
-        response = model.generate_content([prompt, {"mime_type": "application/pdf", "data": pdf_data}])
-
-        # Record successful usage
-        tracker.record_usage(key_name, success=True)
-
-        # Process response
-        try:
-            extracted_text = response.text.strip()
-
-            # Try to parse JSON from the response
-            try:
-                parsed_json = json.loads(extracted_text)
-                return MultiPageTableDetectionResult(
-                    status="success",
-                    multi_page_tables=parsed_json.get("multi_page_tables", []),
-                )
-            except json.JSONDecodeError as e:
-                # Try to clean up the response if it contains fence blocks
-                if "```json" in extracted_text:
-                    json_content = extracted_text.split("```json")[1].split("```")[0].strip()
-                    parsed_json = json.loads(json_content)
-                    return MultiPageTableDetectionResult(
-                        status="success",
-                        multi_page_tables=parsed_json.get("multi_page_tables", []),
-                    )
-                elif "```" in extracted_text:
-                    json_content = extracted_text.split("```")[1].split("```")[0].strip()
-                    parsed_json = json.loads(json_content)
-                    return MultiPageTableDetectionResult(
-                        status="success",
-                        multi_page_tables=parsed_json.get("multi_page_tables", []),
-                    )
-                else:
-                    raise ValueError(f"Failed to parse JSON: {e}") from e
-        except Exception as json_error:
-            return MultiPageTableDetectionResult(
-                status="error",
-                error=f"JSON parsing error: {str(json_error)}",
-            )
+MULTIPLE_TABLES_EXTRACTION_PROMPT = """
+            Analyze the document and identify {num_tables} distinct tables.
+            For each table:
+            1. Extract its rows as an array of objects
+            2. Use the column headers as keys for each row object
+            3. Preserve the exact header text for keys
+            4. Keep each table's data separate from other tables
+
+            Generate a JSON object with a "tables" key containing an array where:
+            - Each element is a complete table (array of row objects)
+            - Tables appear in the same order as in the document
+            - Tables remain separate and distinct from each other
+
+            Output only the final JSON object."""
+
+BATCH_TABLE_EXTRACTION_PROMPT = """
+            The provided document has {num_pages} pages. Each page is an independent page from a larger
+            document and must be processed on its own. The expected number of distinct tables on each page is:
+{page_expectations}
+
+            For each page, identify its tables. For each table:
+            1. Analyze the column headers and their hierarchy, the data rows, and any merged cells.
+            2. Extract its rows as an array of objects, using the exact header text as keys.
+            3. For hierarchical headers, create nested JSON objects mirroring the structure found in the table.
+            4. For merged cells, associate the value correctly with all applicable rows/columns.
+
+            Do not merge tables across pages, even if they look continuous.
+
+            Generate a JSON object of this form:
+            {{
+                "pages": [
+                    {{
+                        "page": integer (1-based position of the page in the provided document),
+                        "tables": [ [row objects of the first table], [row objects of the second table], ... ]
+                    }}
+                ]
+            }}
+
+            Include every page, in order, with its tables in the same order as they appear on the page.
+            Output only the final JSON object."""
+
+COMBINED_EXTRACTION_PROMPT = """
+            Analyze the provided document page comprehensively. It contains {num_tables} distinct table(s).
+            Produce two things from this single page:
+
+            1. "text": *all* content of the page (text paragraphs and tables) as Markdown, in the original order.
+               - Preserve paragraph breaks (use double line breaks in Markdown).
+               - Format headings and lists with standard Markdown syntax (`#` for headings, `*` or `-` for lists).
+               - Render each table as a Markdown table with a **single header row**. Combine hierarchical headers
+                 into unique, descriptive headers (e.g. 'Budget - Total'), and **repeat** the content of merged
+                 cells in each cell they span.
+
+            2. "tables": every table on the page as structured data, in the order they appear.
+               - Each table is an array of row objects, using the exact column header text as keys.
+               - For hierarchical headers, create nested JSON objects mirroring the structure found in the table.
+               - For merged cells, associate the value correctly with all applicable rows/columns.
+
+            Generate a JSON object of this form:
+            {{
+                "text": "the complete Markdown content of the page",
+                "tables": [ [row objects of the first table], [row objects of the second table], ... ]
+            }}
+
+            Output only the final JSON object."""
+
+
+# ===============================
+# HELPERS
+# ===============================
+
+
+# A PDF given by path, or already in memory (e.g. a page cut out by PDFPageSplitter)
+PdfInput = Union[str, bytes]
+
+
+def _read_pdf(pdf_path: str) -> bytes:
+    """Read a PDF file into memory."""
+    with open(pdf_path, "rb") as f:
+        return f.read()
+
+
+async def _load_pdf(pdf: PdfInput) -> bytes:
+    """Return the PDF bytes, reading the file off the event loop when given a path."""
+    if isinstance(pdf, bytes):
+        return pdf
+    return await asyncio.to_thread(_read_pdf, pdf)
+
+
+def _source_label(pdf: PdfInput, source: Optional[str]) -> Optional[str]:
+    """Label recorded with the call's usage metrics: the explicit source, else the file path."""
+    return source or (pdf if isinstance(pdf, str) else None)
+
 
+def _strip_fence(text: str, language: str) -> str:
+    """Return the content of the first code fence in text, preferring the given language tag."""
+    if f"```{language}" in text:
+        return text.split(f"```{language}")[1].split("```")[0].strip()
+    if "```" in text:
+        # Code fence without language specifier
+        return text.split("```")[1].split("```")[0].strip()
+    return text
+
+
+def _parse_json_response(text: str) -> Any:
+    """
+    Parse a JSON response, falling back to the content of a code fence.
+
+    Raises:
+        ValueError: If no valid JSON can be parsed
+    """
+    extracted_text = text.strip()
+    try:
+        return json_codec.loads(extracted_text)
+    except json_codec.JSONDecodeError as e:
+        fenced = _strip_fence(extracted_text, "json")
+        if fenced == extracted_text:
+            raise ValueError(f"Failed to parse JSON: {e}") from e
+        return json_codec.loads(fenced)
+
+
+# ===============================
+# ASYNC API
+# ===============================
+
+
+async def extract_text_from_pdf_page_async(
+    pdf_page_path: PdfInput, use_cache: bool = True, source: Optional[str] = None
+) -> Dict:
+    """
+    Extract text content from a PDF page using Gemini Vision API with key rotation.
+
+    Args:
+        pdf_page_path: Path to the PDF page file, or its bytes
+        use_cache: Whether to serve identical requests from the response cache
+        source: Label recorded with the call's usage metrics, defaults to the PDF path
+
+    Returns:
+        Dictionary with extracted text content in markdown format
+    """
+    try:
+        pdf_data = await _load_pdf(pdf_page_path)
+        response = await get_gemini_client().generate_content(
+            TEXT_EXTRACTION_PROMPT,
+            pdf_data,
+            GeminiCallType.TEXT_EXTRACTION,
+            use_cache=use_cache,
+            source=_source_label(pdf_page_path, source),
+        )
+    except Exception as e:
+        print(f"Error extracting text from PDF page: {str(e)}")
+        return {"status": "error", "error": str(e)}
+
+    extracted_text = _strip_fence(response.text.strip(), "markdown")
+    return {"status": "success", "content": extracted_text, "format": "markdown"}
+
+
+async def extract_tables_from_pdf_page_async(
+    pdf_page_path: PdfInput, use_cache: bool = True, source: Optional[str] = None
+) -> Dict:
+    """
+    Extract tables from a PDF page using Gemini Vision API with key rotation.
+
+    Args:
+        pdf_page_path: Path to the PDF page file, or its bytes
+        use_cache: Whether to serve identical requests from the response cache
+        source: Label recorded with the call's usage metrics, defaults to the PDF path
+
+    Returns:
+        Dictionary with extracted table data in JSON format
+    """
+    try:
+        pdf_data = await _load_pdf(pdf_page_path)
+        response = await get_gemini_client().generate_content(
+            TABLE_EXTRACTION_PROMPT,
+            pdf_data,
+            GeminiCallType.TABLE_EXTRACTION,
+            use_cache=use_cache,
+            source=_source_label(pdf_page_path, source),
+        )
+    except Exception as e:
+        print(f"Error extracting tables from PDF page: {str(e)}")
+        return {"status": "error", "error": str(e)}
+
+    try:
+        parsed_json = _parse_json_response(response.text)
+    except Exception as json_error:
+        # Don't keep an unusable response around for the next run
+        get_gemini_client().discard_cached(response)
+        # Still count as a successful API call since the API responded
+        return {"status": "error", "error": f"JSON parsing error: {str(json_error)}", "raw_response": response.text}
+
+    return {"status": "success", "content": parsed_json, "format": "json"}
+
+
+async def detect_multi_page_tables_async(
+    pdf_path: PdfInput, use_cache: bool = True, source: Optional[str] = None
+) -> MultiPageTableDetectionResult:
+    """
+    Detect if a PDF contains multi-page tables using Gemini Vision API.
+
+    Args:
+        pdf_path: Path to the PDF file (already split to contain only relevant pages), or its bytes
+        use_cache: Whether to serve identical requests from the response cache
+        source: Label recorded with the call's usage metrics, defaults to the PDF path
+
+    Returns:
+        MultiPageTableDetectionResult containing detection results
+    """
+    try:
+        pdf_data = await _load_pdf(pdf_path)
+        response = await get_gemini_client().generate_content(
+            MULTI_PAGE_TABLE_DETECTION_PROMPT,
+            pdf_data,
+            GeminiCallType.MULTI_PAGE_TABLE_DETECTION,
+            use_cache=use_cache,
+            source=_source_label(pdf_path, source),
+        )
     except Exception as e:
-        # Record failed usage
-        tracker.record_usage(key_name, success=False)
         print(f"Error detecting multi-page tables: {str(e)}")
         return MultiPageTableDetectionResult(
             status="error",
             error=str(e),
         )
 
+    try:
+        parsed_json = _parse_json_response(response.text)
+        return MultiPageTableDetectionResult(
+            status="success",
+            multi_page_tables=parsed_json.get("multi_page_tables", []),
+        )
+    except Exception as json_error:
+        # Don't keep an unusable response around for the next run
+        get_gemini_client().discard_cached(response)
+        return MultiPageTableDetectionResult(
+            status="error",
+            error=f"JSON parsing error: {str(json_error)}",
+        )
+
 
-def extract_multi_page_table(pdf_path: str) -> Dict:
+async def extract_multi_page_table_async(
+    pdf_path: PdfInput, use_cache: bool = True, source: Optional[str] = None
+) -> Dict:
     """
     Extract a table that spans across multiple pages using Gemini Vision API.
 
     Args:
-        pdf_path: Path to the PDF file (already split to contain only relevant pages)
-        page_range: Tuple of (start_page, end_page) numbers
+        pdf_path: Path to the PDF file (already split to contain only relevant pages), or its bytes
+        use_cache: Whether to serve identical requests from the response cache
+        source: Label recorded with the call's usage metrics, defaults to the PDF path
 
     Returns:
         Dictionary with extraction results:
@@ -303,84 +380,39 @@ def extract_multi_page_table(pdf_path: str) -> Dict:
             "error": str | None  # Only present if status is "error"
         }
     """
-    model, key_name = init_gemini()
-    tracker = UsageTracker(service_name="gemini")
-    limiter = RateLimiter(requests_per_minute=10)
-
-    # Apply rate limiting
-    wait_time = limiter.wait_if_needed()
-    if wait_time > 0:
-        print(f"[Rate Limiter] Waiting {wait_time:.1f}s before API call")
-
-    print(f"[Gemini API] Using key {key_name} for multi-page table extraction")
-
     try:
-        # Read the PDF data
-        with open(pdf_path, "rb") as f:
-            pdf_data = f.read()
-
-        # Prepare the prompt for multi-page table extraction
-        prompt = """
-            First, analyze the structure of the continuous table that spans across these pages. Identify:
-            1. The column headers and their hierarchy (single or multi-level).
-            2. The data rows and how they continue across page breaks.
-            3. Any merged cells and the rows/columns they span, including those that span multiple pages.
-            4. Any repeating headers or indicators of continuity between pages.
-
-            Based on this analysis, generate a JSON array representing the complete table data:
-            - Each object in the array should represent one data row
-            - Use the column headers as keys. For hierarchical headers, create nested JSON objects mirroring the structure found in the table
-            - Map data values to the most specific corresponding header key within the structure
-            - For merged cells, associate the value correctly with all applicable rows/columns in the resulting JSON
-            - Maintain the correct order of rows across pages
-            - Preserve any serial numbers or identifiers
-            - Handle any repeating headers appropriately
-
-            Use exact header text for keys. Output only the final JSON array.
-        """
-
-        # Call Gemini API
-        response = model.generate_content([prompt, {"mime_type": "application/pdf", "data": pdf_data}])
-
-        # Record successful usage
-        tracker.record_usage(key_name, success=True)
-
-        # Process response - handle potential JSON parsing issues carefully
-        try:
-            extracted_text = response.text.strip()
-
-            # Try to parse JSON from the response
-            try:
-                parsed_json = json.loads(extracted_text)
-                return {"status": "success", "content": parsed_json}
-            except json.JSONDecodeError as e:
-                # Try to clean up the response if it contains fence blocks
-                if "```json" in extracted_text:
-                    json_content = extracted_text.split("```json")[1].split("```")[0].strip()
-                    parsed_json = json.loads(json_content)
-                    return {"status": "success", "content": parsed_json}
-                elif "```" in extracted_text:
-                    json_content = extracted_text.split("```")[1].split("```")[0].strip()
-                    parsed_json = json.loads(json_content)
-                    return {"status": "success", "content": parsed_json}
-                else:
-                    raise ValueError(f"Failed to parse JSON: {e}") from e
-        except Exception as json_error:
-            return {"status": "error", "error": f"JSON parsing error: {str(json_error)}", "raw_response": response.text}
-
+        pdf_data = await _load_pdf(pdf_path)
+        response = await get_gemini_client().generate_content(
+            MULTI_PAGE_TABLE_EXTRACTION_PROMPT,
+            pdf_data,
+            GeminiCallType.MULTI_PAGE_TABLE_EXTRACTION,
+            use_cache=use_cache,
+            source=_source_label(pdf_path, source),
+        )
     except Exception as e:
-        # Record failed usage
-        tracker.record_usage(key_name, success=False)
         print(f"Error extracting multi-page table: {str(e)}")
         return {"status": "error", "error": str(e)}
 
+    try:
+        parsed_json = _parse_json_response(response.text)
+    except Exception as json_error:
+        # Don't keep an unusable response around for the next run
+        get_gemini_client().discard_cached(response)
+        return {"status": "error", "error": f"JSON parsing error: {str(json_error)}", "raw_response": response.text}
+
+    return {"status": "success", "content": parsed_json}
+
 
-def detect_multiple_tables_on_page(pdf_page_path: str) -> Dict:
+async def detect_multiple_tables_on_page_async(
+    pdf_page_path: PdfInput, use_cache: bool = True, source: Optional[str] = None
+) -> Dict:
     """
     Verify if a single PDF page contains multiple distinct tables using Gemini Vision API.
 
     Args:
-        pdf_page_path: Path to the single PDF page file
+        pdf_page_path: Path to the single PDF page file, or its bytes
+        use_cache: Whether to serve identical requests from the response cache
+        source: Label recorded with the call's usage metrics, defaults to the PDF path
 
     Returns:
         Dictionary with detection results:
@@ -392,177 +424,244 @@ def detect_multiple_tables_on_page(pdf_page_path: str) -> Dict:
             "error": str | None  # Only present if status is "error"
         }
     """
-    model, key_name = init_gemini()
-    tracker = UsageTracker(service_name="gemini")
-    limiter = RateLimiter(requests_per_minute=10)
+    try:
+        pdf_data = await _load_pdf(pdf_page_path)
+        response = await get_gemini_client().generate_content(
+            MULTIPLE_TABLES_DETECTION_PROMPT,
+            pdf_data,
+            GeminiCallType.MULTIPLE_TABLES_DETECTION,
+            use_cache=use_cache,
+            source=_source_label(pdf_page_path, source),
+        )
+    except Exception as e:
+        print(f"Error detecting multiple tables on page: {str(e)}")
+        return {"status": "error", "error": str(e)}
 
-    # Apply rate limiting
-    wait_time = limiter.wait_if_needed()
-    if wait_time > 0:
-        print(f"[Rate Limiter] Waiting {wait_time:.1f}s before API call")
+    try:
+        parsed_json = _parse_json_response(response.text)
+    except Exception as json_error:
+        # Don't keep an unusable response around for the next run
+        get_gemini_client().discard_cached(response)
+        return {
+            "status": "error",
+            "error": f"JSON parsing error: {str(json_error)}",
+            "raw_response": response.text,
+        }
 
-    print(f"[Gemini API] Using key {key_name} for multiple tables detection on single page")
+    return {
+        "status": "success",
+        "has_multiple_tables": parsed_json.get("has_multiple_tables", False),
+        "table_count": parsed_json.get("table_count", 0),
+        "reasoning": parsed_json.get("reasoning", "No reasoning provided"),
+    }
 
-    try:
-        # Read the PDF file directly
-        with open(pdf_page_path, "rb") as f:
-            pdf_data = f.read()
 
-        # Prepare the prompt for multiple tables detection
-        prompt = """
-            Analyze this single page document to determine if it contains multiple distinct tables.
+async def extract_multiple_tables_from_pdf_page_async(
+    pdf_page_path: PdfInput, num_tables: int, use_cache: bool = True, source: Optional[str] = None
+) -> Dict:
+    """
+    Extract multiple tables from a PDF page using Gemini Vision API with key rotation.
 
-            Consider these criteria for what constitutes separate tables:
-            1. Tables with different column structures or headers
-            2. Tables separated by significant text content or whitespace
-            3. Tables with different purposes or data types
-            4. Tables that are clearly visually distinct from each other
+    Args:
+        pdf_page_path: Path to the PDF page file, or its bytes
+        num_tables: Expected number of tables on the page
+        use_cache: Whether to serve identical requests from the response cache
+        source: Label recorded with the call's usage metrics, defaults to the PDF path
 
-            Do NOT count as separate tables:
-            1. A single table that continues across different sections of the page
-            2. A table with sub-headers or grouped rows (still one table)
-            3. A table with summary rows at the bottom (still one table)
+    Returns:
+        Dictionary with extracted tables data in JSON format
+    """
+    try:
+        pdf_data = await _load_pdf(pdf_page_path)
+        response = await get_gemini_client().generate_content(
+            MULTIPLE_TABLES_EXTRACTION_PROMPT.format(num_tables=num_tables),
+            pdf_data,
+            GeminiCallType.MULTIPLE_TABLES_EXTRACTION,
+            use_cache=use_cache,
+            source=_source_label(pdf_page_path, source),
+        )
+    except Exception as e:
+        print(f"Error extracting multiple tables from PDF page: {str(e)}")
+        return {"status": "error", "error": str(e)}
 
-            Respond with a JSON object:
-            {
-                "has_multiple_tables": boolean,
-                "table_count": integer (total number of distinct tables found),
-                "reasoning": "brief explanation of your analysis"
-            }
+    try:
+        parsed_json = _parse_json_response(response.text)
+    except Exception as json_error:
+        # Don't keep an unusable response around for the next run
+        get_gemini_client().discard_cached(response)
+        return {"status": "error", "error": f"JSON parsing error: {str(json_error)}", "raw_response": response.text}
+
+    # Ensure the response has the expected structure
+    if not isinstance(parsed_json, dict) or "tables" not in parsed_json:
+        parsed_json = {"tables": [parsed_json]}  # Wrap in correct structure if needed
+    return {"status": "success", "content": parsed_json}
+
+
+async def extract_tables_from_pdf_pages_async(
+    pdf_path: PdfInput,
+    page_numbers: List[int],
+    tables_per_page: Dict[int, int],
+    use_cache: bool = True,
+    source: Optional[str] = None,
+) -> Dict:
+    """
+    Extract tables from several independent pages in one Gemini request.
 
-            Output only the JSON object, no additional text.
-        """
+    Args:
+        pdf_path: Path to a PDF containing exactly the given pages, in order, or its bytes
+        page_numbers: Original page numbers of the pages in the PDF
+        tables_per_page: Expected number of tables for each original page number
+        use_cache: Whether to serve identical requests from the response cache
+        source: Label recorded with the call's usage metrics, defaults to the PDF path
 
-        # Call Gemini API
-        response = model.generate_content([prompt, {"mime_type": "application/pdf", "data": pdf_data}])
-
-        # Record successful usage
-        tracker.record_usage(key_name, success=True)
-
-        # Process response
-        try:
-            extracted_text = response.text.strip()
-
-            # Try to parse JSON from the response
-            try:
-                parsed_json = json.loads(extracted_text)
-                return {
-                    "status": "success",
-                    "has_multiple_tables": parsed_json.get("has_multiple_tables", False),
-                    "table_count": parsed_json.get("table_count", 0),
-                    "reasoning": parsed_json.get("reasoning", "No reasoning provided"),
-                }
-            except json.JSONDecodeError as e:
-                # Try to clean up the response if it contains fence blocks
-                if "```json" in extracted_text:
-                    json_content = extracted_text.split("```json")[1].split("```")[0].strip()
-                    parsed_json = json.loads(json_content)
-                elif "```" in extracted_text:
-                    json_content = extracted_text.split("```")[1].split("```")[0].strip()
-                    parsed_json = json.loads(json_content)
-                else:
-                    raise ValueError(f"Failed to parse JSON: {e}") from e
-
-                return {
-                    "status": "success",
-                    "has_multiple_tables": parsed_json.get("has_multiple_tables", False),
-                    "table_count": parsed_json.get("table_count", 0),
-                    "reasoning": parsed_json.get("reasoning", "No reasoning provided"),
-                }
-        except Exception as json_error:
-            return {
-                "status": "error",
-                "error": f"JSON parsing error: {str(json_error)}",
-                "raw_response": response.text,
-            }
+    Returns:
+        Dictionary with the tables of each original page:
+        {
+            "status": "success" | "error",
+            "content": Dict[int, List[List[Dict]]] | None,  # page number -> list of tables (lists of rows)
+            "error": str | None  # Only present if status is "error"
+        }
+        Pages missing from the response are left out of "content".
+    """
+    page_expectations = "\n".join(
+        f"            - Page {position}: {tables_per_page.get(page_num, 1)} table(s)"
+        for position, page_num in enumerate(page_numbers, start=1)
+    )
+    prompt = BATCH_TABLE_EXTRACTION_PROMPT.format(num_pages=len(page_numbers), page_expectations=page_expectations)
 
+    try:
+        pdf_data = await _load_pdf(pdf_path)
+        response = await get_gemini_client().generate_content(
+            prompt,
+            pdf_data,
+            GeminiCallType.BATCH_TABLE_EXTRACTION,
+            use_cache=use_cache,
+            source=_source_label(pdf_path, source),
+        )
     except Exception as e:
-        # Record failed usage
-        tracker.record_usage(key_name, success=False)
-        print(f"Error detecting multiple tables on page: {str(e)}")
+        print(f"Error extracting tables from PDF pages {page_numbers}: {str(e)}")
         return {"status": "error", "error": str(e)}
 
-
-def extract_multiple_tables_from_pdf_page(pdf_page_path: str, num_tables: int) -> Dict:
+    try:
+        parsed_json = _parse_json_response(response.text)
+        tables_by_page: Dict[int, List[Any]] = {}
+        for page_entry in parsed_json.get("pages", []):
+            position = int(page_entry.get("page", 0))
+            if 1 <= position <= len(page_numbers):
+                tables_by_page[page_numbers[position - 1]] = page_entry.get("tables", [])
+    except Exception as json_error:
+        get_gemini_client().discard_cached(response)
+        return {"status": "error", "error": f"JSON parsing error: {str(json_error)}", "raw_response": response.text}
+
+    return {"status": "success", "content": tables_by_page}
+
+
+async def extract_text_and_tables_from_pdf_page_async(
+    pdf_page_path: PdfInput, num_tables: int = 1, use_cache: bool = True, source: Optional[str] = None
+) -> Dict:
     """
-    Extract multiple tables from a PDF page using Gemini Vision API with key rotation.
+    Extract markdown text and structured tables from a PDF page in one Gemini request.
 
     Args:
-        pdf_page_path: Path to the PDF page file
+        pdf_page_path: Path to the PDF page file, or its bytes
         num_tables: Expected number of tables on the page
+        use_cache: Whether to serve identical requests from the response cache
+        source: Label recorded with the call's usage metrics, defaults to the PDF path
 
     Returns:
-        Dictionary with extracted tables data in JSON format
+        Dictionary with extraction results:
+        {
+            "status": "success" | "error",
+            "content": {"text": str, "tables": List[List[Dict]]} | None,
+            "error": str | None  # Only present if status is "error"
+        }
     """
-    model, key_name = init_gemini()
-    tracker = UsageTracker(service_name="gemini")
-    limiter = RateLimiter(requests_per_minute=10)
+    try:
+        pdf_data = await _load_pdf(pdf_page_path)
+        response = await get_gemini_client().generate_content(
+            COMBINED_EXTRACTION_PROMPT.format(num_tables=num_tables),
+            pdf_data,
+            GeminiCallType.COMBINED_EXTRACTION,
+            use_cache=use_cache,
+            source=_source_label(pdf_page_path, source),
+        )
+    except Exception as e:
+        print(f"Error extracting text and tables from PDF page: {str(e)}")
+        return {"status": "error", "error": str(e)}
 
-    # Apply rate limiting
-    wait_time = limiter.wait_if_needed()
-    if wait_time > 0:
-        print(f"[Rate Limiter] Waiting {wait_time:.1f}s before API call")
+    try:
+        parsed_json = _parse_json_response(response.text)
+        text = parsed_json["text"]
+        tables = parsed_json.get("tables", [])
+        if not isinstance(text, str) or not isinstance(tables, list):
+            raise ValueError("Response must contain a 'text' string and a 'tables' array")
+    except Exception as json_error:
+        get_gemini_client().discard_cached(response)
+        return {"status": "error", "error": f"JSON parsing error: {str(json_error)}", "raw_response": response.text}
 
-    print(f"[Gemini API] Using key {key_name} for multiple tables extraction")
+    return {"status": "success", "content": {"text": text.strip(), "tables": tables}}
 
-    try:
-        # Read the PDF file directly
-        with open(pdf_page_path, "rb") as f:
-            pdf_data = f.read()
 
-        # Prepare the prompt for multiple tables extraction
-        prompt = f"""
-            Analyze the document and identify {num_tables} distinct tables.
-            For each table:
-            1. Extract its rows as an array of objects
-            2. Use the column headers as keys for each row object
-            3. Preserve the exact header text for keys
-            4. Keep each table's data separate from other tables
+# ===============================
+# SYNC API (thin wrappers)
+# ===============================
 
-            Generate a JSON object with a "tables" key containing an array where:
-            - Each element is a complete table (array of row objects)
-            - Tables appear in the same order as in the document
-            - Tables remain separate and distinct from each other
 
-            Output only the final JSON object."""
+def extract_text_from_pdf_page(pdf_page_path: PdfInput, use_cache: bool = True, source: Optional[str] = None) -> Dict:
+    """Blocking wrapper around extract_text_from_pdf_page_async."""
+    return get_gemini_client().run_sync(extract_text_from_pdf_page_async(pdf_page_path, use_cache, source))
 
-        # Call Gemini API
-        response = model.generate_content([prompt, {"mime_type": "application/pdf", "data": pdf_data}])
-
-        # Record successful usage
-        tracker.record_usage(key_name, success=True)
-
-        # Process response - handle potential JSON parsing issues carefully
-        try:
-            extracted_text = response.text.strip()
-
-            # Try to parse JSON from the response
-            try:
-                parsed_json = json.loads(extracted_text)
-                # Ensure the response has the expected structure
-                if not isinstance(parsed_json, dict) or "tables" not in parsed_json:
-                    parsed_json = {"tables": [parsed_json]}  # Wrap in correct structure if needed
-                return {"status": "success", "content": parsed_json}
-            except json.JSONDecodeError as e:
-                # Try to clean up the response if it contains fence blocks
-                if "```json" in extracted_text:
-                    json_content = extracted_text.split("```json")[1].split("```")[0].strip()
-                    parsed_json = json.loads(json_content)
-                elif "```" in extracted_text:
-                    json_content = extracted_text.split("```")[1].split("```")[0].strip()
-                    parsed_json = json.loads(json_content)
-                else:
-                    raise ValueError(f"Failed to parse JSON: {e}") from e
-
-                if not isinstance(parsed_json, dict) or "tables" not in parsed_json:
-                    parsed_json = {"tables": [parsed_json]}
-                return {"status": "success", "content": parsed_json}
-        except Exception as json_error:
-            return {"status": "error", "error": f"JSON parsing error: {str(json_error)}", "raw_response": response.text}
 
-    except Exception as e:
-        # Record failed usage
-        tracker.record_usage(key_name, success=False)
+def extract_tables_from_pdf_page(pdf_page_path: PdfInput, use_cache: bool = True, source: Optional[str] = None) -> Dict:
+    """Blocking wrapper around extract_tables_from_pdf_page_async."""
+    return get_gemini_client().run_sync(extract_tables_from_pdf_page_async(pdf_page_path, use_cache, source))
 
-        print(f"Error extracting multiple tables from PDF page: {str(e)}")
-        return {"status": "error", "error": str(e)}
+
+def detect_multi_page_tables(
+    pdf_path: PdfInput, use_cache: bool = True, source: Optional[str] = None
+) -> MultiPageTableDetectionResult:
+    """Blocking wrapper around detect_multi_page_tables_async."""
+    return get_gemini_client().run_sync(detect_multi_page_tables_async(pdf_path, use_cache, source))
+
+
+def extract_multi_page_table(pdf_path: PdfInput, use_cache: bool = True, source: Optional[str] = None) -> Dict:
+    """Blocking wrapper around extract_multi_page_table_async."""
+    return get_gemini_client().run_sync(extract_multi_page_table_async(pdf_path, use_cache, source))
+
+
+def detect_multiple_tables_on_page(
+    pdf_page_path: PdfInput, use_cache: bool = True, source: Optional[str] = None
+) -> Dict:
+    """Blocking wrapper around detect_multiple_tables_on_page_async."""
+    return get_gemini_client().run_sync(detect_multiple_tables_on_page_async(pdf_page_path, use_cache, source))
+
+
+def extract_multiple_tables_from_pdf_page(
+    pdf_page_path: PdfInput, num_tables: int, use_cache: bool = True, source: Optional[str] = None
+) -> Dict:
+    """Blocking wrapper around extract_multiple_tables_from_pdf_page_async."""
+    return get_gemini_client().run_sync(
+        extract_multiple_tables_from_pdf_page_async(pdf_page_path, num_tables, use_cache, source)
+    )
+
+
+def extract_tables_from_pdf_pages(
+    pdf_path: PdfInput,
+    page_numbers: List[int],
+    tables_per_page: Dict[int, int],
+    use_cache: bool = True,
+    source: Optional[str] = None,
+) -> Dict:
+    """Blocking wrapper around extract_tables_from_pdf_pages_async."""
+    return get_gemini_client().run_sync(
+        extract_tables_from_pdf_pages_async(pdf_path, page_numbers, tables_per_page, use_cache, source)
+    )
+
+
+def extract_text_and_tables_from_pdf_page(
+    pdf_page_path: PdfInput, num_tables: int = 1, use_cache: bool = True, source: Optional[str] = None
+) -> Dict:
+    """Blocking wrapper around extract_text_and_tables_from_pdf_page_async."""
+    return get_gemini_client().run_sync(
+        extract_text_and_tables_from_pdf_page_async(pdf_page_path, num_tables, use_cache, source)
+    )
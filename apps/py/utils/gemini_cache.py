@@ -0,0 +1,224 @@
+"""
+Disk-backed, content-addressed cache for Gemini responses.
+
+Entries are keyed on a hash of the PDF bytes, the prompt, the model name and the call type,
+so re-running extraction on unchanged pages is served from disk without using API quota.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import json_codec
+from .project_root import find_project_root
+
+
+class GeminiCacheConfig:
+    """Configuration constants for the Gemini response cache."""
+
+    # Cache location, defaults to <project root>/cache/gemini_responses
+    CACHE_DIR = os.getenv("GEMINI_CACHE_DIR")
+    DEFAULT_CACHE_SUBDIR = Path("cache") / "gemini_responses"
+
+    # Set GEMINI_CACHE_BYPASS=1 to always call the API
+    BYPASS = os.getenv("GEMINI_CACHE_BYPASS", "").lower() in ("1", "true", "yes")
+
+    # Eviction limits
+    MAX_SIZE_BYTES = int(os.getenv("GEMINI_CACHE_MAX_SIZE_MB", "512")) * 1024 * 1024
+    MAX_AGE_SECONDS = int(os.getenv("GEMINI_CACHE_MAX_AGE_DAYS", "30")) * 24 * 60 * 60
+
+    # Run eviction after this many writes
+    EVICTION_INTERVAL = 50
+
+    ENTRY_SUFFIX = ".json"
+
+
+def compute_cache_key(pdf_data: bytes, prompt: str, model_name: str, call_type: str) -> str:
+    """
+    Compute the cache key for a Gemini call.
+
+    Args:
+        pdf_data: PDF bytes sent with the prompt
+        prompt: Prompt text
+        model_name: Gemini model name
+        call_type: Kind of call (e.g. "table_extraction")
+
+    Returns:
+        Hex digest identifying the request
+    """
+    digest = hashlib.sha256()
+    for part in (model_name, call_type, prompt):
+        encoded = part.encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    digest.update(hashlib.sha256(pdf_data).digest())
+    return digest.hexdigest()
+
+
+class GeminiResponseCache:
+    """
+    Content-addressed response cache stored as one JSON file per entry.
+
+    Entries older than `max_age_seconds` (by the "created_at" time stored in the entry) are ignored
+    and removed; when the cache grows beyond `max_size_bytes` the least recently used entries are
+    removed first. A file's mtime is refreshed on every hit and only serves as the LRU signal.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_size_bytes: int = GeminiCacheConfig.MAX_SIZE_BYTES,
+        max_age_seconds: int = GeminiCacheConfig.MAX_AGE_SECONDS,
+        enabled: bool = not GeminiCacheConfig.BYPASS,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries
+            max_size_bytes: Maximum total size of cached entries
+            max_age_seconds: Maximum age of a cached entry
+            enabled: Whether lookups and writes are performed at all
+        """
+        if cache_dir is None:
+            cache_dir = (
+                Path(GeminiCacheConfig.CACHE_DIR)
+                if GeminiCacheConfig.CACHE_DIR
+                else Path(find_project_root()) / GeminiCacheConfig.DEFAULT_CACHE_SUBDIR
+            )
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+        self.max_age_seconds = max_age_seconds
+        self.enabled = enabled
+
+        self._writes_since_eviction = 0
+        self._lock = threading.Lock()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{GeminiCacheConfig.ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached entry.
+
+        Args:
+            key: Cache key from compute_cache_key
+
+        Returns:
+            The cached entry (with at least "text", "key_name" and "created_at"), or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json_codec.load(f)
+            # Entries written before "created_at" was stored have no reliable age; treat them as expired
+            created_at = entry.get("created_at")
+            if not isinstance(created_at, (int, float)) or time.time() - created_at > self.max_age_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            # Refresh mtime so size eviction drops least recently used entries first
+            os.utime(path)
+            return entry
+        except (OSError, json_codec.JSONDecodeError):
+            return None
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store an entry atomically.
+
+        Args:
+            key: Cache key from compute_cache_key
+            entry: JSON-serializable entry; its creation time is stored with it as "created_at"
+        """
+        if not self.enabled:
+            return
+
+        entry = {**entry, "created_at": time.time()}
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json_codec.dump(entry, f)
+            os.replace(temp_path, path)
+        except OSError as e:
+            temp_path.unlink(missing_ok=True)
+            print(f"[Gemini Cache] Failed to write cache entry: {e}")
+            return
+
+        with self._lock:
+            self._writes_since_eviction += 1
+            run_eviction = self._writes_since_eviction >= GeminiCacheConfig.EVICTION_INTERVAL
+            if run_eviction:
+                self._writes_since_eviction = 0
+        if run_eviction:
+            self.evict()
+
+    def discard(self, key: str) -> None:
+        """Remove an entry, e.g. when its response turned out to be unusable."""
+        self._entry_path(key).unlink(missing_ok=True)
+
+    def evict(self) -> int:
+        """
+        Remove expired entries, then least recently used entries until under the size limit.
+
+        Only entries idle for longer than the maximum age are removed as expired here: an entry is
+        never younger than its last use, so that needs no file reads. Older entries that are still in
+        use are removed by get() on their next hit.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.cache_dir.exists():
+            return 0
+
+        now = time.time()
+        removed = 0
+        entries: List[Tuple[float, int, Path]] = []
+
+        for path in self.cache_dir.glob(f"*/*{GeminiCacheConfig.ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.max_age_seconds:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        if total_size > self.max_size_bytes:
+            for _, size, path in sorted(entries):
+                path.unlink(missing_ok=True)
+                removed += 1
+                total_size -= size
+                if total_size <= self.max_size_bytes:
+                    break
+
+        return removed
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        for path in self.cache_dir.glob(f"*/*{GeminiCacheConfig.ENTRY_SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+
+# Module-level instance
+_cache: Optional[GeminiResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_gemini_cache() -> GeminiResponseCache:
+    """Get the process-wide Gemini response cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = GeminiResponseCache()
+        return _cache
@@ -0,0 +1,359 @@
+"""
+Asyncio-native Gemini client with bounded concurrency.
+
+All requests run on a single background event loop owned by the client. This keeps the
+concurrency limits (per process and per API key) and the underlying HTTP clients bound to
+one loop, so the client can be awaited from any event loop (FastAPI, Temporal worker,
+orchestrator) and called synchronously from plain threads through `run_sync`.
+"""
+
+import asyncio
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future
+from enum import Enum
+from typing import Any, Coroutine, Dict, Optional, TypeVar
+
+from google import genai
+from google.genai import types
+from pydantic import BaseModel
+
+from apps.py.llm_api_key import KeyManager, get_rate_limiter
+from apps.py.llm_api_key.usage_tracker import UsageTracker
+
+from .gemini_cache import GeminiResponseCache, compute_cache_key, get_gemini_cache
+
+T = TypeVar("T")
+
+
+class GeminiClientConfig:
+    """Configuration constants for the Gemini client."""
+
+    MODEL_NAME = "gemini-2.0-flash"
+    SERVICE_NAME = "gemini"
+    PDF_MIME_TYPE = "application/pdf"
+
+    # In-flight request limits, overridable through the environment
+    MAX_CONCURRENT_REQUESTS = int(os.getenv("GEMINI_MAX_CONCURRENT_REQUESTS", "8"))
+    MAX_CONCURRENT_REQUESTS_PER_KEY = int(os.getenv("GEMINI_MAX_CONCURRENT_REQUESTS_PER_KEY", "2"))
+
+    # Per-key request rate, shared by every call site in the process
+    REQUESTS_PER_MINUTE_PER_KEY = int(os.getenv("GEMINI_REQUESTS_PER_MINUTE_PER_KEY", "10"))
+
+    # Attempts per request when the provider throttles a key (429), each on the least-loaded key
+    MAX_RATE_LIMIT_ATTEMPTS = 3
+
+    LOOP_THREAD_NAME = "gemini-client-loop"
+
+
+class GeminiCallType(Enum):
+    """Kinds of Gemini calls made by the extraction pipeline."""
+
+    TEXT_EXTRACTION = "text_extraction"
+    TABLE_EXTRACTION = "table_extraction"
+    MULTI_PAGE_TABLE_DETECTION = "multi_page_table_detection"
+    MULTI_PAGE_TABLE_EXTRACTION = "multi_page_table_extraction"
+    MULTIPLE_TABLES_DETECTION = "multiple_tables_detection"
+    MULTIPLE_TABLES_EXTRACTION = "multiple_tables_extraction"
+    BATCH_TABLE_EXTRACTION = "batch_table_extraction"
+    COMBINED_EXTRACTION = "combined_extraction"
+
+    @property
+    def description(self) -> str:
+        """Human readable description used in log lines."""
+        return self.value.replace("_", " ")
+
+
+class GeminiResponse(BaseModel):
+    """Text response from a Gemini call along with the key that served it."""
+
+    text: str
+    key_name: str
+    call_type: GeminiCallType
+    from_cache: bool = False
+    cache_key: Optional[str] = None
+
+    # Accounting for the API call (zero for cache hits)
+    prompt_tokens: int = 0
+    response_tokens: int = 0
+    total_tokens: int = 0
+    latency_ms: float = 0.0
+    payload_bytes: int = 0
+    retries: int = 0
+
+
+class GeminiClient:
+    """
+    Process-wide Gemini client that bounds the number of in-flight requests.
+
+    Usage:
+        client = get_gemini_client()
+        response = await client.generate_content(prompt, pdf_data, GeminiCallType.TEXT_EXTRACTION)
+    """
+
+    def __init__(
+        self,
+        key_manager: Optional[KeyManager] = None,
+        model_name: str = GeminiClientConfig.MODEL_NAME,
+        max_concurrent_requests: int = GeminiClientConfig.MAX_CONCURRENT_REQUESTS,
+        max_concurrent_requests_per_key: int = GeminiClientConfig.MAX_CONCURRENT_REQUESTS_PER_KEY,
+        cache: Optional[GeminiResponseCache] = None,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            key_manager: Key manager used for key rotation. Created lazily if not provided.
+            model_name: Gemini model to call
+            max_concurrent_requests: Maximum in-flight requests for the whole process
+            max_concurrent_requests_per_key: Maximum in-flight requests per API key
+            cache: Response cache. Defaults to the process-wide disk cache.
+        """
+        if max_concurrent_requests < 1 or max_concurrent_requests_per_key < 1:
+            raise ValueError("Concurrency limits must be at least 1")
+
+        self._key_manager = key_manager
+        self._cache = cache
+        self.model_name = model_name
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_concurrent_requests_per_key = max_concurrent_requests_per_key
+
+        # Loop-bound state, only touched from the background loop thread
+        self._process_semaphore: Optional[asyncio.Semaphore] = None
+        self._key_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._clients: Dict[str, genai.Client] = {}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
+    @property
+    def key_manager(self) -> KeyManager:
+        """Key manager, created on first use so importing this module needs no API keys."""
+        if self._key_manager is None:
+            self._key_manager = KeyManager(
+                service_name=GeminiClientConfig.SERVICE_NAME,
+                requests_per_minute=GeminiClientConfig.REQUESTS_PER_MINUTE_PER_KEY,
+            )
+        return self._key_manager
+
+    @property
+    def cache(self) -> GeminiResponseCache:
+        """Response cache, the process-wide disk cache unless one was injected."""
+        if self._cache is None:
+            self._cache = get_gemini_cache()
+        return self._cache
+
+    # ===============================
+    # EVENT LOOP MANAGEMENT
+    # ===============================
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop on first use."""
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name=GeminiClientConfig.LOOP_THREAD_NAME, daemon=True
+                )
+                thread.start()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+        """Schedule a coroutine on the client loop and return a concurrent future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def run_sync(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the client loop and block until it finishes.
+
+        Safe to call from threads that already run their own event loop.
+        """
+        loop = self._ensure_loop()
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            coro.close()
+            raise RuntimeError("run_sync cannot be called from the Gemini client loop; await the coroutine instead")
+        return self.submit(coro).result()
+
+    # ===============================
+    # REQUESTS
+    # ===============================
+
+    async def generate_content(
+        self,
+        prompt: str,
+        pdf_data: bytes,
+        call_type: GeminiCallType,
+        use_cache: bool = True,
+        source: Optional[str] = None,
+    ) -> GeminiResponse:
+        """
+        Send a prompt with a PDF attachment to Gemini.
+
+        Can be awaited from any event loop; the request itself runs on the client loop.
+        Identical requests are answered from the response cache unless use_cache is False.
+
+        Args:
+            prompt: Prompt text
+            pdf_data: PDF file contents
+            call_type: Kind of call, used for logging and accounting
+            use_cache: Whether to read from and write to the response cache
+            source: What the request is about (e.g. the page PDF path), recorded in usage events
+
+        Returns:
+            GeminiResponse with the response text, the key that served it and token/latency accounting
+
+        Raises:
+            Exception: Whatever the Gemini SDK raised, after recording the failed call
+        """
+        future = self.submit(self._generate_content(prompt, pdf_data, call_type, use_cache, source))
+        return await asyncio.wrap_future(future)
+
+    def discard_cached(self, response: GeminiResponse) -> None:
+        """
+        Drop the cache entry behind a response, e.g. when the response could not be parsed.
+
+        Args:
+            response: Response returned by generate_content
+        """
+        if response.cache_key:
+            self.cache.discard(response.cache_key)
+
+    async def _generate_content(
+        self, prompt: str, pdf_data: bytes, call_type: GeminiCallType, use_cache: bool, source: Optional[str]
+    ) -> GeminiResponse:
+        """Request implementation, always executed on the client loop."""
+        cache_key = None
+        if use_cache and self.cache.enabled:
+            cache_key = compute_cache_key(pdf_data, prompt, self.model_name, call_type.value)
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                print(f"[Gemini API] Cache hit for {call_type.description}")
+                return GeminiResponse(
+                    text=cached["text"],
+                    key_name=cached.get("key_name", ""),
+                    call_type=call_type,
+                    from_cache=True,
+                    cache_key=cache_key,
+                )
+
+        tracker = UsageTracker.get_instance(GeminiClientConfig.SERVICE_NAME)
+        payload_bytes = len(pdf_data) + len(prompt.encode("utf-8"))
+        metrics = {"call_type": call_type.value, "payload_bytes": payload_bytes, "source": source}
+
+        for attempt in range(1, GeminiClientConfig.MAX_RATE_LIMIT_ATTEMPTS + 1):
+            # With shared state, key selection runs SQLite transactions that can wait on other processes;
+            # keep it off the event loop so other in-flight requests aren't stalled
+            selection = await asyncio.to_thread(self.key_manager.select_key)
+            key_name = selection.key_name
+            if selection.wait_seconds > 0:
+                print(f"[API Key Manager] All keys saturated, waiting {selection.wait_seconds:.1f}s for {key_name}")
+                await asyncio.sleep(selection.wait_seconds)
+
+            limiter = get_rate_limiter(
+                GeminiClientConfig.SERVICE_NAME,
+                key_name,
+                requests_per_minute=GeminiClientConfig.REQUESTS_PER_MINUTE_PER_KEY,
+            )
+            wait_time = await limiter.acquire_async()
+            if wait_time > 0:
+                print(f"[Rate Limiter] Waited {wait_time:.1f}s before API call with key {key_name}")
+
+            async with self._get_process_semaphore(), self._get_key_semaphore(key_name):
+                print(f"[Gemini API] Using key {key_name} for {call_type.description}")
+                metrics["retries"] = attempt - 1
+                started = time.perf_counter()
+                try:
+                    response = await self._get_client(key_name, selection.key_value).aio.models.generate_content(
+                        model=self.model_name,
+                        contents=[
+                            prompt,
+                            types.Part.from_bytes(data=pdf_data, mime_type=GeminiClientConfig.PDF_MIME_TYPE),
+                        ],
+                    )
+                except Exception as e:
+                    metrics["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                    tracker.record_usage(key_name, success=False, metrics=metrics)
+                    if not _is_rate_limit_error(e) or attempt == GeminiClientConfig.MAX_RATE_LIMIT_ATTEMPTS:
+                        raise
+                    await asyncio.to_thread(self.key_manager.report_rate_limited, key_name, _retry_after_seconds(e))
+                    continue
+
+            metrics["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            metrics.update(_token_counts(response))
+            tracker.record_usage(key_name, success=True, cost=metrics["total_tokens"], metrics=metrics)
+            text = response.text or ""
+
+            if cache_key is not None and text:
+                await asyncio.to_thread(self.cache.put, cache_key, {"text": text, "key_name": key_name})
+
+            return GeminiResponse(
+                text=text,
+                key_name=key_name,
+                call_type=call_type,
+                cache_key=cache_key,
+                prompt_tokens=metrics["prompt_tokens"],
+                response_tokens=metrics["response_tokens"],
+                total_tokens=metrics["total_tokens"],
+                latency_ms=metrics["latency_ms"],
+                payload_bytes=payload_bytes,
+                retries=metrics["retries"],
+            )
+
+        raise RuntimeError("Gemini request was not attempted")
+
+    def _get_process_semaphore(self) -> asyncio.Semaphore:
+        if self._process_semaphore is None:
+            self._process_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        return self._process_semaphore
+
+    def _get_key_semaphore(self, key_name: str) -> asyncio.Semaphore:
+        if key_name not in self._key_semaphores:
+            self._key_semaphores[key_name] = asyncio.Semaphore(self.max_concurrent_requests_per_key)
+        return self._key_semaphores[key_name]
+
+    def _get_client(self, key_name: str, api_key: str) -> genai.Client:
+        """One SDK client per key, so concurrent calls never share a global key configuration."""
+        if key_name not in self._clients:
+            self._clients[key_name] = genai.Client(api_key=api_key)
+        return self._clients[key_name]
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Whether the provider rejected the request because the key is throttled."""
+    return getattr(error, "code", None) == 429 or "RESOURCE_EXHAUSTED" in str(error)
+
+
+def _token_counts(response: Any) -> Dict[str, int]:
+    """Prompt, response and total token counts from a response's usage metadata."""
+    usage = getattr(response, "usage_metadata", None)
+    prompt_tokens = getattr(usage, "prompt_token_count", None) or 0
+    response_tokens = getattr(usage, "candidates_token_count", None) or 0
+    total_tokens = getattr(usage, "total_token_count", None) or prompt_tokens + response_tokens
+    return {"prompt_tokens": prompt_tokens, "response_tokens": response_tokens, "total_tokens": total_tokens}
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Retry delay suggested by the provider in a 429 response, if any."""
+    match = re.search(r"retryDelay['\"]?\s*:\s*['\"]?(\d+(?:\.\d+)?)s", str(error))
+    return float(match.group(1)) if match else None
+
+
+# Module-level instance
+_client: Optional[GeminiClient] = None
+_client_lock = threading.Lock()
+
+
+def get_gemini_client() -> GeminiClient:
+    """Get the process-wide Gemini client."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = GeminiClient()
+        return _client
@@ -0,0 +1,187 @@
+"""
+JSON encoding and decoding for the files and messages the pipeline reads and writes.
+
+Uses orjson when it is installed (pip install orjson): it encodes and decodes several times faster
+than the stdlib json module and handles datetimes, enums and numpy values natively. Without it the
+stdlib module is used with the same conventions, so both backends write the same bytes:
+
+- pretty=True for files people read or edit (progress files, table JSON, reports): 2-space indent
+- pretty=False for machine-only files and messages (journals, caches, event logs): no whitespace
+- UTF-8 output (non-ASCII text such as Hindi is written as-is, not as \\u escapes)
+- datetimes and dates as ISO 8601, enums as their value, Paths and other objects as str()
+- numpy scalars and arrays as numbers and lists; NaN and infinities as null
+"""
+
+import json
+import math
+import os
+import sys
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import IO, Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONCodecConfig:
+    """Configuration constants for JSON encoding and decoding."""
+
+    # "orjson" when installed, else "json"; set JSON_CODEC_BACKEND=json to force the stdlib module
+    BACKEND = os.getenv("JSON_CODEC_BACKEND", "orjson" if orjson is not None else "json")
+    PRETTY_INDENT = 2
+
+
+# orjson.JSONDecodeError subclasses this, so callers can catch one exception for either backend
+JSONDecodeError = json.JSONDecodeError
+
+_use_orjson = orjson is not None and JSONCodecConfig.BACKEND == "orjson"
+
+
+def _default(obj: Any) -> Any:
+    """Encode values JSON has no type for; orjson handles datetimes, enums and numpy itself and only sees the rest."""
+    # numpy values can only exist once numpy has been imported, so there is no need to import it here
+    numpy = sys.modules.get("numpy")
+    if numpy is not None:
+        if isinstance(obj, numpy.ndarray):
+            if obj.dtype.kind == "f" and obj.dtype.itemsize < 8:
+                # Shortest repr of each float32/float16, as orjson writes them (0.1, not 0.10000000149011612)
+                obj = obj.astype(str).astype(float)
+            return obj.tolist()
+        if isinstance(obj, numpy.floating) and obj.dtype.itemsize < 8:
+            return float(str(obj))
+        if isinstance(obj, numpy.generic):
+            return obj.item()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+def dumpb(obj: Any, pretty: bool = False, sort_keys: bool = False, default: Optional[Callable] = None) -> bytes:
+    """
+    Encode a value as UTF-8 JSON bytes.
+
+    Args:
+        obj: Value to encode
+        pretty: Indent for people to read; compact otherwise
+        sort_keys: Sort object keys
+        default: Fallback for values the codec can't encode (defaults to the module's)
+
+    Returns:
+        The encoded JSON
+    """
+    default = default or _default
+    if _use_orjson:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError as e:
+            if "64-bit" not in str(e):
+                raise
+            # orjson only encodes 64-bit integers; the stdlib encoder writes the same JSON for the rest
+    return _stdlib_dumps(obj, pretty, sort_keys, default).encode("utf-8")
+
+
+def dumps(obj: Any, pretty: bool = False, sort_keys: bool = False, default: Optional[Callable] = None) -> str:
+    """
+    Encode a value as a JSON string.
+
+    Args:
+        obj: Value to encode
+        pretty: Indent for people to read; compact otherwise
+        sort_keys: Sort object keys
+        default: Fallback for values the codec can't encode (defaults to the module's)
+
+    Returns:
+        The encoded JSON
+    """
+    if _use_orjson:
+        return dumpb(obj, pretty=pretty, sort_keys=sort_keys, default=default).decode("utf-8")
+    return _stdlib_dumps(obj, pretty, sort_keys, default or _default)
+
+
+def _stdlib_dumps(obj: Any, pretty: bool, sort_keys: bool, default: Callable) -> str:
+    """Encode with the stdlib json module, following the same conventions as orjson."""
+
+    def encode(value: Any) -> str:
+        return json.dumps(
+            value,
+            indent=JSONCodecConfig.PRETTY_INDENT if pretty else None,
+            separators=(",", ": ") if pretty else (",", ":"),
+            sort_keys=sort_keys,
+            ensure_ascii=False,
+            allow_nan=False,
+            default=lambda item: _finite(default(item)),
+        )
+
+    try:
+        return encode(obj)
+    except ValueError as e:
+        if "float" not in str(e):
+            raise
+        # NaN or an infinity somewhere; written as null like orjson does, instead of the invalid NaN
+        return encode(_finite(obj))
+
+
+def _finite(value: Any) -> Any:
+    """Copy of JSON-shaped data with NaN and infinities replaced by None."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """
+    Decode JSON.
+
+    Args:
+        data: JSON text or UTF-8 bytes
+
+    Returns:
+        The decoded value
+
+    Raises:
+        JSONDecodeError: If data is not valid JSON
+    """
+    if _use_orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump(obj: Any, file: IO[str], pretty: bool = False, sort_keys: bool = False) -> None:
+    """Encode a value as JSON into a text file opened with encoding="utf-8"."""
+    file.write(dumps(obj, pretty=pretty, sort_keys=sort_keys))
+
+
+def load(file: Union[IO[str], IO[bytes]]) -> Any:
+    """Decode JSON from an open file."""
+    return loads(file.read())
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Read and decode a JSON file."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def write_json(path: Union[str, Path], obj: Any, pretty: bool = True) -> None:
+    """Encode a value and write it to a JSON file (pretty by default, for files people open)."""
+    with open(path, "wb") as f:
+        f.write(dumpb(obj, pretty=pretty))
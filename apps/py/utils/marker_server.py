@@ -0,0 +1,218 @@
+"""
+Long-lived local server that keeps Marker models loaded.
+
+Loading Marker's torch models takes seconds to minutes, and every CLI run, API process and
+metadata analysis pays for it again. Start the server once:
+
+    python -m apps.py.utils.marker_server
+
+then use the "marker_client" extractor type (or set PDF_EXTRACTOR_TYPE=marker_client) to send
+PDFs to it. The server listens on a Unix socket; each connection carries one request and one
+response, both a single line of JSON:
+
+    {"action": "convert", "paths": ["/abs/a.pdf", ...], "output": "markdown" | "metadata"}
+    -> {"status": "success", "results": [{"path": ..., "status": "success", "markdown": ...}, ...]}
+
+    {"action": "ping"} -> {"status": "success"}
+"""
+
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from . import json_codec
+from .pdf_extractors import get_marker_converter
+
+
+class MarkerServerConfig:
+    """Configuration constants for the marker server and its client."""
+
+    SOCKET_PATH = os.getenv("MARKER_SERVER_SOCKET", str(Path(tempfile.gettempdir()) / "loksabha_marker_server.sock"))
+
+    # Converted markdown for a batch can be large
+    STREAM_LIMIT_BYTES = 256 * 1024 * 1024
+
+    CONNECT_TIMEOUT_SECONDS = 5
+    # Marker can take minutes on a long PDF, and a batch holds the connection until it finishes
+    REQUEST_TIMEOUT_SECONDS = int(os.getenv("MARKER_SERVER_TIMEOUT_SECONDS", "3600"))
+
+    OUTPUT_MARKDOWN = "markdown"
+    OUTPUT_METADATA = "metadata"
+
+
+class MarkerServerError(Exception):
+    """Raised when the marker server is unreachable or rejects a request."""
+
+    pass
+
+
+class MarkerServer:
+    """Unix socket server converting PDFs with one warm set of Marker models."""
+
+    def __init__(self, socket_path: Optional[str] = None):
+        """
+        Initialize the server.
+
+        Args:
+            socket_path: Unix socket to listen on. Defaults to MARKER_SERVER_SOCKET
+        """
+        self.socket_path = socket_path or MarkerServerConfig.SOCKET_PATH
+        # Marker runs one conversion at a time; the models are not safe to share between threads
+        self._convert_lock = asyncio.Lock()
+
+    def _convert_batch(self, paths: List[str], output: str) -> List[Dict[str, Any]]:
+        """Convert PDFs one after another; a failing PDF doesn't fail the rest of the batch."""
+        converter = get_marker_converter(metadata=output == MarkerServerConfig.OUTPUT_METADATA)
+        results = []
+        for path in paths:
+            try:
+                rendered = converter(str(path))
+                value = rendered.metadata if output == MarkerServerConfig.OUTPUT_METADATA else rendered.markdown
+                results.append({"path": path, "status": "success", output: value})
+            except Exception as e:
+                results.append({"path": path, "status": "error", "error": str(e)})
+        return results
+
+    async def _handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        action = request.get("action")
+        if action == "ping":
+            return {"status": "success"}
+
+        if action == "convert":
+            paths = request.get("paths") or []
+            output = request.get("output", MarkerServerConfig.OUTPUT_MARKDOWN)
+            if output not in (MarkerServerConfig.OUTPUT_MARKDOWN, MarkerServerConfig.OUTPUT_METADATA):
+                return {"status": "error", "error": f"Unsupported output '{output}'"}
+
+            async with self._convert_lock:
+                print(f"[Marker Server] Converting {len(paths)} PDF(s) to {output}")
+                results = await asyncio.to_thread(self._convert_batch, paths, output)
+            return {"status": "success", "results": results}
+
+        return {"status": "error", "error": f"Unsupported action '{action}'"}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            line = await reader.readline()
+            try:
+                response = await self._handle_request(json_codec.loads(line))
+            except json_codec.JSONDecodeError as e:
+                response = {"status": "error", "error": f"Invalid request: {e}"}
+            # Marker metadata can hold values json doesn't know, such as numpy numbers; the codec encodes them
+            writer.write(json_codec.dumpb(response) + b"\n")
+            await writer.drain()
+        except Exception as e:
+            print(f"[Marker Server] Error handling request: {e}")
+        finally:
+            writer.close()
+
+    async def _remove_stale_socket(self) -> None:
+        """Remove a socket file left behind by a server that is no longer running."""
+        if not os.path.exists(self.socket_path):
+            return
+        if await MarkerServerClient(self.socket_path).ping():
+            raise MarkerServerError(f"A marker server is already running on {self.socket_path}")
+        os.unlink(self.socket_path)
+
+    async def serve(self) -> None:
+        """Load the models, then serve requests until cancelled."""
+        print("[Marker Server] Loading Marker models...")
+        await asyncio.to_thread(get_marker_converter)
+        await asyncio.to_thread(get_marker_converter, True)
+
+        await self._remove_stale_socket()
+        server = await asyncio.start_unix_server(
+            self._handle_connection, path=self.socket_path, limit=MarkerServerConfig.STREAM_LIMIT_BYTES
+        )
+        print(f"[Marker Server] Listening on {self.socket_path}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+
+class MarkerServerClient:
+    """Client for a running marker server."""
+
+    def __init__(self, socket_path: Optional[str] = None):
+        """
+        Initialize the client.
+
+        Args:
+            socket_path: Unix socket of the server. Defaults to MARKER_SERVER_SOCKET
+        """
+        self.socket_path = socket_path or MarkerServerConfig.SOCKET_PATH
+
+    async def _request(self, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(self.socket_path, limit=MarkerServerConfig.STREAM_LIMIT_BYTES),
+                MarkerServerConfig.CONNECT_TIMEOUT_SECONDS,
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            raise MarkerServerError(
+                f"Marker server is not reachable on {self.socket_path} ({e}). "
+                "Start it with: python -m apps.py.utils.marker_server"
+            ) from e
+
+        try:
+            writer.write(json_codec.dumpb(payload) + b"\n")
+            await writer.drain()
+            line = await asyncio.wait_for(reader.readline(), timeout)
+        finally:
+            writer.close()
+
+        if not line:
+            raise MarkerServerError("Marker server closed the connection without a response")
+        response = json_codec.loads(line)
+        if response.get("status") != "success":
+            raise MarkerServerError(f"Marker server error: {response.get('error', 'Unknown error')}")
+        return response
+
+    async def ping(self) -> bool:
+        """Whether a server is answering on the socket."""
+        try:
+            await self._request({"action": "ping"}, MarkerServerConfig.CONNECT_TIMEOUT_SECONDS)
+            return True
+        except (MarkerServerError, asyncio.TimeoutError):
+            return False
+
+    async def convert(
+        self, file_paths: List[Path | str], output: str = MarkerServerConfig.OUTPUT_MARKDOWN
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert a batch of PDFs on the server.
+
+        Args:
+            file_paths: PDFs to convert; paths are sent as absolute paths
+            output: "markdown" for the paginated markdown, "metadata" for Marker's debug metadata
+
+        Returns:
+            One result per file, in order, each with "path", "status" and either the output or "error"
+
+        Raises:
+            MarkerServerError: If the server is unreachable or rejects the request
+        """
+        payload = {
+            "action": "convert",
+            "paths": [str(Path(file_path).resolve()) for file_path in file_paths],
+            "output": output,
+        }
+        response = await self._request(payload, MarkerServerConfig.REQUEST_TIMEOUT_SECONDS)
+        return response["results"]
+
+
+def main() -> None:
+    """Entry point for the marker server."""
+    try:
+        asyncio.run(MarkerServer().serve())
+    except KeyboardInterrupt:
+        print("[Marker Server] Stopped")
+
+
+if __name__ == "__main__":
+    main()
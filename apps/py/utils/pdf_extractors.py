@@ -1,10 +1,51 @@
+import os
 from abc import ABC, abstractmethod
 from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
 
-from marker.converters.pdf import PdfConverter
-from marker.models import create_model_dict
+if TYPE_CHECKING:
+    from marker.converters.pdf import PdfConverter
+
+
+class PDFExtractorConfig:
+    """Configuration constants for PDF extractors."""
+
+    # Extractor used when none is given: "marker" loads models in-process,
+    # "marker_client" sends PDFs to a running marker server (python -m apps.py.utils.marker_server)
+    EXTRACTOR_TYPE = os.getenv("PDF_EXTRACTOR_TYPE", "marker")
+
+    MARKDOWN_CONFIG = {
+        "output_format": "markdown",
+        "paginate_output": True,
+    }
+    # Debug mode makes Marker report per-page block statistics in its metadata
+    METADATA_CONFIG = {"debug": True}
+
+
+@lru_cache()
+def get_marker_models() -> Dict[str, Any]:
+    """Load Marker's models once per process; they are shared by every converter."""
+    from marker.models import create_model_dict
+
+    return create_model_dict()
+
+
+@lru_cache()
+def get_marker_converter(metadata: bool = False) -> "PdfConverter":
+    """
+    Get a cached Marker converter.
+
+    Args:
+        metadata: Whether to get the debug converter used for metadata analysis
+
+    Returns:
+        PdfConverter sharing the process-wide models
+    """
+    from marker.converters.pdf import PdfConverter
+
+    config = PDFExtractorConfig.METADATA_CONFIG if metadata else PDFExtractorConfig.MARKDOWN_CONFIG
+    return PdfConverter(artifact_dict=get_marker_models(), config=dict(config))
 
 
 class PDFExtractor(ABC):
@@ -15,24 +56,21 @@ class PDFExtractor(ABC):
         """Extract text from a PDF file."""
         pass
 
+    async def extract_texts(self, file_paths: List[Path | str]) -> List[str]:
+        """Extract text from several PDF files, in order."""
+        return [await self.extract_text(file_path) for file_path in file_paths]
+
+    @abstractmethod
+    async def extract_metadata(self, file_path: Path | str) -> Dict[str, Any]:
+        """Extract layout metadata (page and block statistics) from a PDF file."""
+        pass
+
 
 class MarkerExtractor(PDFExtractor):
     """PDF extractor using the Marker library."""
 
     def __init__(self):
-        self.converter = self._get_cached_converter()
-
-    @staticmethod
-    @lru_cache()
-    def _get_cached_converter() -> PdfConverter:
-        """Get a cached PDF converter instance."""
-        return PdfConverter(
-            artifact_dict=create_model_dict(),
-            config={
-                "output_format": "markdown",
-                "paginate_output": True,
-            },
-        )
+        self.converter = get_marker_converter()
 
     async def extract_text(self, file_path: Path | str) -> str:
         """Extract text from a PDF file using Marker."""
@@ -42,9 +80,56 @@ class MarkerExtractor(PDFExtractor):
         except Exception as e:
             raise Exception(f"Error extracting text from PDF using Marker: {str(e)}") from e
 
+    async def extract_metadata(self, file_path: Path | str) -> Dict[str, Any]:
+        """Extract layout metadata from a PDF file using Marker's debug converter."""
+        try:
+            rendered = get_marker_converter(metadata=True)(str(file_path))
+            return rendered.metadata
+        except Exception as e:
+            raise Exception(f"Error extracting metadata from PDF using Marker: {str(e)}") from e
+
+
+class MarkerClientExtractor(PDFExtractor):
+    """PDF extractor that sends PDFs to a running marker server, which keeps the models loaded."""
+
+    def __init__(self, socket_path: Optional[str] = None):
+        from .marker_server import MarkerServerClient
+
+        self.client = MarkerServerClient(socket_path)
+
+    async def extract_text(self, file_path: Path | str) -> str:
+        """Extract text from a PDF file using the marker server."""
+        return (await self.extract_texts([file_path]))[0]
+
+    async def extract_texts(self, file_paths: List[Path | str]) -> List[str]:
+        """Extract text from several PDF files with one request to the marker server."""
+        results = await self.client.convert(file_paths)
+        return [self._unwrap(result, "markdown") for result in results]
+
+    async def extract_metadata(self, file_path: Path | str) -> Dict[str, Any]:
+        """Extract layout metadata from a PDF file using the marker server."""
+        results = await self.client.convert([file_path], output="metadata")
+        return self._unwrap(results[0], "metadata")
+
+    @staticmethod
+    def _unwrap(result: Dict[str, Any], field: str) -> Any:
+        if result.get("status") != "success":
+            raise Exception(
+                f"Error extracting from PDF using marker server ({result.get('path')}): {result.get('error')}"
+            )
+        return result[field]
+
+
+def get_pdf_extractor(extractor_type: Optional[Literal["marker", "marker_client"]] = None) -> PDFExtractor:
+    """
+    Get a PDF extractor instance based on the specified type.
 
-def get_pdf_extractor(extractor_type: Literal["marker"] = "marker") -> PDFExtractor:
-    """Get a PDF extractor instance based on the specified type."""
-    if extractor_type != "marker":
-        raise ValueError(f"Unsupported extractor type '{extractor_type}'. Use 'marker'.")
-    return MarkerExtractor()
+    Args:
+        extractor_type: "marker" or "marker_client". Defaults to PDF_EXTRACTOR_TYPE, else "marker"
+    """
+    extractor_type = extractor_type or PDFExtractorConfig.EXTRACTOR_TYPE
+    if extractor_type == "marker":
+        return MarkerExtractor()
+    if extractor_type == "marker_client":
+        return MarkerClientExtractor()
+    raise ValueError(f"Unsupported extractor type '{extractor_type}'. Use 'marker' or 'marker_client'.")
@@ -1,11 +1,17 @@
-import json
+import fcntl
+import functools
+import hashlib
 import logging
+import os
+import threading
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar, Union
 
 from ..types import BaseProgressFileStructure
 from ..types.models import GenericStateData
+from . import json_codec
 from .file_utils import safe_mkdir_with_conflict_detection
 from .timestamps import get_current_timestamp, get_current_timestamp_iso
 
@@ -18,6 +24,164 @@ StateEnum = TypeVar("StateEnum", bound=Enum)
 # Import the generic state data from types
 
 
+class StateManagerConfig:
+    """Configuration constants for progress state managers."""
+
+    # Parsed progress files kept in memory, shared by every manager in the process. 0 disables caching
+    READ_CACHE_SIZE = int(os.getenv("PROGRESS_READ_CACHE_SIZE", "256"))
+
+    # Sidecar file locked around read-modify-write sequences, next to each progress file
+    LOCK_SUFFIX = ".lock"
+
+    # "json" rewrites the whole progress file on every change. "journal" appends each transition and
+    # patch to a sidecar log and folds it into the progress file once the log outgrows it
+    STORAGE = os.getenv("PROGRESS_STORAGE", "json")
+    JOURNAL_SUFFIX = ".journal"
+    # A journal is compacted once it is larger than both this and the progress file it applies to
+    JOURNAL_COMPACT_MIN_BYTES = int(os.getenv("PROGRESS_JOURNAL_COMPACT_MIN_BYTES", str(64 * 1024)))
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy JSON-shaped data (dicts, lists and scalars); several times faster than copy.deepcopy."""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+class ProgressReadCache:
+    """
+    LRU cache of parsed progress files.
+
+    An entry is served only while the file's mtime, size and inode are unchanged, so writes by
+    other processes are picked up; a manager's own writes replace its entry directly. Cached data
+    is shared and must not be mutated; callers that modify it work on a copy.
+    """
+
+    def __init__(self, max_entries: int = StateManagerConfig.READ_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of parsed files kept in memory
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Tuple, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def signature(file_path: Path) -> Tuple[int, int, int]:
+        """Identity of a file's current contents: (mtime_ns, size, inode)."""
+        stat = file_path.stat()
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def get(self, file_path: Path, signature: Tuple) -> Optional[Dict[str, Any]]:
+        """Cached data for the file if it was read or written with the given signature."""
+        key = str(file_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != signature:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, file_path: Path, signature: Tuple, data: Dict[str, Any]) -> None:
+        """Store parsed data for the file as of the given signature."""
+        if self.max_entries <= 0:
+            return
+        key = str(file_path)
+        with self._lock:
+            self._entries[key] = (signature, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached files."""
+        with self._lock:
+            self._entries.clear()
+
+
+_progress_read_cache = ProgressReadCache()
+# SHA-256 of progress files, by file signature, so journal appends don't re-read the progress file
+_snapshot_hash_cache = ProgressReadCache()
+
+
+class ProgressFileLock:
+    """
+    Reentrant advisory lock on a progress file, held across threads and processes.
+
+    The flock is taken on a sidecar file because the progress file itself is replaced on every
+    write. Threads in one process take turns through an RLock, and the flock stays held while any
+    of them is inside, so a locked section can call other locked methods without deadlocking.
+    """
+
+    _locks: Dict[str, "ProgressFileLock"] = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, progress_file: Path):
+        """
+        Initialize the lock. Use for_file to share one lock per progress file within the process.
+
+        Args:
+            progress_file: Progress file guarded by the lock
+        """
+        self.lock_file = progress_file.with_name(progress_file.name + StateManagerConfig.LOCK_SUFFIX)
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._handle = None
+
+    @classmethod
+    def for_file(cls, progress_file: Path) -> "ProgressFileLock":
+        """Get the process-wide lock for a progress file."""
+        key = str(Path(progress_file).resolve())
+        with cls._locks_guard:
+            lock = cls._locks.get(key)
+            if lock is None:
+                lock = cls._locks[key] = cls(Path(key))
+            return lock
+
+    def __enter__(self) -> "ProgressFileLock":
+        self._thread_lock.acquire()
+        try:
+            if self._depth == 0:
+                safe_mkdir_with_conflict_detection(self.lock_file.parent)
+                handle = open(self.lock_file, "a")
+                try:
+                    fcntl.flock(handle, fcntl.LOCK_EX)
+                except BaseException:
+                    handle.close()
+                    raise
+                self._handle = handle
+            self._depth += 1
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        try:
+            self._depth -= 1
+            if self._depth == 0:
+                fcntl.flock(self._handle, fcntl.LOCK_UN)
+                self._handle.close()
+                self._handle = None
+        finally:
+            self._thread_lock.release()
+
+
+def _holding_file_lock(method):
+    """Run a ProgressStateManager method with its progress file locked, making the read-modify-write atomic."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.locked():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class ProgressStateManager(Generic[StateEnum]):
     """
     Generic state machine manager that persists state to JSON files.
@@ -50,6 +214,7 @@ class ProgressStateManager(Generic[StateEnum]):
         file_path: Union[str, Path],
         initial_state: StateEnum,
         initial_state_data: Optional[GenericStateData] = None,
+        storage: Optional[str] = None,
     ):
         """
         Initialize the state manager.
@@ -58,39 +223,74 @@ class ProgressStateManager(Generic[StateEnum]):
             file_path: Path to the progress file
             initial_state: Initial state for the domain
             initial_state_data: Optional initial state data. If not provided, creates minimal entry.
+            storage: "json" or "journal", defaults to PROGRESS_STORAGE. Either way the progress file keeps
+                the same JSON layout; with "journal" it is brought up to date at each compaction
 
         Raises:
-            ValueError: If file_path is not provided
+            ValueError: If file_path is not provided or storage is unknown
             IOError: If progress file cannot be created
         """
         self.progress_file = Path(file_path)
+        self.journal_file = self.progress_file.with_name(self.progress_file.name + StateManagerConfig.JOURNAL_SUFFIX)
         self.initial_state = initial_state
         self.initial_state_data = initial_state_data
+        self.storage = storage or StateManagerConfig.STORAGE
+        if self.storage not in ("json", "journal"):
+            raise ValueError(f"Unsupported progress storage '{self.storage}'. Use 'json' or 'journal'.")
 
         # Ensure progress file exists and has content, or create/initialize it
         if not self.progress_file.exists() or self.progress_file.stat().st_size == 0:
-            self._initialize_progress_file()
+            with self.locked():
+                # Another process may have initialized it while we waited for the lock
+                if not self.progress_file.exists() or self.progress_file.stat().st_size == 0:
+                    self._initialize_progress_file()
+
+    def locked(self) -> ProgressFileLock:
+        """
+        Lock the progress file across processes for a read-modify-write.
+
+        Transitions, rollbacks and updates take the lock themselves; hold it around a longer
+        sequence (check the state, then write) to make the whole sequence atomic. Reentrant.
 
-    def _json_serializer(self, obj):
-        """Custom JSON serializer that handles enums and other types"""
-        if isinstance(obj, Enum):
-            return obj.value  # Convert enum to its value
-        return str(obj)  # Fallback to string for other types
+        Returns:
+            Context manager holding the lock
+        """
+        return ProgressFileLock.for_file(self.progress_file)
 
-    def _validate_and_write_progress(self, progress_data: Dict[str, Any], operation_context: str) -> None:
+    def _write_change(self, progress: Dict[str, Any], record: Dict[str, Any], operation_context: str) -> None:
         """
-        Validate progress data and write to file.
+        Apply a change to progress data, validate the result and persist it.
+
+        The change is applied to a shallow copy, so progress may be shared read-cache data. With journal
+        storage only the entries the change adds or patches are validated (with the same model as the
+        whole file; unchanged entries were validated when they were written) and the change is appended
+        to the journal, so a write costs O(change) instead of O(file), apart from copying the list of
+        state entries.
 
         Args:
-            progress_data: Progress data dictionary to validate and write
+            progress: Current progress data, as returned by _read_progress; not modified
+            record: The change, in journal record format
             operation_context: Description of the operation for error logging
 
         Raises:
             ValueError: If validation fails
             IOError: If file cannot be written
         """
+        # Encode the change once; it is applied as it reads back, with enums and timestamps as strings
+        line = json_codec.dumps(record) + "\n"
+        record = json_codec.loads(line)
+        updated = {**progress, "states": list(progress["states"])}
+
+        journal = self.storage == "journal"
         try:
-            validated_progress = BaseProgressFileStructure(**progress_data)
+            self._apply_journal_record(updated, record)
+            states = self._changed_entries(updated, record) if journal else updated["states"]
+            BaseProgressFileStructure(
+                current_state=updated["current_state"],
+                states=states,
+                created_at=updated["created_at"],
+                updated_at=updated["updated_at"],
+            )
         except Exception as e:
             logger.error(
                 f"{operation_context} failed validation",
@@ -98,7 +298,10 @@ class ProgressStateManager(Generic[StateEnum]):
             )
             raise ValueError(f"{operation_context} failed validation: {e}") from e
 
-        self._write_validated_progress(validated_progress.model_dump())
+        if journal:
+            self._append_journal_record(updated, line)
+        else:
+            self._write_validated_progress(updated)
 
     def _initialize_progress_file(self) -> None:
         """
@@ -136,8 +339,9 @@ class ProgressStateManager(Generic[StateEnum]):
         }
 
         try:
-            with open(self.progress_file, "w", encoding="utf-8") as f:
-                json.dump(initial_progress, f, indent=2, default=self._json_serializer)
+            self._write_atomically(json_codec.dumps(initial_progress, pretty=True))
+            # A journal without a progress file belongs to nothing
+            self.journal_file.unlink(missing_ok=True)
             logger.debug("Progress file initialized successfully", extra={"progress_file": str(self.progress_file)})
         except Exception as e:
             logger.error(
@@ -145,28 +349,78 @@ class ProgressStateManager(Generic[StateEnum]):
             )
             raise IOError(f"Failed to initialize progress file: {e}") from e
 
-    def read_progress_file(self) -> Dict[str, Any]:
+    def read_progress_file(self, copy: bool = True) -> Dict[str, Any]:
         """
         Read and parse a progress file as raw data.
         Only validates core infrastructure fields, not domain-specific content.
 
+        Args:
+            copy: Return a private copy. Read-only callers can pass False to share the cached data
+
+        Returns:
+            Dict containing progress data; a private copy the caller may modify unless copy is False
+
+        Raises:
+            FileNotFoundError: If progress file doesn't exist
+            ValueError: If progress file has invalid JSON or structure
+        """
+        progress = self._read_progress()
+        return _copy_json(progress) if copy else progress
+
+    def _read_progress(self) -> Dict[str, Any]:
+        """
+        Progress data from the read cache, parsing the file only if it changed since it was cached.
+
         Returns:
-            Dict containing progress data
+            Shared progress data; callers must not modify it
 
         Raises:
             FileNotFoundError: If progress file doesn't exist
             ValueError: If progress file has invalid JSON or structure
         """
         try:
-            with open(self.progress_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            signature = self._storage_signature()
+        except FileNotFoundError:
+            logger.error(
+                "Progress file not found",
+                extra={"progress_file": str(self.progress_file)},
+            )
+            raise FileNotFoundError(f"Progress file not found: {self.progress_file}") from None
+
+        data = _progress_read_cache.get(self.progress_file, signature)
+        if data is None:
+            # Stat before reading: if the file changes in between, the next read sees a new signature
+            data = self._load_progress_file(signature[0])
+            _progress_read_cache.put(self.progress_file, signature, data)
+        return data
+
+    def _storage_signature(self) -> Tuple:
+        """Signatures of the progress file and of its journal (None if there is none)."""
+        progress_signature = ProgressReadCache.signature(self.progress_file)
+        try:
+            journal_signature = ProgressReadCache.signature(self.journal_file)
+        except FileNotFoundError:
+            journal_signature = None
+        return progress_signature, journal_signature
+
+    def _load_progress_file(self, progress_signature: Tuple[int, int, int]) -> Dict[str, Any]:
+        """
+        Read and parse the progress file from disk, apply its journal, and add missing core infrastructure fields.
+
+        Args:
+            progress_signature: Signature of the progress file taken before reading it
+        """
+        try:
+            with open(self.progress_file, "rb") as f:
+                content = f.read()
+            data = json_codec.loads(content)
         except FileNotFoundError:
             logger.error(
                 "Progress file not found",
                 extra={"progress_file": str(self.progress_file)},
             )
             raise FileNotFoundError(f"Progress file not found: {self.progress_file}") from None
-        except json.JSONDecodeError as e:
+        except json_codec.JSONDecodeError as e:
             logger.error(
                 "Progress file contains invalid JSON",
                 extra={"progress_file": str(self.progress_file), "error": str(e)},
@@ -178,6 +432,10 @@ class ProgressStateManager(Generic[StateEnum]):
             )
             raise ValueError(f"Failed to read progress file: {e}") from e
 
+        snapshot_hash = hashlib.sha256(content).hexdigest()
+        _snapshot_hash_cache.put(self.progress_file, progress_signature, {"sha256": snapshot_hash})
+        self._replay_journal(data, snapshot_hash)
+
         # Only handle core infrastructure fields
         now = get_current_timestamp()
         fields_added = []
@@ -212,11 +470,183 @@ class ProgressStateManager(Generic[StateEnum]):
             IOError: If file cannot be written
         """
         try:
-            with open(self.progress_file, "w", encoding="utf-8") as f:
-                json.dump(progress_data, f, indent=2, default=self._json_serializer)
+            content = json_codec.dumps(progress_data, pretty=True)
+            self._write_atomically(content)
+            # The file now holds everything the journal did. If this is interrupted, the journal's
+            # base no longer matches the file and it is ignored
+            self.journal_file.unlink(missing_ok=True)
         except Exception as e:
             raise IOError(f"Failed to write progress file: {e}") from e
 
+        # Cache what was written as it reads back, with enums and timestamps as strings
+        progress_signature = ProgressReadCache.signature(self.progress_file)
+        _snapshot_hash_cache.put(
+            self.progress_file, progress_signature, {"sha256": hashlib.sha256(content.encode("utf-8")).hexdigest()}
+        )
+        _progress_read_cache.put(self.progress_file, (progress_signature, None), json_codec.loads(content))
+
+    # ===============================
+    # JOURNAL STORAGE
+    # ===============================
+    #
+    # The journal is a JSON-lines file next to the progress file. Its first line names the progress
+    # file contents it applies to, {"base": <sha256>}; every other line is one change:
+    #   {"op": "append", "entries": [...], "header": {...}}  - state entries added by a transition/rollback
+    #   {"op": "patch", "index": i, "data": {...}, "entry": {...}, "header": {...}}  - update_state_data
+    # where "header" holds the top-level fields the change sets (current_state, updated_at).
+
+    def _snapshot_hash(self) -> str:
+        """SHA-256 of the progress file, reading it only if it changed since it was last hashed."""
+        progress_signature = ProgressReadCache.signature(self.progress_file)
+        cached = _snapshot_hash_cache.get(self.progress_file, progress_signature)
+        if cached is not None:
+            return cached["sha256"]
+        with open(self.progress_file, "rb") as f:
+            snapshot_hash = hashlib.sha256(f.read()).hexdigest()
+        _snapshot_hash_cache.put(self.progress_file, progress_signature, {"sha256": snapshot_hash})
+        return snapshot_hash
+
+    def _journal_base(self) -> Optional[str]:
+        """Hash of the progress file the journal applies to, or None if there is no readable journal."""
+        try:
+            with open(self.journal_file, "r", encoding="utf-8") as f:
+                return json_codec.loads(f.readline()).get("base")
+        except (FileNotFoundError, json_codec.JSONDecodeError, AttributeError):
+            return None
+
+    def _replay_journal(self, progress: Dict[str, Any], snapshot_hash: str) -> None:
+        """Apply the journal's changes to progress data read from the progress file, in place."""
+        try:
+            with open(self.journal_file, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+
+        try:
+            base = json_codec.loads(lines[0]).get("base") if lines else None
+        except (json_codec.JSONDecodeError, AttributeError):
+            base = None
+        if base != snapshot_hash:
+            # Left behind by a write that already folded it into the progress file
+            logger.warning("Ignoring stale progress journal", extra={"journal_file": str(self.journal_file)})
+            return
+
+        for line_number, line in enumerate(lines[1:], start=2):
+            # A partially written last line is a change that never completed
+            if not line.endswith("\n"):
+                break
+            try:
+                self._apply_journal_record(progress, json_codec.loads(line))
+            except (json_codec.JSONDecodeError, KeyError, IndexError, TypeError, ValueError) as e:
+                logger.error(
+                    "Progress journal has an unreadable record, ignoring it and the rest",
+                    extra={"journal_file": str(self.journal_file), "line": line_number, "error": str(e)},
+                )
+                break
+
+    def _apply_journal_record(self, progress: Dict[str, Any], record: Dict[str, Any]) -> None:
+        """
+        Apply one journal record to progress data, in place.
+
+        Only progress itself and its states list are modified: a patched entry is replaced by an
+        updated copy, so entries shared with the read cache stay untouched.
+        """
+        op = record["op"]
+        if op == "append":
+            progress["states"].extend(record["entries"])
+        elif op == "patch":
+            index = record["index"]
+            entry = progress["states"][index]
+            progress["states"][index] = {
+                **entry,
+                "data": self._deep_merge_dicts(entry.get("data", {}), record["data"]),
+                **record.get("entry", {}),
+            }
+        else:
+            raise ValueError(f"Unknown journal operation '{op}'")
+        progress.update(record.get("header", {}))
+
+    @staticmethod
+    def _changed_entries(progress: Dict[str, Any], record: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """State entries a journal record added or patched, as they are in progress after applying it."""
+        if record["op"] == "patch":
+            return [progress["states"][record["index"]]]
+        return record["entries"]
+
+    def _append_journal_record(self, progress_data: Dict[str, Any], line: str) -> None:
+        """
+        Persist a change by appending it to the journal, compacting the journal once it has grown.
+
+        Args:
+            progress_data: Full progress data after the change, as it reads back; used for compaction and
+                kept in the read cache as is
+            line: The change, an encoded journal record ending in a newline
+
+        Raises:
+            IOError: If the journal cannot be written
+        """
+        try:
+            snapshot_hash = self._snapshot_hash()
+            if self._journal_base() == snapshot_hash:
+                with open(self.journal_file, "a", encoding="utf-8") as f:
+                    f.write(line)
+                    f.flush()
+                    os.fsync(f.fileno())
+            else:
+                # No journal yet, or a stale one: start a new journal on the current progress file
+                self._write_atomically(json_codec.dumps({"base": snapshot_hash}) + "\n" + line, self.journal_file)
+        except Exception as e:
+            raise IOError(f"Failed to append to progress journal: {e}") from e
+
+        signature = self._storage_signature()
+        journal_size = signature[1][1]
+        if journal_size > max(StateManagerConfig.JOURNAL_COMPACT_MIN_BYTES, signature[0][1]):
+            logger.info("Compacting progress journal", extra={"progress_file": str(self.progress_file)})
+            self._write_validated_progress(progress_data)
+            return
+
+        _progress_read_cache.put(self.progress_file, signature, progress_data)
+
+    @_holding_file_lock
+    def compact(self) -> None:
+        """
+        Fold the journal into the progress file, leaving the complete JSON layout on disk.
+
+        Use before exporting or copying progress files kept with journal storage.
+        """
+        if self.journal_file.exists():
+            self._write_validated_progress(self._read_progress())
+
+    def _write_atomically(self, content: str, target_file: Optional[Path] = None) -> None:
+        """
+        Replace the progress file with content so readers never see a partial file.
+
+        The content is written to a temp file in the same directory, synced to disk, then renamed
+        over the progress file; a crash leaves either the old or the new file, never a truncated one.
+
+        Args:
+            content: Serialized progress data
+            target_file: File to replace, defaults to the progress file
+        """
+        target_file = target_file or self.progress_file
+        temp_file = target_file.with_name(f"{target_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, target_file)
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
+
+        # Persist the rename itself
+        dir_fd = os.open(target_file.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
     def get_current_state(self) -> str:
         """
         Get the current state as string.
@@ -227,7 +657,7 @@ class ProgressStateManager(Generic[StateEnum]):
         Raises:
             ValueError: If progress file is invalid
         """
-        progress = self.read_progress_file()
+        progress = self._read_progress()
         return progress["current_state"]
 
     def get_state_data(self, state: Union[StateEnum, str]) -> Optional[GenericStateData]:
@@ -247,7 +677,7 @@ class ProgressStateManager(Generic[StateEnum]):
         Raises:
             ValueError: If progress file is invalid or state entries are malformed
         """
-        progress = self.read_progress_file()
+        progress = self._read_progress()
         state_key = state.value if isinstance(state, Enum) else state
 
         # Search through states array from end (most recent first)
@@ -264,8 +694,9 @@ class ProgressStateManager(Generic[StateEnum]):
 
             if state_entry["state"] == state_key:
                 try:
-                    # Convert dict back to GenericStateData object with validation
-                    return GenericStateData(**state_entry)
+                    # Convert dict back to GenericStateData object with validation; copied so the
+                    # returned data doesn't alias the read cache
+                    return GenericStateData(**_copy_json(state_entry))
                 except Exception as e:
                     raise ValueError(
                         f"Invalid state data structure at index {len(progress['states']) - 1 - i}: {e}"
@@ -273,6 +704,7 @@ class ProgressStateManager(Generic[StateEnum]):
 
         return None
 
+    @_holding_file_lock
     def transition_to_state(
         self, new_state: Union[StateEnum, str], state_data: GenericStateData, validate_transition: bool = True
     ) -> None:
@@ -291,8 +723,8 @@ class ProgressStateManager(Generic[StateEnum]):
         Raises:
             ValueError: If the transition fails validation
         """
-        # Read current progress
-        progress = self.read_progress_file()
+        # Read current progress (shared read-cache data; the change is applied to a copy)
+        progress = self._read_progress()
         old_state = progress["current_state"]
 
         # Convert state to string if it's an enum
@@ -308,19 +740,20 @@ class ProgressStateManager(Generic[StateEnum]):
             },
         )
 
-        # Update the progress structure - append to array instead of dict assignment
-        progress["current_state"] = new_state_str
-        progress["states"].append(state_data.model_dump())
-        progress["updated_at"] = get_current_timestamp()
-
-        # Validate the entire structure before writing
-        self._validate_and_write_progress(progress, "State transition")
+        # Append to the states array instead of dict assignment
+        journal_record = {
+            "op": "append",
+            "entries": [state_data.model_dump()],
+            "header": {"current_state": new_state_str, "updated_at": get_current_timestamp()},
+        }
+        self._write_change(progress, journal_record, "State transition")
 
         logger.info(
             "State transition completed successfully",
             extra={"progress_file": str(self.progress_file), "from_state": old_state, "to_state": new_state_str},
         )
 
+    @_holding_file_lock
     def rollback_to_state(self, target_state: Union[StateEnum, str], state_order: List[Union[StateEnum, str]]) -> None:
         """
         Rollback to a previous state by removing all subsequent states.
@@ -350,8 +783,8 @@ class ProgressStateManager(Generic[StateEnum]):
             )
             raise ValueError(f"Invalid target state: {target_state_str}") from None
 
-        # Read current progress
-        progress = self.read_progress_file()
+        # Read current progress (shared read-cache data; the change is applied to a copy)
+        progress = self._read_progress()
         current_state = progress["current_state"]
         current_index = state_order_str.index(current_state)
 
@@ -371,13 +804,11 @@ class ProgressStateManager(Generic[StateEnum]):
             extra={"progress_file": str(self.progress_file), "from_state": current_state, "to_state": target_state_str},
         )
 
-        # Update current state
-        progress["current_state"] = target_state_str
-
         # Create rollback entries for all states after the target state (audit trail approach)
         # Instead of deleting, we add rollback entries to maintain complete history
         rollback_timestamp = get_current_timestamp()
         states_rolled_back = []
+        rollback_entries = []
 
         # Find states that come after the target state and create rollback entries
         for i in range(target_index + 1, len(state_order_str)):
@@ -404,18 +835,21 @@ class ProgressStateManager(Generic[StateEnum]):
                     },
                     errors=[],
                 )
-                progress["states"].append(rollback_entry.model_dump())
+                rollback_entries.append(rollback_entry.model_dump())
                 states_rolled_back.append(state_to_rollback)
 
-        progress["updated_at"] = get_current_timestamp()
-
         logger.debug(
             "Created rollback entries during rollback",
             extra={"progress_file": str(self.progress_file), "states_rolled_back": states_rolled_back},
         )
 
         # Validate and write
-        self._validate_and_write_progress(progress, "Rollback")
+        journal_record = {
+            "op": "append",
+            "entries": rollback_entries,
+            "header": {"current_state": target_state_str, "updated_at": get_current_timestamp()},
+        }
+        self._write_change(progress, journal_record, "Rollback")
 
         logger.info(
             "Rollback completed successfully",
@@ -427,7 +861,13 @@ class ProgressStateManager(Generic[StateEnum]):
             },
         )
 
-    def update_state_data(self, state: Union[StateEnum, str], partial_data: Dict[str, Any]) -> None:
+    @_holding_file_lock
+    def update_state_data(
+        self,
+        state: Union[StateEnum, str],
+        partial_data: Dict[str, Any],
+        entry_fields: Optional[Dict[str, Any]] = None,
+    ) -> None:
         """
         Update the latest state entry with partial data (upsert approach).
 
@@ -438,6 +878,7 @@ class ProgressStateManager(Generic[StateEnum]):
         Args:
             state: The state to update (Enum or string)
             partial_data: Partial data to merge into existing state data
+            entry_fields: Fields of the entry itself (outside data) to set, e.g. {"status": "SUCCESS"}
 
         Raises:
             ValueError: If no existing state entry is found or merge fails
@@ -445,8 +886,8 @@ class ProgressStateManager(Generic[StateEnum]):
         """
         state_key = state.value if isinstance(state, Enum) else state
 
-        # Read current progress
-        progress = self.read_progress_file()
+        # Read current progress (shared read-cache data; the change is applied to a copy)
+        progress = self._read_progress()
 
         # Find the latest entry for this state (search from end)
         target_entry_index = None
@@ -469,9 +910,6 @@ class ProgressStateManager(Generic[StateEnum]):
             )
             raise ValueError(f"No existing entry found for state {state_key}")
 
-        # Get the target entry
-        target_entry = progress["states"][target_entry_index]
-
         logger.info(
             "Updating state data",
             extra={
@@ -482,17 +920,15 @@ class ProgressStateManager(Generic[StateEnum]):
             },
         )
 
-        # Deep merge partial_data into existing data field
-        existing_data = target_entry.get("data", {})
-        updated_data = self._deep_merge_dicts(existing_data, partial_data)
-
-        # Update the entry
-        target_entry["data"] = updated_data
-        target_entry["timestamp"] = get_current_timestamp_iso()
-        progress["updated_at"] = get_current_timestamp()
-
-        # Validate and write
-        self._validate_and_write_progress(progress, "State update")
+        # Deep merge partial_data into the existing data field and refresh the entry's timestamp
+        journal_record = {
+            "op": "patch",
+            "index": target_entry_index,
+            "data": partial_data,
+            "entry": {**(entry_fields or {}), "timestamp": get_current_timestamp_iso()},
+            "header": {"updated_at": get_current_timestamp()},
+        }
+        self._write_change(progress, journal_record, "State update")
 
         logger.info(
             "State data updated successfully",
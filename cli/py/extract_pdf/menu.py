@@ -1,4 +1,3 @@
-import asyncio
 import sys
 import time
 from pathlib import Path
@@ -12,7 +11,7 @@ from InquirerPy.base.control import Choice
 sys.path.append(str(Path(__file__).parents[4]))
 
 # Import but don't call directly - we'll handle async separately
-from apps.py.documents.extractors.pdf_extraction import QuestionPDFExtractor
+from apps.py.documents.extractors.pdf_extraction import PDFExtractionConfig, QuestionPDFExtractor
 from apps.py.parliament_questions.document_processing import (
     calculate_table_statistics,
     find_all_document_paths,
@@ -22,6 +21,7 @@ from apps.py.parliament_questions.document_processing import (
     process_single_document_for_llm_extraction,
     save_ministry_extraction_results,
 )
+from apps.py.utils.pdf_extractors import PDFExtractorConfig
 from apps.py.utils.project_root import get_loksabha_data_root
 from cli.py.utils.table import print_table  # Import the table utility
 
@@ -128,7 +128,10 @@ class ExtractPDFWorkflow(BaseWorkflow):
     def __init__(self):
         """Initialize the workflow with empty state."""
         super().__init__()
-        self.extractor_type = "marker"
+        self.extractor_type = PDFExtractorConfig.EXTRACTOR_TYPE
+        self.max_workers = PDFExtractionConfig.MAX_WORKERS
+        self.force_extraction = PDFExtractionConfig.FORCE
+        self.discard_later_work = PDFExtractionConfig.DISCARD_LATER_WORK
         self.overall_results = {
             "total_ministries": 0,
             "total_processed": 0,
@@ -211,7 +214,9 @@ class ExtractPDFWorkflow(BaseWorkflow):
             return []
 
         # Filter to only include documents that need extraction
-        document_paths = find_documents_needing_extraction(ministry)
+        document_paths = find_documents_needing_extraction(
+            ministry, force=self.force_extraction, discard_later_work=self.discard_later_work
+        )
         
         # Report on filtering results
         already_extracted = len(all_document_paths) - len(document_paths)
@@ -274,15 +279,31 @@ class ExtractPDFWorkflow(BaseWorkflow):
             processed_documents = []
             failed_extractions = []
 
-            for i, doc_dir in enumerate(document_paths):
+            pdf_paths = []
+            for doc_dir in document_paths:
                 try:
-                    result = self.process_single_document(extractor, doc_dir, i, len(document_paths))
-                    if result:
-                        processed_documents.append(result)
+                    pdf_paths.append(self.find_document_pdf(doc_dir))
                 except Exception as e:
                     failed_extractions.append({"path": str(doc_dir), "error": str(e)})
                     print(f"  ✗ Extraction failed: {doc_dir.name} - {str(e)}")
 
+            # Documents are spread across worker processes and reported as each one finishes
+            batch = extractor.extract_contents_batch(
+                pdf_paths,
+                max_workers=self.max_workers,
+                force=self.force_extraction,
+                discard_later_work=self.discard_later_work,
+            )
+            for i, (pdf_path, result, error) in enumerate(batch):
+                print(f"Processed [{i + 1}/{len(pdf_paths)}]: {pdf_path.name}")
+                if error is not None:
+                    failed_extractions.append({"path": str(pdf_path.parent), "error": str(error)})
+                    print(f"  ✗ Extraction failed: {pdf_path.parent.name} - {str(error)}")
+                    continue
+
+                print(f"  ✓ Extraction successful: {pdf_path.name}")
+                processed_documents.append({"path": self._get_relative_path(pdf_path), "result": result})
+
             results = self.create_extraction_results(processed_documents, failed_extractions)
             self.display_extraction_results(ministry, results)
             # self.save_extraction_results(results, ministry)
@@ -293,35 +314,23 @@ class ExtractPDFWorkflow(BaseWorkflow):
             print(f"\nError during extraction process for {ministry.name}: {str(e)}")
             return None
 
-    def process_single_document(self, extractor, doc_dir, index, total_docs):
-        """Process a single document.
+    def find_document_pdf(self, doc_dir):
+        """Find the PDF to extract in a document directory.
 
         Args:
-            extractor: PDFExtractor instance
             doc_dir: Path to document directory
-            index: Current document index
-            total_docs: Total number of documents
 
         Returns:
-            dict: Document processing result, or None if failed
+            Path: The document's PDF file
+
+        Raises:
+            FileNotFoundError: If the directory has no PDF file
         """
-        # Find PDF file in the document directory
         pdf_files = list(doc_dir.glob("*.pdf"))
         if not pdf_files:
             raise FileNotFoundError(f"No PDF file found in directory: {doc_dir}")
 
-        pdf_path = pdf_files[0]  # Take the first PDF if multiple exist
-
-        # Show progress
-        print(f"Processing [{index + 1}/{total_docs}]: {pdf_path.name}")
-
-        # Extract contents using the extractor instance
-        result = asyncio.run(extractor.extract_contents(pdf_path))
-        print(f"  ✓ Extraction successful: {pdf_path.name}")
-
-        # Convert to relative path
-        relative_path = self._get_relative_path(pdf_path)
-        return {"path": relative_path, "result": result}
+        return pdf_files[0]  # Take the first PDF if multiple exist
 
     def create_extraction_results(self, processed_documents, failed_extractions):
         """Create the final extraction results dictionary.
@@ -0,0 +1,87 @@
+from datetime import date, datetime, timezone
+from enum import Enum
+from pathlib import Path
+
+import pytest
+
+from apps.py.utils import json_codec
+
+orjson = pytest.importorskip("orjson")
+
+
+class Color(Enum):
+    RED = "red"
+
+
+def encode_with(monkeypatch, use_orjson, obj, **options):
+    monkeypatch.setattr(json_codec, "_use_orjson", use_orjson)
+    return json_codec.dumpb(obj, **options), json_codec.dumps(obj, **options)
+
+
+SAMPLES = {
+    "datetimes": {
+        "aware": datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc),
+        "naive": datetime(2024, 1, 2, 3, 4, 5),
+        "date": date(2024, 1, 2),
+    },
+    "enum": {"color": Color.RED, "colors": [Color.RED]},
+    "non_ascii": {"प्रश्न": "लोकसभा", "mixed": "Q. 1 — उत्तर"},
+    "non_finite": {"nan": float("nan"), "inf": float("inf"), "values": [1.5, float("-inf")]},
+    "scalars": {"int": 1, "big": 10**20, "float": 1e20, "small": 0.1, "none": None, "bools": [True, False]},
+    "non_str_keys": {1: "one", 2.5: "two and a half"},
+    "path": {"path": Path("/data/q1.pdf")},
+    "nested": {"pages": {"1": {"tables": [{"rows": 3}], "text": ""}}, "empty": {}, "list": []},
+}
+
+
+@pytest.mark.parametrize("sample", SAMPLES.values(), ids=SAMPLES.keys())
+@pytest.mark.parametrize("pretty", [False, True])
+def test_backends_write_the_same_bytes(monkeypatch, sample, pretty):
+    assert encode_with(monkeypatch, True, sample, pretty=pretty) == encode_with(
+        monkeypatch, False, sample, pretty=pretty
+    )
+
+
+def test_backends_write_numpy_values_the_same(monkeypatch):
+    np = pytest.importorskip("numpy")
+    sample = {
+        "int": np.int64(5),
+        "float": np.float64(2.5),
+        "float32": np.float32(0.1),
+        "bool": np.bool_(True),
+        "nan": np.float64("nan"),
+        "matrix": np.array([[1, 2], [3, 4]]),
+        "floats": np.array([1.5, np.nan], dtype=np.float32),
+    }
+
+    for pretty in (False, True):
+        orjson_bytes, _ = encode_with(monkeypatch, True, sample, pretty=pretty)
+        stdlib_bytes, _ = encode_with(monkeypatch, False, sample, pretty=pretty)
+        assert orjson_bytes == stdlib_bytes
+
+    assert json_codec.loads(stdlib_bytes) == {
+        "int": 5,
+        "float": 2.5,
+        "float32": 0.1,
+        "bool": True,
+        "nan": None,
+        "matrix": [[1, 2], [3, 4]],
+        "floats": [1.5, None],
+    }
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_round_trip(monkeypatch, use_orjson):
+    monkeypatch.setattr(json_codec, "_use_orjson", use_orjson)
+    data = {"प्रश्न": [1, 2.5, None, True], "nested": {"a": "b"}}
+
+    assert json_codec.loads(json_codec.dumpb(data)) == data
+    assert json_codec.loads(json_codec.dumps(data, pretty=True)) == data
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_decode_errors_share_one_exception(monkeypatch, use_orjson):
+    monkeypatch.setattr(json_codec, "_use_orjson", use_orjson)
+
+    with pytest.raises(json_codec.JSONDecodeError):
+        json_codec.loads(b"{not json")
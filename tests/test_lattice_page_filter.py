@@ -0,0 +1,59 @@
+import pytest
+
+from apps.py.documents.extractors.lattice_page_filter import LatticePageFilter
+
+
+@pytest.fixture
+def page_filter():
+    return LatticePageFilter(min_rulings=2, min_ruling_length=10)
+
+
+def test_counts_line_segments(page_filter):
+    content = b"0 0 m 100 0 l S 0 20 m 100 20 l S 0 0 m 0 20 l S 50 0 m 50 20 l S 0 0 m 30 30 l S"
+    assert page_filter._count_rulings(content) == (2, 2)
+
+
+def test_ignores_short_segments(page_filter):
+    assert page_filter._count_rulings(b"0 0 m 5 0 l S 0 0 m 0 5 l S") == (0, 0)
+
+
+def test_rectangle_box_has_two_edges_each_way(page_filter):
+    assert page_filter._count_rulings(b"10 10 100 50 re S") == (2, 2)
+
+
+def test_thin_rectangle_is_one_ruling(page_filter):
+    assert page_filter._count_rulings(b"10 10 100 0.5 re f 10 10 0.5 80 re f") == (1, 1)
+
+
+def test_closepath_draws_the_closing_edge(page_filter):
+    assert page_filter._count_rulings(b"0 0 m 100 0 l 100 50 l 0 50 l h S") == (2, 2)
+
+
+def test_scaling_ctm_is_applied(page_filter):
+    # Unit-length segments drawn at 10x are 10-point rulings on the page
+    content = b"q 10 0 0 10 0 0 cm 0 0 m 5 0 l S 0 0 m 0 5 l S 0 0 5 5 re S Q"
+    assert page_filter._count_rulings(content) == (3, 3)
+
+
+def test_ctm_is_restored(page_filter):
+    content = b"q 10 0 0 10 0 0 cm Q 0 0 m 5 0 l S 0 0 5 5 re S"
+    assert page_filter._count_rulings(content) == (0, 0)
+
+
+def test_nested_ctms_compose(page_filter):
+    content = b"q 2 0 0 2 0 0 cm q 0 1 -1 0 300 0 cm 0 0 m 10 0 l S Q 0 0 m 10 0 l S Q"
+    assert page_filter._count_rulings(content) == (1, 1)
+
+
+def test_strings_and_hex_strings_are_not_operators(page_filter):
+    content = (
+        b"0 0 m 100 0 l S "
+        b"BT /F1 12 Tf (0 0 m (nested) \\) 5 5 l) Tj <6c 6c 63> Tj [(re) -20 <6c>] TJ ET "
+        b"% 0 0 m 0 100 l S\n"
+        b"0 0 m 0 100 l S"
+    )
+    assert page_filter._count_rulings(content) == (1, 1)
+
+
+def test_inline_image_keeps_page(page_filter):
+    assert page_filter._count_rulings(b"q BI /W 10 /H 10 ID \x00\x01 EI Q") is None
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from apps.py.documents.extractors import pdf_extraction
+from apps.py.documents.extractors.pdf_extraction import QuestionPDFExtractor
+from apps.py.documents.utils.progress_handler import DocumentProgressHandler
+from apps.py.types import ProcessingStatus
+
+INITIALIZED_DATA = dict(
+    question_number=1,
+    subjects="subject",
+    loksabha_number="18",
+    member=["member"],
+    ministry="ministry",
+    type="STARRED",
+    date="2024-01-01",
+    questions_file_path_local="local",
+    questions_file_path_web="web",
+    session_number="1",
+)
+
+
+class StubExtractor:
+    def __init__(self):
+        self.calls = 0
+        self.error = None
+
+    async def extract_text(self, pdf_path):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return "{0}------------------------------------------------\n\nQuestion text"
+
+
+@pytest.fixture
+def stub_extractor(monkeypatch):
+    extractor = StubExtractor()
+    monkeypatch.setattr(pdf_extraction, "get_pdf_extractor", lambda extractor_type=None: extractor)
+    monkeypatch.setattr(pdf_extraction.LatticePageFilter, "candidate_pages", lambda self, pdf_path: [])
+    return extractor
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "question.pdf"
+    path.write_bytes(b"%PDF-1.4\n%stub\n")
+    DocumentProgressHandler(tmp_path).transition_to_initialized(INITIALIZED_DATA)
+    return path
+
+
+def extract(pdf_path):
+    return asyncio.run(QuestionPDFExtractor("marker").extract_contents(pdf_path))
+
+
+def local_extraction_status(pdf_path):
+    return DocumentProgressHandler(pdf_path.parent).get_local_extraction_data().status
+
+
+def test_unchanged_extraction_is_skipped(stub_extractor, pdf_path):
+    extract(pdf_path)
+    extract(pdf_path)
+    assert stub_extractor.calls == 1
+
+
+def test_failed_text_extraction_is_retried(stub_extractor, pdf_path):
+    stub_extractor.error = ConnectionError("marker server is not running")
+    with pytest.raises(RuntimeError, match="marker server is not running"):
+        extract(pdf_path)
+    assert local_extraction_status(pdf_path) == ProcessingStatus.FAILED.value
+
+    stub_extractor.error = None
+    extract(pdf_path)
+    assert stub_extractor.calls == 2
+    assert local_extraction_status(pdf_path) == ProcessingStatus.SUCCESS.value
+
+
+def test_failed_table_detection_is_partial_and_retried(stub_extractor, pdf_path, monkeypatch):
+    def camelot_fails(pdf_path, pages):
+        raise RuntimeError("ghostscript missing")
+
+    monkeypatch.setattr(pdf_extraction.LatticePageFilter, "candidate_pages", lambda self, pdf_path: [1])
+    monkeypatch.setattr(pdf_extraction, "_read_lattice_tables_parallel", camelot_fails)
+    extract(pdf_path)
+    local_extraction_data = DocumentProgressHandler(pdf_path.parent).get_local_extraction_data()
+    assert local_extraction_data.status == ProcessingStatus.PARTIAL.value
+    assert "ghostscript missing" in local_extraction_data.data["error_message"]
+
+    monkeypatch.setattr(pdf_extraction, "_read_lattice_tables_parallel", lambda pdf_path, pages: [])
+    extract(pdf_path)
+    assert stub_extractor.calls == 2
+    assert local_extraction_status(pdf_path) == ProcessingStatus.SUCCESS.value
@@ -0,0 +1,133 @@
+from datetime import datetime, timezone
+from enum import Enum
+
+import pytest
+
+from apps.py.types.models import GenericStateData
+from apps.py.utils import state_manager
+from apps.py.utils.state_manager import ProgressStateManager, StateManagerConfig
+
+FIXED_TIME = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+class State(Enum):
+    START = "START"
+    MIDDLE = "MIDDLE"
+    END = "END"
+
+
+STATE_ORDER = [State.START, State.MIDDLE, State.END]
+
+
+@pytest.fixture(autouse=True)
+def fixed_clock(monkeypatch):
+    monkeypatch.setattr(state_manager, "get_current_timestamp", lambda: FIXED_TIME)
+    monkeypatch.setattr(state_manager, "get_current_timestamp_iso", lambda: FIXED_TIME.isoformat())
+    state_manager._progress_read_cache.clear()
+    state_manager._snapshot_hash_cache.clear()
+
+
+def make_manager(path, storage):
+    return ProgressStateManager(path, State.START, storage=storage)
+
+
+def entry(state, **data):
+    return GenericStateData(state=state.value, status="SUCCESS", timestamp=FIXED_TIME, data=data)
+
+
+def apply_changes(manager):
+    manager.transition_to_state(State.MIDDLE, entry(State.MIDDLE, pages={"1": {"text": "प्रश्न"}}))
+    manager.update_state_data(State.MIDDLE, {"pages": {"2": {"text": "two"}}}, entry_fields={"status": "PARTIAL"})
+    manager.transition_to_state(State.END, entry(State.END, done=True))
+    manager.rollback_to_state(State.MIDDLE, STATE_ORDER)
+
+
+def read_from_disk(manager):
+    state_manager._progress_read_cache.clear()
+    return make_manager(manager.progress_file, manager.storage).read_progress_file()
+
+
+def test_journal_is_appended_and_replayed(tmp_path):
+    manager = make_manager(tmp_path / "progress.json", "journal")
+    snapshot = manager.progress_file.read_bytes()
+
+    apply_changes(manager)
+
+    assert manager.progress_file.read_bytes() == snapshot
+    assert len(manager.journal_file.read_text().splitlines()) == 5  # base line and four changes
+    progress = read_from_disk(manager)
+    assert progress == manager.read_progress_file()
+    assert progress["current_state"] == "MIDDLE"
+    middle = [s for s in progress["states"] if s["state"] == "MIDDLE"][0]
+    assert middle["status"] == "PARTIAL"
+    assert middle["data"]["pages"] == {"1": {"text": "प्रश्न"}, "2": {"text": "two"}}
+
+
+def test_stale_journal_is_ignored(tmp_path):
+    manager = make_manager(tmp_path / "progress.json", "journal")
+    manager.transition_to_state(State.MIDDLE, entry(State.MIDDLE))
+
+    # The progress file changed after the journal was started, e.g. rewritten by another tool
+    manager.progress_file.write_bytes(manager.progress_file.read_bytes() + b"\n")
+
+    progress = read_from_disk(manager)
+    assert progress["current_state"] == "START"
+    assert [s["state"] for s in progress["states"]] == ["START"]
+
+
+def test_torn_last_record_is_ignored(tmp_path):
+    manager = make_manager(tmp_path / "progress.json", "journal")
+    manager.transition_to_state(State.MIDDLE, entry(State.MIDDLE))
+    with open(manager.journal_file, "a", encoding="utf-8") as f:
+        f.write('{"op": "append", "entries": [')
+
+    assert read_from_disk(manager)["current_state"] == "MIDDLE"
+
+
+def test_compaction_folds_journal_into_progress_file(tmp_path):
+    manager = make_manager(tmp_path / "progress.json", "journal")
+    manager.transition_to_state(State.MIDDLE, entry(State.MIDDLE))
+    expected = manager.read_progress_file()
+
+    manager.compact()
+
+    assert not manager.journal_file.exists()
+    assert read_from_disk(manager) == expected
+
+
+def test_journal_is_compacted_once_it_outgrows_the_progress_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(StateManagerConfig, "JOURNAL_COMPACT_MIN_BYTES", 0)
+    manager = make_manager(tmp_path / "progress.json", "journal")
+
+    compactions = 0
+    for page in range(20):
+        manager.transition_to_state(State.MIDDLE, entry(State.MIDDLE, page=page, text="x" * 100))
+        if not manager.journal_file.exists():
+            compactions += 1
+
+    assert compactions > 0
+    assert len(read_from_disk(manager)["states"]) == 21
+
+
+def test_json_and_journal_storage_read_back_identically(tmp_path):
+    json_manager = make_manager(tmp_path / "json" / "progress.json", "json")
+    journal_manager = make_manager(tmp_path / "journal" / "progress.json", "journal")
+
+    apply_changes(json_manager)
+    apply_changes(journal_manager)
+
+    assert json_manager.read_progress_file() == journal_manager.read_progress_file()
+    assert read_from_disk(json_manager) == read_from_disk(journal_manager)
+
+
+@pytest.mark.parametrize("storage", ["json", "journal"])
+def test_writes_do_not_modify_data_already_read(tmp_path, storage):
+    manager = make_manager(tmp_path / "progress.json", storage)
+    manager.transition_to_state(State.MIDDLE, entry(State.MIDDLE, pages={"1": "one"}))
+    shared = manager.read_progress_file(copy=False)
+    before = manager.read_progress_file()
+
+    manager.update_state_data(State.MIDDLE, {"pages": {"2": "two"}})
+
+    assert shared == before
+    assert manager.read_progress_file()["states"][-1]["data"]["pages"] == {"1": "one", "2": "two"}